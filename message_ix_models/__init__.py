@@ -1,19 +1,29 @@
 import sys
 from importlib.metadata import PackageNotFoundError, version
-
-import pint
-from iam_units import registry
+from typing import TYPE_CHECKING
 
 from message_ix_models.util._logging import setup as setup_logging
-from message_ix_models.util.config import Config
-from message_ix_models.util.context import Context
-from message_ix_models.util.importlib import MessageDataFinder
-from message_ix_models.util.scenarioinfo import ScenarioInfo, Spec
-from message_ix_models.workflow import Workflow
+from message_ix_models.util.importlib import MessageDataFinder, on_import
+
+if TYPE_CHECKING:
+    from message_ix_models.util.config import Config
+    from message_ix_models.util.context import Context
+    from message_ix_models.util.scenarioinfo import ScenarioInfo, Spec
+    from message_ix_models.workflow import Workflow
 
 # Expose utility classes
 __all__ = ["Config", "Context", "ScenarioInfo", "Spec", "Workflow"]
 
+#: Modules from which the names in :data:`__all__` are imported on first access. This
+#: avoids importing :mod:`ixmp`, :mod:`message_ix`, :mod:`pandas`, etc. until needed.
+_LAZY = {
+    "Config": "message_ix_models.util.config",
+    "Context": "message_ix_models.util.context",
+    "ScenarioInfo": "message_ix_models.util.scenarioinfo",
+    "Spec": "message_ix_models.util.scenarioinfo",
+    "Workflow": "message_ix_models.workflow",
+}
+
 try:
     __version__ = version(__name__)
 except PackageNotFoundError:  # pragma: no cover
@@ -23,11 +33,32 @@ except PackageNotFoundError:  # pragma: no cover
 # By default, no logging to console/stdout or to file
 setup_logging(console=False, file=False)
 
-# Use iam_units.registry as the default pint.UnitsRegistry
-pint.set_application_registry(registry)
 
-# Ensure at least one Context instance is created
-Context()
+def _set_application_registry(pint) -> None:
+    from iam_units import registry
+
+    pint.set_application_registry(registry)
+
+
+# Use iam_units.registry as the default pint.UnitsRegistry, once pint is imported
+on_import("pint", _set_application_registry)
 
 # Use this finder only if others fail
 sys.meta_path.append(MessageDataFinder())
+
+
+def __getattr__(name: str):
+    from importlib import import_module
+
+    try:
+        module = import_module(_LAZY[name])
+    except KeyError:
+        # Submodules, e.g. message_ix_models.model, not yet imported
+        try:
+            return import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    return getattr(module, name)
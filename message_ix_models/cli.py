@@ -18,22 +18,174 @@ https://docs.messageix.org/projects/models/en/latest/cli.html
 
 import logging
 import sys
+from collections.abc import Mapping
+from importlib import import_module, util
 from pathlib import Path
+from typing import Optional
 
 import click
-from ixmp.cli import main as ixmp_cli
 
 from message_ix_models.util._logging import flush, mark_time
 from message_ix_models.util._logging import setup as setup_logging
-from message_ix_models.util.click import common_params
-from message_ix_models.util.context import Context
 
 log = logging.getLogger(__name__)
 
+#: Commands and groups that are loaded on first use. Each key is a command name. Each
+#: value is a tuple of:
+#:
+#: 1. The name of a module.
+#: 2. The name of a :class:`click.Command` in that module; usually "cli".
+#: 3. Short help text displayed by :program:`mix-models --help`. This **must** match
+#:    the first sentence of the command's own help text.
+#:
+#: Importing some of these modules takes several seconds, so they are only imported
+#: when the respective command is invoked.
+COMMANDS: dict[str, tuple[str, str, str]] = {
+    "cache": ("message_ix_models.util.cache", "cli", "Inspect and prune cached data."),
+    "circeular": (
+        "message_ix_models.project.circeular.cli",
+        "cli",
+        "CircEUlar project.",
+    ),
+    "config": ("ixmp.cli", "config_group", "Get and set configuration keys."),
+    "edits": ("message_ix_models.project.edits.cli", "cli", "EDITS project."),
+    "fetch": (
+        "message_ix_models.util.pooch",
+        "cli",
+        "Retrieve data from primary sources.",
+    ),
+    "material-ix": (
+        "message_ix_models.model.material.cli",
+        "cli",
+        "MESSAGEix-Materials variant.",
+    ),
+    "report": ("message_ix_models.report.cli", "cli", "Postprocess results."),
+    "res": (
+        "message_ix_models.model.cli",
+        "cli",
+        "MESSAGEix-GLOBIOM reference energy system (RES).",
+    ),
+    "sbatch": (
+        "message_ix_models.util.slurm",
+        "cli",
+        "Submit `mix-models ARGS` to a SLURM queue.",
+    ),
+    "ssp": (
+        "message_ix_models.project.ssp.cli",
+        "cli",
+        "Shared Socioeconomic Pathways (SSP) project.",
+    ),
+    "techs": (
+        "message_ix_models.model.structure",
+        "cli",
+        "Export metadata to technology.csv.",
+    ),
+    "testing": ("message_ix_models.testing.cli", "cli", "Manipulate test data."),
+    "transport": (
+        "message_ix_models.model.transport.cli",
+        "cli",
+        "MESSAGEix-Transport variant.",
+    ),
+    "water-ix": (
+        "message_ix_models.model.water.cli",
+        "cli",
+        "MESSAGEix-Water and Nexus variant.",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """:class:`click.Group` that imports the modules for some commands on first use.
+
+    Parameters
+    ----------
+    lazy :
+        Mapping with the same structure as :data:`COMMANDS`.
+    """
+
+    def __init__(self, *args, lazy: Mapping[str, tuple[str, str, str]], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy = dict(lazy)
+        #: :any:`True` once :meth:`_load_message_data` has been called.
+        self._message_data_loaded = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        self._load_message_data()
+        return sorted(set(self.commands) | set(self.lazy))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy:
+            module_name, attr, _ = self.lazy.pop(cmd_name)
+            self.add_command(getattr(import_module(module_name), attr), cmd_name)
+        elif cmd_name not in self.commands and not self._message_data_loaded:
+            self._load_message_data(warn=True)
+            return self.get_command(ctx, cmd_name)
+
+        return self.commands.get(cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter):
+        """Same as :meth:`click.MultiCommand.format_commands`.
+
+        Short help for commands not yet loaded is taken from :attr:`lazy`, without
+        importing their modules.
+        """
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy:
+                rows.append((name, self.lazy[name][2]))
+            elif (cmd := self.commands[name]).hidden:
+                continue
+            else:
+                limit = formatter.width - 6 - max(map(len, self.list_commands(ctx)))
+                rows.append((name, cmd.get_short_help_str(limit)))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load_message_data(self, warn: bool = False) -> None:
+        """Add commands from :mod:`message_data`, if it is installed."""
+        if self._message_data_loaded:
+            return
+        self._message_data_loaded = True
+
+        try:
+            if util.find_spec("message_data") is None:
+                raise ImportError
+            import message_data.cli
+        except ImportError:
+            # message_data is not installed or contains some ImportError of its own
+            if warn and _warn_message_data():
+                print(
+                    "Warning: message_data is not installed or cannot be imported; see "
+                    "the documentation via --help"
+                )
+            return
+
+        # Also add message_data submodules
+        for name in message_data.cli.MODULES_WITH_CLI:  # pragma: no cover
+            # Import the module and retrieve the click.Command object
+            cmd = getattr(import_module(f"message_data.{name}"), "cli")
+
+            # Avoid replacing message-ix-models CLI with message_data CLI
+            if cmd.name in self.commands or cmd.name in self.lazy:
+                log.warning(f"Skip {cmd.name!r} CLI from {name!r}; already defined")
+                continue
+
+            self.add_command(cmd)
+
+
+def _warn_message_data() -> bool:
+    import ixmp
+
+    import message_ix_models.util.config  # noqa: F401  Registers "no message_data"
+
+    return ixmp.config.get("no message_data") is not True
+
 
 # Main command group. The code in this function is ALWAYS executed, so it should only
 # include tasks that are common to all CLI commands.
-@click.group(help=__doc__)
+@click.group(cls=LazyGroup, lazy=COMMANDS, help=__doc__)
 @click.option(
     "--url", metavar="ixmp://PLATFORM/MODEL/SCENARIO[#VERSION]", help="Scenario URL."
 )
@@ -49,9 +201,15 @@ log = logging.getLogger(__name__)
 )
 @click.option("--version", type=int, help="Scenario version for some commands.")
 @click.option("--local-data", type=Path, help="Base path for local data.")
-@common_params("verbose")
+# NB same as util.click.PARAMS["verbose"]; that module is not imported here because
+#    doing so takes several seconds
+@click.option("--verbose", "-v", is_flag=True, help="Print DEBUG-level log messages.")
 @click.pass_context
 def main(click_ctx, **kwargs):
+    # Import here (not at module level) so that `mix-models --help` is fast. This also
+    # creates the root Context instance before console logging is set up.
+    from message_ix_models.util.context import Context
+
     # Start timer
     mark_time(quiet=True)
 
@@ -150,67 +308,5 @@ def _log_threads(k: int, n: int):
         log.info(f"{k = } {i = }")
 
 
-# Attach the ixmp "config" CLI
-main.add_command(ixmp_cli.commands["config"])
-
-
-#: List of submodules providing CLI (sub)commands accessible through `mix-models`.
-#: Each of these should contain a function named ``cli`` decorated with @click.command
-#: or @click.group.
-submodules = [
-    "message_ix_models.model.cli",
-    "message_ix_models.model.structure",
-    "message_ix_models.model.transport.cli",
-    "message_ix_models.model.water.cli",
-    "message_ix_models.project.circeular.cli",
-    "message_ix_models.project.edits.cli",
-    "message_ix_models.project.ssp.cli",
-    "message_ix_models.report.cli",
-    "message_ix_models.model.material.cli",
-    "message_ix_models.testing.cli",
-    "message_ix_models.util.pooch",
-    "message_ix_models.util.slurm",
-]
-
-try:
-    import message_data.cli
-except ImportError:
-    # message_data is not installed or contains some ImportError of its own
-    import ixmp
-
-    if ixmp.config.get("no message_data") is not True:
-        print(
-            "Warning: message_data is not installed or cannot be imported; see the "
-            "documentation via --help"
-        )
-
-    # commented: Display verbose information for debugging
-    # from traceback import format_exception
-    #
-    # etype, value, tb = sys.exc_info()
-    # print(
-    #     "",
-    #     *format_exception(etype, value, tb, limit=-1, chain=False)[1:],
-    #     sep="\n",
-    # )
-else:  # pragma: no cover  (needs message_data)
-    # Also add message_data submodules
-    submodules.extend(
-        f"message_data.{name}" for name in message_data.cli.MODULES_WITH_CLI
-    )
-
-for name in submodules:
-    # Import the module and retrieve the click.Command object
-    __import__(name)
-    cmd = getattr(sys.modules[name], "cli")
-
-    # Avoid replacing message-ix-models CLI with message_data CLI
-    if cmd.name in main.commands:  # pragma: no cover  (needs message_data)
-        log.warning(f"Skip {repr(cmd.name)} CLI from {repr(name)}; already defined")
-        continue
-
-    main.add_command(cmd)
-
-
 if __name__ == "__main__":
     main()
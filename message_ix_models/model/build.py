@@ -1,20 +1,220 @@
+import json
 import logging
-from collections.abc import Callable, Mapping
-from typing import Optional, Union
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
 
 import ixmp
+import numpy as np
 import pandas as pd
 from message_ix import Scenario
 from sdmx.model.v21 import Code
 
-from message_ix_models.util import add_par_data, strip_par_data
+from message_ix_models.util import (
+    add_par_data,
+    ellipsize,
+    iter_parameters,
+    strip_par_data,
+)
 from message_ix_models.util.ixmp import maybe_check_out, maybe_commit
 from message_ix_models.util.scenarioinfo import ScenarioInfo, Spec
 
+if TYPE_CHECKING:
+    from weakref import CallableProxyType
+
+    from message_ix_models import Context
+
 log = logging.getLogger(__name__)
 
 
-def _add_unit(mp: ixmp.Platform, unit: str, comment: str) -> None:
+class BuildCache:
+    """Reuse the result of a previous model build with identical inputs.
+
+    A model builder creates a BuildCache before modifying `scenario`, returns the
+    result of :meth:`get` if it is not :obj:`None`, and otherwise calls :meth:`put`
+    with the built scenario:
+
+    .. code-block:: python
+
+        cache = BuildCache(context, scenario, spec, paths=[package_data_path("foo")])
+        if result := cache.get():
+            return result
+        apply_spec(scenario, spec, add_data)
+        cache.put(scenario)
+
+    The cache is only used if :attr:`.Config.build_cache` is :obj:`True`; otherwise
+    :meth:`get` returns :obj:`None` and :meth:`put` does nothing.
+
+    The cache key is a digest of:
+
+    - the model name, scenario name, and version of `base`,
+    - the elements of each set in `spec`,
+    - the contents of all files in `paths`, for instance package or exogenous data
+      read by the builder,
+    - the version of :mod:`message_ix_models`, the name of the platform, and
+    - any other `kwargs`, for instance build options.
+
+    If `base` is not given and `scenario` was created by :func:`clone_for_build`, the
+    scenario it was cloned from is used; otherwise, `scenario` itself before the build.
+    Model builders run on a new clone, with a new version, every time, so `scenario`
+    itself never gives the same key twice. The contents of `base` are not read, so
+    changes made to it without committing a new version are not reflected in the key.
+
+    On a miss, :meth:`put` clones the built scenario to a new scenario named
+    :py:`"build cache {key}"`, so that later changes to the built scenario (for
+    instance, by solving it) do not affect the cache. On a hit, :meth:`get` clones this
+    scenario back to the model and scenario name of `scenario`. Entries are recorded in
+    the directory :file:`build/` within :attr:`.Config.cache_path`.
+    """
+
+    #: :obj:`True` if the cache is used.
+    enabled: bool
+
+    #: Cache key, if :attr:`enabled`.
+    key: Optional[str] = None
+
+    def __init__(
+        self,
+        context: "Context",
+        scenario: Scenario,
+        spec: Union[Spec, Mapping[str, ScenarioInfo]],
+        paths: Iterable[Path] = (),
+        base: Optional[Scenario] = None,
+        **kwargs,
+    ):
+        from genno.caching import hash_args
+
+        import message_ix_models
+        import message_ix_models.util.cache  # noqa: F401  Register Encoder functions
+
+        self.enabled = context.core.build_cache
+        self.scenario = scenario
+        if not self.enabled:
+            return
+
+        if base is not None:
+            base_id = (base.model, base.scenario, base.version)
+        else:
+            base_id = _CLONED_FROM.get(
+                (scenario.platform.name, scenario.url),
+                (scenario.model, scenario.scenario, scenario.version),
+            )
+        log.info("Compute build cache key for {}/{}#{}".format(*base_id))
+        self.key = hash_args(
+            list(base_id),
+            {
+                k: {
+                    name: list(map(str, elements))
+                    for name, elements in spec[k].set.items()
+                    if len(elements)
+                }
+                for k in ("add", "remove", "require")
+            },
+            [_paths_digest(Path(p)) for p in paths],
+            message_ix_models.__version__,
+            scenario.platform.name,
+            **kwargs,
+        )
+        self.path = context.core.get_cache_path("build", f"{self.key}.json")
+
+    def get(self) -> Optional[Scenario]:
+        """Return a clone of the result of a previous build, or :obj:`None`."""
+        if not self.enabled or not self.path.exists():
+            return None
+
+        info = json.loads(self.path.read_text())
+        mp = self.scenario.platform
+        versions = mp.scenario_list(
+            default=False, model=info["model"], scen=info["scenario"]
+        )["version"]
+        if info["version"] not in set(versions):
+            log.info(f"Build cache entry {self.key} refers to a missing scenario")
+            return None
+
+        cached = Scenario(mp, info["model"], info["scenario"], info["version"])
+        log.info(f"Build cache hit {self.key}; clone {cached.url}")
+        return cached.clone(
+            model=self.scenario.model,
+            scenario=self.scenario.scenario,
+            keep_solution=False,
+        )
+
+    def put(self, scenario: Scenario) -> None:
+        """Store `scenario`, the result of the build, in the cache."""
+        if not self.enabled:
+            return
+
+        cached = scenario.clone(scenario=f"build cache {self.key}", keep_solution=False)
+        log.info(f"Store build result in {cached.url}")
+        self.path.write_text(
+            json.dumps(
+                dict(
+                    model=cached.model,
+                    scenario=cached.scenario,
+                    version=int(cached.version),
+                    source=scenario.url,
+                )
+            )
+        )
+
+
+#: Scenarios created by :func:`clone_for_build`. Keys are (platform name, URL) of each
+#: clone; values are (model name, scenario name, version) of the scenario it was cloned
+#: from.
+_CLONED_FROM: dict[tuple[str, str], tuple[str, str, Union[int, str, None]]] = {}
+
+
+def clone_for_build(base: Scenario, **kwargs) -> Scenario:
+    """Clone `base` to a new scenario on which to build a model.
+
+    `kwargs` are passed to :meth:`.Scenario.clone`. When a model builder uses
+    :class:`BuildCache` on the result, the cache key includes the model name, scenario
+    name, and version of `base`; so repeated builds on different clones of the same
+    version of `base` can reuse the same cache entry.
+    """
+    result = base.clone(**kwargs)
+    _CLONED_FROM[(result.platform.name, result.url)] = (
+        base.model,
+        base.scenario,
+        base.version,
+    )
+    return result
+
+
+@lru_cache(maxsize=4096)
+def _file_digest(path: Path, mtime_ns: int, size: int) -> str:
+    """Return a digest of the contents of the file at `path`.
+
+    `mtime_ns` and `size` are not used, except to invalidate the cache when the file
+    changes.
+    """
+    h = blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _paths_digest(path: Path) -> list[tuple[str, str]]:
+    """Return the relative paths and digests of `path` or all files within it."""
+    files = (
+        sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    )
+    result = []
+    for p in files:
+        stat = p.stat()
+        result.append(
+            (str(p.relative_to(path)), _file_digest(p, stat.st_mtime_ns, stat.st_size))
+        )
+    return result
+
+
+def _add_unit(
+    mp: Union[ixmp.Platform, "CallableProxyType"], unit: str, comment: str
+) -> None:
     """Handle exceptions in :meth:`.Platform.add_unit`."""
     # TODO move upstream to ixmp.JDBCBackend
     log.info(f"Add unit {repr(unit)}")
@@ -46,6 +246,11 @@ def apply_spec(  # noqa: C901
 
     Other parameters
     ----------------
+    bulk : bool
+        Remove all elements of each set given by ``spec["remove"]`` with a single call
+        to :func:`.strip_par_data`. Default :obj:`True`. If :obj:`False`, call
+        :func:`.strip_par_data` once per element; this is much slower on large
+        scenarios.
     dry_run : bool
         Don't modify `scenario`; only show what would be done. Default :obj:`False`.
         Exceptions will still be raised if the elements from ``spec['required']`` are
@@ -66,6 +271,7 @@ def apply_spec(  # noqa: C901
     .Code
     .ScenarioInfo
     """
+    bulk = options.get("bulk", True)
     dry_run = options.get("dry_run", False)
     fast = options.get("fast", False)
 
@@ -119,14 +325,21 @@ def apply_spec(  # noqa: C901
             raise ValueError
 
         # Remove elements and associated parameter values
-        for element in spec["remove"].set[set_name]:
+        remove = spec["remove"].set[set_name]
+        if bulk:
+            # All elements at once; 1 query per parameter
             strip_par_data(
-                scenario,
-                set_name,
-                element,
-                dry_run=dry_run,
-                dump=None if fast else dump,
+                scenario, set_name, remove, dry_run=dry_run, dump=None if fast else dump
             )
+        else:
+            for element in remove:
+                strip_par_data(
+                    scenario,
+                    set_name,
+                    element,
+                    dry_run=dry_run,
+                    dump=None if fast else dump,
+                )
 
         # Add elements
         add = [] if dry_run else spec["add"].set[set_name]
@@ -167,13 +380,235 @@ def apply_spec(  # noqa: C901
     )
 
 
-def ellipsize(elements: list) -> str:
-    """Generate a short string representation of `elements`.
+@dataclass
+class BuildPlan:
+    """Changes to a scenario, computed by :func:`plan_spec`.
+
+    Each attribute contains only changes that are not already reflected in the
+    scenario: for instance, :attr:`add_set` omits elements that already exist, and
+    :attr:`remove_par` contains only the rows that exist.
+    """
+
+    #: URL of the scenario for which the plan was computed.
+    url: str
+
+    #: Elements to remove from each set: lists for 1-dimensional sets, data frames for
+    #: indexed sets.
+    remove_set: dict[str, Union[list, pd.DataFrame]] = field(default_factory=dict)
+
+    #: Elements to add to each set, in the order in which the sets must be populated.
+    add_set: dict[str, Union[list, pd.DataFrame]] = field(default_factory=dict)
+
+    #: Keys of parameter data to remove.
+    remove_par: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    #: Parameter data to add, as returned by the `data` argument to :func:`plan_spec`.
+    add_par: dict[str, pd.DataFrame] = field(default_factory=dict)
+
+    #: Region codes to add to the :class:`~ixmp.Platform`.
+    add_region: list[str] = field(default_factory=list)
+
+    #: Units to add to the :class:`~ixmp.Platform`, with descriptions.
+    add_unit: dict[str, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Total number of set elements and parameter rows to be added or removed."""
+        return int(self.summary()[["add", "remove"]].sum().sum())
+
+    def summary(self) -> pd.DataFrame:
+        """Return counts of elements or rows to add and remove for each item.
+
+        The result has a row for each set or parameter affected by the plan, and
+        columns "type" ("set" or "par"), "add", and "remove".
+        """
+        rows = []
+        for kind, add, remove in (
+            ("set", self.add_set, self.remove_set),
+            ("par", self.add_par, self.remove_par),
+        ):
+            for name in sorted(set(add) | set(remove)):
+                rows.append(
+                    (name, kind, len(add.get(name, [])), len(remove.get(name, [])))
+                )
+        return pd.DataFrame(rows, columns=["name", "type", "add", "remove"]).set_index(
+            "name"
+        )
+
+    def execute(self, scenario: Scenario, message: Optional[str] = None) -> None:
+        """Apply the plan to `scenario` in a single transaction.
+
+        Parameter data are removed with one call per parameter; set elements are
+        removed and added with one call per set; and parameter data are added using
+        :func:`.add_par_data`.
+        """
+        if scenario.url != self.url:
+            log.warning(f"Apply plan for {self.url} to {scenario.url}")
+
+        mp = scenario.platform
+        for unit, comment in self.add_unit.items():
+            _add_unit(mp, unit, comment)
+        for region in self.add_region:
+            mp.add_region(region, "region")
+
+        try:
+            scenario.remove_solution()
+        except ValueError:
+            pass
+        maybe_check_out(scenario)
+
+        for name, key in self.remove_par.items():
+            log.info(f"Remove {len(key)} rows from {name!r}")
+            scenario.remove_par(name, key=key)
+        for name, elements in self.remove_set.items():
+            log.info(f"Remove {len(elements)} element(s) from set {name!r}")
+            scenario.remove_set(name, elements)
+        for name, elements in self.add_set.items():
+            log.info(f"Add {len(elements)} element(s) to set {name!r}")
+            scenario.add_set(name, elements)
+
+        add_par_data(scenario, self.add_par)
+
+        maybe_commit(
+            scenario,
+            condition=True,
+            message=message or f"{__name__}.BuildPlan.execute()",
+        )
+
+
+def plan_spec(
+    scenario: Scenario,
+    spec: Union[Spec, Mapping[str, ScenarioInfo]],
+    data: Optional[Callable] = None,
+    *,
+    fast: bool = False,
+) -> BuildPlan:
+    """Compute the changes that :func:`apply_spec` would make to `scenario`.
 
-    If the list has more than 5 elements, only the first two and last two are shown,
-    with "..." between.
+    Unlike :py:`apply_spec(..., dry_run=True)`, each set mentioned in `spec` and each
+    parameter indexed by a set with elements to be removed is read from `scenario`
+    only once. The changes are computed from these in memory. `scenario` is not
+    modified.
+
+    Parameters
+    ----------
+    data : callable, optional
+        As for :func:`apply_spec`, except that `data` is always called with
+        :py:`dry_run=True`, so that it does not modify `scenario`. Only the
+        :class:`dict` of parameter data that it returns is stored in
+        :attr:`.BuildPlan.add_par`; a function that adds data to `scenario` directly
+        and returns nothing must be used with :func:`apply_spec` instead.
+    fast : bool, optional
+        As for :func:`apply_spec`: do not read or remove existing parameter data, so
+        :attr:`.BuildPlan.remove_par` is empty.
+
+    Returns
+    -------
+    BuildPlan
+        Call :meth:`.BuildPlan.execute` to apply the changes, or
+        :meth:`.BuildPlan.summary` to show them.
+
+    Raises
+    ------
+    ValueError
+        if elements from ``spec["require"]`` are missing from `scenario`.
+    """
+    result = BuildPlan(url=scenario.url)
+
+    # Snapshot the contents of each set mentioned in `spec`; basic (non-indexed) sets
+    # first, as in apply_spec()
+    base = {}
+    for _, name in sorted((len(scenario.idx_sets(s)), s) for s in scenario.set_list()):
+        if any(len(info.set[name]) for info in spec.values()):
+            base[name] = _set_index(scenario.set(name))
+
+    removed: dict[str, pd.Index] = {}
+    for name, existing in base.items():
+        require, remove, add = (
+            _set_index(spec[k].set[name], existing.names)
+            for k in ("require", "remove", "add")
+        )
+
+        if len(missing := require.difference(existing)):
+            log.error(f"{len(missing)} elements of {name!r} not found: {list(missing)}")
+            raise ValueError(missing)
+
+        # Elements to remove that exist; elements to add that do not
+        removed[name] = remove.intersection(existing)
+        after = existing.difference(removed[name])
+        for attr, index in (
+            ("remove_set", removed[name]),
+            ("add_set", add[~add.isin(after)].unique()),
+        ):
+            if len(index):
+                getattr(result, attr)[name] = _set_elements(index)
+
+    # Rows of parameter data referencing elements to be removed
+    if not fast:
+        result.remove_par = _plan_remove_par(scenario, removed)
+
+    # Regions and units to add to the Platform
+    regions = set(scenario.platform.regions()["region"])
+    result.add_region = [n for n in result.add_set.get("node", []) if n not in regions]
+    for unit in spec["add"].set["unit"]:
+        unit = unit if isinstance(unit, Code) else Code(id=unit, name=unit)
+        result.add_unit[unit.id] = str(unit.name)
+
+    if callable(data):
+        if par_data := data(scenario, dry_run=True):
+            result.add_par.update(par_data)
+        else:
+            log.warning(f"{data!r} returned no parameter data to plan")
+
+    log.info(f"Plan for {scenario.url}:\n{result.summary().to_string()}")
+
+    return result
+
+
+def _plan_remove_par(
+    scenario: Scenario, removed: Mapping[str, pd.Index]
+) -> dict[str, pd.DataFrame]:
+    """Return keys of parameter data in `scenario` that reference `removed` elements.
+
+    Each parameter indexed by a set with elements to be removed is read only once.
+    """
+    result = {}
+    names = set(
+        p for s, r in removed.items() if len(r) for p in iter_parameters(s, scenario)
+    )
+    for par_name in sorted(names):
+        idx_names = scenario.idx_names(par_name)
+        df = scenario.par(par_name)
+        mask = np.zeros(len(df), dtype=bool)
+        for dim, set_name in zip(idx_names, scenario.idx_sets(par_name)):
+            if len(index := removed.get(set_name, [])):
+                mask |= df[dim].astype(str).isin(index)
+        if mask.any():
+            result[par_name] = df.loc[mask, idx_names].reset_index(drop=True)
+    return result
+
+
+def _set_elements(index: pd.Index) -> Union[list, pd.DataFrame]:
+    """Convert `index` to elements for :meth:`ixmp.Scenario.add_set`."""
+    if isinstance(index, pd.MultiIndex):
+        return index.to_frame(index=False)
+    return index.tolist()
+
+
+def _set_index(elements, names=None) -> pd.Index:
+    """Return set `elements` as a :class:`pandas.Index` of str.
+
+    `elements` may be the return value of :meth:`ixmp.Scenario.set` or a list from
+    :attr:`.ScenarioInfo.set`, containing str, :class:`.Code`, or sequences of these
+    for indexed sets.
     """
-    if len(elements) > 5:
-        return ", ".join(map(str, elements[:2] + ["..."] + elements[-2:]))
-    else:
-        return ", ".join(map(str, elements))
+    if isinstance(elements, pd.DataFrame):
+        return pd.MultiIndex.from_frame(elements.astype(str))
+    elif isinstance(elements, pd.Series):
+        return pd.Index(elements.astype(str), dtype=object)
+
+    values = [
+        tuple(map(str, e)) if isinstance(e, (list, tuple)) else str(e) for e in elements
+    ]
+    if isinstance(names, list) and len(names) > 1:
+        return pd.MultiIndex.from_tuples(values, names=names)
+    return pd.Index(values, dtype=object)
@@ -1,12 +1,13 @@
 import logging
 from collections.abc import Mapping
+from pathlib import Path
 from typing import Any, Optional
 
 import message_ix
 import pandas as pd
 
 from message_ix_models import Context
-from message_ix_models.model.build import apply_spec
+from message_ix_models.model.build import BuildCache, apply_spec
 from message_ix_models.model.material.data_aluminum import gen_data_aluminum
 from message_ix_models.model.material.data_ammonia_new import gen_all_NH3_fert
 from message_ix_models.model.material.data_cement import gen_data_cement
@@ -108,6 +109,21 @@ def build(
 
     # Get the specification and apply to the base scenario
     spec = make_spec(node_suffix)
+
+    # Reuse the result of a previous build with identical inputs, if enabled
+    cache = BuildCache(
+        context,
+        scenario,
+        spec,
+        paths=[package_data_path("material")]
+        + ([Path(iea_data_path)] if iea_data_path else []),
+        old_calib=old_calib,
+        modify_existing_constraints=modify_existing_constraints,
+        regions=node_suffix,
+    )
+    if cached := cache.get():
+        return cached
+
     apply_spec(scenario, spec, add_data, fast=True)  # dry_run=True
 
     water_dict = pd.read_excel(
@@ -135,6 +151,8 @@ def build(
     if modify_existing_constraints:
         calibrate_existing_constraints(scenario)
 
+    cache.put(scenario)
+
     return scenario
 
 
@@ -11,6 +11,7 @@ import click
 import message_ix
 
 import message_ix_models.tools.costs.projections
+from message_ix_models.model.build import clone_for_build
 from message_ix_models.model.material.data_util import (
     add_macro_COVID,
     gen_te_projections,
@@ -108,7 +109,8 @@ def build_scen(
         # Clone and set up
 
         if "SSP_dev" in context.scenario_info["model"]:
-            scenario = context.get_scenario().clone(
+            scenario = clone_for_build(
+                context.get_scenario(),
                 model=context.scenario_info["model"],
                 scenario=context.scenario_info["scenario"] + "_" + tag,
                 keep_solution=False,
@@ -119,7 +121,8 @@ def build_scen(
         else:
             scenario = build(
                 context,
-                context.get_scenario().clone(
+                clone_for_build(
+                    context.get_scenario(),
                     model="MESSAGEix-Materials",
                     scenario=output_scenario_name + "_" + tag,
                 ),
@@ -2,7 +2,6 @@
 """
 Created on Mon Mar  8 12:58:21 2021
 This code produces the follwoing outputs:
-message_ix_reporting.xlsx: message_ix level reporting
 check.xlsx: can be used for checking the filtered variables
 New_Reporting_Model_Scenario.xlsx: Reporting including the material variables
 Merged_Model_Scenario.xlsx: Includes all IAMC variables
@@ -22,13 +21,15 @@ Material_global_grpahs.pdf
 """
 
 import os
+import re
+from functools import lru_cache
+from typing import Optional
 
 import matplotlib
 import numpy as np
 import openpyxl
 import pandas as pd
 import pyam
-import xlsxwriter
 from ixmp.report import configure
 from matplotlib import pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
@@ -39,6 +40,9 @@ from message_ix_models.util import package_data_path
 
 matplotlib.use("Agg")
 
+#: Index columns of IAMC-structured data.
+IAMC_IDX = ["Model", "Scenario", "Region", "Variable", "Unit"]
+
 
 def change_names(s):
     """Change the sector names according to IMAC format."""
@@ -66,6 +70,29 @@ def change_names(s):
     return s
 
 
+@lru_cache
+def _compile(patterns: tuple[str, ...]) -> "re.Pattern":
+    """Compile :mod:`pyam`-style `patterns` into a single regular expression.
+
+    As in :meth:`pyam.IamDataFrame.filter`, "*" matches any sequence of characters.
+    """
+    return re.compile("|".join(re.escape(p).replace(r"\*", ".*") for p in patterns))
+
+
+def _filter(df: pyam.IamDataFrame, variable, **kwargs) -> Optional[pyam.IamDataFrame]:
+    """Same as :meth:`pyam.IamDataFrame.filter`, with `variable` patterns compiled.
+
+    The variable names in `df` are matched against all of `variable` at once, instead
+    of once per pattern; the matching names are passed to :meth:`~.IamDataFrame.filter`
+    together with `kwargs`.
+    """
+    patterns = (variable,) if isinstance(variable, str) else tuple(variable)
+    names = pd.Index(df.variable)
+    return df.filter(
+        variable=names[names.str.fullmatch(_compile(patterns))].tolist(), **kwargs
+    )
+
+
 def fix_excel(path_temp, path_new):
     """
     Fix the names of the regions or variables to be compatible
@@ -183,23 +210,17 @@ def report(context, scenario):  # noqa: C901
     directory = package_data_path("material", "reporting_output")
     directory.mkdir(exist_ok=True)
 
-    # Generate message_ix level reporting and dump to an excel file.
+    # Generate message_ix level reporting, and obtain a pyam dataframe / filter /
+    # global aggregation
 
     rep = Reporter.from_scenario(scenario)
     configure(units={"replace": {"-": ""}})
     df = rep.get("message::default")
-    name = os.path.join(directory, f"message_ix_reporting_{scenario.scenario}.xlsx")
-    df.to_excel(name)
     print("message_ix level reporting generated")
 
-    # Obtain a pyam dataframe / filter / global aggregation
-
-    path = os.path.join(directory, f"message_ix_reporting_{scenario.scenario}.xlsx")
-    report = pd.read_excel(path)
-    report.Unit.fillna("", inplace=True)
-    df = pyam.IamDataFrame(report)
     df.filter(region=nodes, year=years, inplace=True)
-    df.filter(
+    _filter(
+        df,
         variable=[
             "out|new_scrap|aluminum|*",
             "out|final_material|aluminum|prebake_aluminum|M1",
@@ -448,35 +469,7 @@ def report(context, scenario):  # noqa: C901
     scenario_name = df.scenario[0]
 
     # Create an empty pyam dataframe to store the new variables
-
-    workbook = xlsxwriter.Workbook("empty_template.xlsx")
-    worksheet = workbook.add_worksheet()
-    worksheet.write("A1", "Model")
-    worksheet.write("B1", "Scenario")
-    worksheet.write("C1", "Region")
-    worksheet.write("D1", "Variable")
-    worksheet.write("E1", "Unit")
-    columns = [
-        "F1",
-        "G1",
-        "H1",
-        "I1",
-        "J1",
-        "K1",
-        "L1",
-        "M1",
-        "N1",
-        "O1",
-        "P1",
-        "Q1",
-        "R1",
-    ]
-
-    for yr, col in zip(years, columns):
-        worksheet.write(col, yr)
-    workbook.close()
-
-    df_final = pyam.IamDataFrame("empty_template.xlsx")
+    df_final = pyam.IamDataFrame(pd.DataFrame(columns=IAMC_IDX + list(years)))
     print("Empty template for new variables created")
 
     # Create a pdf file with figures
@@ -497,11 +490,12 @@ def report(context, scenario):  # noqa: C901
         # ALUMINUM
         df_al = df.copy()
         df_al.filter(region=r, year=years, inplace=True)
-        df_al.filter(variable=["out|*|aluminum|*", "in|*|aluminum|*"], inplace=True)
+        _filter(df_al, variable=["out|*|aluminum|*", "in|*|aluminum|*"], inplace=True)
         df_al.convert_unit("", to="Mt/yr", factor=1, inplace=True)
         df_al_graph = df_al.copy()
 
-        df_al_graph.filter(
+        _filter(
+            df_al_graph,
             variable=[
                 "out|useful_material|aluminum|import_aluminum|*",
                 "out|final_material|aluminum|prebake_aluminum|*",
@@ -512,7 +506,8 @@ def report(context, scenario):  # noqa: C901
         )
 
         if r == "World":
-            df_al_graph.filter(
+            _filter(
+                df_al_graph,
                 variable=[
                     "out|final_material|aluminum|prebake_aluminum|*",
                     "out|final_material|aluminum|soderberg_aluminum|*",
@@ -543,11 +538,12 @@ def report(context, scenario):  # noqa: C901
 
         df_steel = df.copy()
         df_steel.filter(region=r, year=years, inplace=True)
-        df_steel.filter(variable=["out|*|steel|*", "in|*|steel|*"], inplace=True)
+        _filter(df_steel, variable=["out|*|steel|*", "in|*|steel|*"], inplace=True)
         df_steel.convert_unit("", to="Mt/yr", factor=1, inplace=True)
 
         df_steel_graph = df_steel.copy()
-        df_steel_graph.filter(
+        _filter(
+            df_steel_graph,
             variable=[
                 "out|final_material|steel|*",
                 "out|useful_material|steel|import_steel|*",
@@ -556,8 +552,9 @@ def report(context, scenario):  # noqa: C901
         )
 
         if r == "World":
-            df_steel.filter(variable=["out|*|steel|*", "in|*|steel|*"], inplace=True)
-            df_steel_graph.filter(
+            _filter(df_steel, variable=["out|*|steel|*", "in|*|steel|*"], inplace=True)
+            _filter(
+                df_steel_graph,
                 variable=[
                     "out|final_material|steel|*",
                 ],
@@ -577,7 +574,8 @@ def report(context, scenario):  # noqa: C901
 
         df_petro = df.copy()
         df_petro.filter(region=r, year=years, inplace=True)
-        df_petro.filter(
+        _filter(
+            df_petro,
             variable=[
                 "in|final|ethanol|ethanol_to_ethylene_petro|M1",
                 "in|desulfurized|*|steam_cracker_petro|*",
@@ -588,7 +586,8 @@ def report(context, scenario):  # noqa: C901
         df_petro.convert_unit("", to="Mt/yr", factor=1, inplace=True)
 
         if r == "World":
-            df_petro.filter(
+            _filter(
+                df_petro,
                 variable=[
                     "in|final|ethanol|ethanol_to_ethylene_petro|M1",
                     "in|desulfurized|*|steam_cracker_petro|*",
@@ -708,7 +707,8 @@ def report(context, scenario):  # noqa: C901
             append=True,
         )
 
-        df_al.filter(
+        _filter(
+            df_al,
             variable=[
                 "Production|Primary|Non-Ferrous Metals|Aluminium",
                 "Production|Secondary|Non-Ferrous Metals|Aluminium",
@@ -787,7 +787,8 @@ def report(context, scenario):  # noqa: C901
         #    "Total Scrap|Steel|New Scrap", components=new_scrap_steel_vars, append=True
         # )
 
-        df_steel.filter(
+        _filter(
+            df_steel,
             variable=[
                 "Production|Primary|Steel",
                 "Production|Secondary|Steel",
@@ -804,7 +805,8 @@ def report(context, scenario):  # noqa: C901
 
         df_chemicals = df.copy()
         df_chemicals.filter(region=r, year=years, inplace=True)
-        df_chemicals.filter(
+        _filter(
+            df_chemicals,
             variable=[
                 "out|secondary_material|NH3|*",
                 "out|final_material|ethylene|*",
@@ -868,7 +870,7 @@ def report(context, scenario):  # noqa: C901
 
         # add entries for each methanol technology
         meth_tec_list = [i.replace("fuel", "M1") for i in methanol_fuel_vars]
-        df_meth_individual = df_chemicals.filter(variable=meth_tec_list)
+        df_meth_individual = _filter(df_chemicals, variable=meth_tec_list)
         df_meth_individual.convert_unit(
             "Mt/yr", to="Mt/yr", factor=(1 / 0.6976), inplace=True
         )
@@ -962,7 +964,8 @@ def report(context, scenario):  # noqa: C901
             append=True,
         )
 
-        df_chemicals.filter(
+        _filter(
+            df_chemicals,
             variable=[
                 "Production|Primary|Chemicals|High Value Chemicals",
                 "Production|Chemicals|High Value Chemicals",
@@ -997,8 +1000,10 @@ def report(context, scenario):  # noqa: C901
 
         df_cement_clinker = df.copy()
         df_cement_clinker.filter(region=r, year=years, inplace=True)
-        df_cement_clinker.filter(
-            variable=["out|tertiary_material|clinker_cement|*"], inplace=True
+        _filter(
+            df_cement_clinker,
+            variable=["out|tertiary_material|clinker_cement|*"],
+            inplace=True,
         )
         df_cement_clinker.plot.stack(ax=ax1)
         ax1.legend(
@@ -1012,7 +1017,8 @@ def report(context, scenario):  # noqa: C901
 
         df_cement = df.copy()
         df_cement.filter(region=r, year=years, inplace=True)
-        df_cement.filter(
+        _filter(
+            df_cement,
             variable=["out|product|cement|*", "out|tertiary_material|clinker_cement|*"],
             inplace=True,
         )
@@ -1080,7 +1086,8 @@ def report(context, scenario):  # noqa: C901
             components=total_scrap_cement_vars,
             append=True,
         )
-        df_cement.filter(
+        _filter(
+            df_cement,
             variable=[
                 "Production|Primary|Non-Metallic Minerals|Cement",
                 "Production|Non-Metallic Minerals|Cement",
@@ -1117,10 +1124,14 @@ def report(context, scenario):  # noqa: C901
                 "GWa", to="EJ/yr", factor=0.03154, inplace=True
             )
             df_final_energy.filter(region=r, year=years, inplace=True)
-            df_final_energy.filter(
-                variable=["in|final|*|cokeoven_steel|*"], keep=False, inplace=True
+            _filter(
+                df_final_energy,
+                variable=["in|final|*|cokeoven_steel|*"],
+                keep=False,
+                inplace=True,
             )
-            df_final_energy.filter(
+            _filter(
+                df_final_energy,
                 variable=[
                     "in|final|atm_gasoil|*",
                     "in|final|vacuum_gasoil|*",
@@ -1156,7 +1167,8 @@ def report(context, scenario):  # noqa: C901
             )
 
             if c == "all":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final_material|methanol|MTO_petro|energy",
                         "in|final_material|methanol|CH2O_synth|energy",
@@ -1165,14 +1177,16 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "electr_gas":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|secondary|electr|electr_NH3|M1",
                     ],
                     inplace=True,
                 )
             if c == "gas":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|gas|*",
                         "in|secondary|gas|gas_NH3|M1",
@@ -1183,13 +1197,15 @@ def report(context, scenario):  # noqa: C901
                     ],
                     inplace=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["in|final|gas|gas_processing_petro|*"],
                     keep=False,
                     inplace=True,
                 )
             if c == "liquids":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|ethanol|ethanol_to_ethylene_petro|*",
                         "in|final|*|foil_fs|*",
@@ -1206,7 +1222,8 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "solids":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|biomass|*",
                         "in|final|coal|*",
@@ -1222,14 +1239,16 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "hydrogen":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|secondary|hydrogen|meth_h2|feedstock",
                     ],
                     inplace=True,
                 )
             if c == "methanol":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final_material|methanol|MTO_petro|energy",
                         "in|final_material|methanol|CH2O_synth|energy",
@@ -1255,7 +1274,7 @@ def report(context, scenario):  # noqa: C901
 
             aux2_df = aux2_df[aux2_df["variable"].isin(var_sectors)]
 
-            df_final_energy.filter(variable=var_sectors, inplace=True)
+            _filter(df_final_energy, variable=var_sectors, inplace=True)
 
             # Aggregate
 
@@ -1265,8 +1284,10 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
-                    variable=["Final Energy|Non-Energy Use"], inplace=True
+                _filter(
+                    df_final_energy,
+                    variable=["Final Energy|Non-Energy Use"],
+                    inplace=True,
                 )
                 df_final_energy.convert_unit(
                     "GWa", to="EJ/yr", factor=0.03154, inplace=True
@@ -1280,7 +1301,8 @@ def report(context, scenario):  # noqa: C901
                     append=True,
                 )
 
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Non-Energy Use|Other"],
                     inplace=True,
                 )
@@ -1296,7 +1318,8 @@ def report(context, scenario):  # noqa: C901
                     append=True,
                 )
 
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Non-Energy Use|Hydrogen"],
                     inplace=True,
                 )
@@ -1312,7 +1335,8 @@ def report(context, scenario):  # noqa: C901
                     append=True,
                 )
 
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Non-Energy Use|Gases|Electricity"],
                     inplace=True,
                 )
@@ -1333,7 +1357,8 @@ def report(context, scenario):  # noqa: C901
                     append=True,
                 )
 
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Non-Energy Use|Gases"],
                     inplace=True,
                 )
@@ -1394,7 +1419,8 @@ def report(context, scenario):  # noqa: C901
                     append=True,
                 )
 
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "Final Energy|Non-Energy Use|Liquids",
                         "Final Energy|Non-Energy Use|Liquids|Oil",
@@ -1432,7 +1458,8 @@ def report(context, scenario):  # noqa: C901
                     components=filter_vars,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "Final Energy|Non-Energy Use|Solids",
                         "Final Energy|Non-Energy Use|Solids|Biomass",
@@ -1465,7 +1492,8 @@ def report(context, scenario):  # noqa: C901
             df_final_energy = df.copy()
             df_final_energy.convert_unit("", to="GWa", factor=1, inplace=True)
             df_final_energy.filter(region=r, year=years, inplace=True)
-            df_final_energy.filter(
+            _filter(
+                df_final_energy,
                 variable=[
                     "in|final|*|cokeoven_steel|*",
                     "in|final|co_gas|*",
@@ -1476,7 +1504,8 @@ def report(context, scenario):  # noqa: C901
             )
 
             if c == "electr":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|electr|*",
                         "in|secondary|electr|NH3_to_N_fertil|M1",
@@ -1497,10 +1526,11 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "gas":
-                df_final_energy.filter(variable=["in|final|gas|*"], inplace=True)
+                _filter(df_final_energy, variable=["in|final|gas|*"], inplace=True)
             # Do not include gasoil and naphtha feedstock
             if c == "liquids":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|ethanol|*",
                         "in|final|fueloil|*",
@@ -1510,7 +1540,8 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "solids":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|biomass|*",
                         "in|final|coal|*",
@@ -1519,11 +1550,12 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "hydrogen":
-                df_final_energy.filter(variable=["in|final|hydrogen|*"], inplace=True)
+                _filter(df_final_energy, variable=["in|final|hydrogen|*"], inplace=True)
             if c == "heat":
-                df_final_energy.filter(variable=["in|final|d_heat|*"], inplace=True)
+                _filter(df_final_energy, variable=["in|final|d_heat|*"], inplace=True)
             if c == "solar":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "out|useful|i_therm|solar_i|*",
                         "out|useful_aluminum|lt_heat|solar_aluminum|*",
@@ -1535,7 +1567,8 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "all":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|*",
                         "in|secondary|electr|NH3_to_N_fertil|M1",
@@ -1608,7 +1641,7 @@ def report(context, scenario):  # noqa: C901
             ]
             aux2_df = aux2_df[aux2_df["variable"].isin(var_sectors)]
 
-            df_final_energy.filter(variable=var_sectors, inplace=True)
+            _filter(df_final_energy, variable=var_sectors, inplace=True)
 
             # Aggregate
 
@@ -1618,8 +1651,10 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
-                    variable=["Final Energy|Industry excl Non-Energy Use"], inplace=True
+                _filter(
+                    df_final_energy,
+                    variable=["Final Energy|Industry excl Non-Energy Use"],
+                    inplace=True,
                 )
                 df_final_energy.convert_unit(
                     "GWa", to="EJ/yr", factor=0.03154, inplace=True
@@ -1631,7 +1666,8 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Industry excl Non-Energy Use|Electricity"],
                     inplace=True,
                 )
@@ -1651,7 +1687,8 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Industry excl Non-Energy Use|Gases"],
                     inplace=True,
                 )
@@ -1666,7 +1703,8 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Industry excl Non-Energy Use|Hydrogen"],
                     inplace=True,
                 )
@@ -1722,7 +1760,8 @@ def report(context, scenario):  # noqa: C901
                     append=True,
                 )
 
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "Final Energy|Industry excl Non-Energy Use|Liquids",
                         "Final Energy|Industry excl Non-Energy Use|Liquids|Oil",
@@ -1762,7 +1801,8 @@ def report(context, scenario):  # noqa: C901
                     components=filter_vars,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "Final Energy|Industry excl Non-Energy Use|Solids",
                         "Final Energy|Industry excl Non-Energy Use|Solids|Biomass",
@@ -1780,7 +1820,8 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Industry excl Non-Energy Use|Heat"],
                     inplace=True,
                 )
@@ -1794,7 +1835,8 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Industry excl Non-Energy Use|Solar"],
                     inplace=True,
                 )
@@ -1832,10 +1874,11 @@ def report(context, scenario):  # noqa: C901
                 "in|final|*|sp_meth_I|*",
             ]
 
-            df_final_energy.filter(variable=exclude, keep=False, inplace=True)
+            _filter(df_final_energy, variable=exclude, keep=False, inplace=True)
 
             if c == "solar":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "out|useful|i_therm|solar_i|M1",
                         "out|useful_steel|lt_heat|solar_steel|*",
@@ -1847,7 +1890,8 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "electr":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|electr|*",
                         "in|secondary|electr|NH3_to_N_fertil|M1",
@@ -1869,7 +1913,8 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "gas":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|gas|*",
                         "in|secondary|gas|gas_NH3|M1",
@@ -1879,14 +1924,16 @@ def report(context, scenario):  # noqa: C901
                     ],
                     inplace=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["in|final|gas|gas_processing_petro|*"],
                     keep=False,
                     inplace=True,
                 )
             # Include gasoil and naphtha feedstock
             if c == "liquids":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|ethanol|*",
                         "in|final|fueloil|*",
@@ -1902,7 +1949,8 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "solids":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|biomass|*",
                         "in|final|coal|*",
@@ -1919,7 +1967,8 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "hydrogen":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|hydrogen|*",
                         "in|secondary|hydrogen|meth_h2|feedstock",
@@ -1927,9 +1976,10 @@ def report(context, scenario):  # noqa: C901
                     inplace=True,
                 )
             if c == "heat":
-                df_final_energy.filter(variable=["in|final|d_heat|*"], inplace=True)
+                _filter(df_final_energy, variable=["in|final|d_heat|*"], inplace=True)
             if c == "all":
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "in|final|*",
                         "in|secondary|coal|coal_NH3|M1",
@@ -2004,7 +2054,7 @@ def report(context, scenario):  # noqa: C901
             ]
             aux2_df = aux2_df[aux2_df["variable"].isin(var_sectors)]
 
-            df_final_energy.filter(variable=var_sectors, inplace=True)
+            _filter(df_final_energy, variable=var_sectors, inplace=True)
 
             # Aggregate
 
@@ -2014,8 +2064,10 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
-                    variable=["Final Energy|Industry|Solar"], inplace=True
+                _filter(
+                    df_final_energy,
+                    variable=["Final Energy|Industry|Solar"],
+                    inplace=True,
                 )
                 df_final_energy.convert_unit(
                     "GWa", to="EJ/yr", factor=0.03154, inplace=True
@@ -2027,7 +2079,9 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(variable=["Final Energy|Industry"], inplace=True)
+                _filter(
+                    df_final_energy, variable=["Final Energy|Industry"], inplace=True
+                )
                 df_final_energy.convert_unit(
                     "GWa", to="EJ/yr", factor=0.03154, inplace=True
                 )
@@ -2038,7 +2092,8 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Industry|Electricity"],
                     inplace=True,
                 )
@@ -2058,7 +2113,8 @@ def report(context, scenario):  # noqa: C901
                     append=True,
                 )
 
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Industry|Gases"],
                     inplace=True,
                 )
@@ -2073,7 +2129,8 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Industry|Hydrogen"],
                     inplace=True,
                 )
@@ -2142,7 +2199,8 @@ def report(context, scenario):  # noqa: C901
                     append=True,
                 )
 
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "Final Energy|Industry|Liquids",
                         "Final Energy|Industry|Liquids|Oil",
@@ -2183,7 +2241,8 @@ def report(context, scenario):  # noqa: C901
                     components=filter_vars,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=[
                         "Final Energy|Industry|Solids",
                         "Final Energy|Industry|Solids|Biomass",
@@ -2201,7 +2260,8 @@ def report(context, scenario):  # noqa: C901
                     components=var_sectors,
                     append=True,
                 )
-                df_final_energy.filter(
+                _filter(
+                    df_final_energy,
                     variable=["Final Energy|Industry|Heat"],
                     inplace=True,
                 )
@@ -2240,7 +2300,8 @@ def report(context, scenario):  # noqa: C901
             ]
 
             df_final_energy.filter(region=r, year=years, inplace=True)
-            df_final_energy.filter(
+            _filter(
+                df_final_energy,
                 variable=[
                     "in|final|*",
                     "out|useful|i_therm|solar_i|M1",
@@ -2266,7 +2327,7 @@ def report(context, scenario):  # noqa: C901
                 ],
                 inplace=True,
             )
-            df_final_energy.filter(variable=exclude, keep=False, inplace=True)
+            _filter(df_final_energy, variable=exclude, keep=False, inplace=True)
 
             # Decompose the pyam table into pandas data frame
 
@@ -2529,7 +2590,7 @@ def report(context, scenario):  # noqa: C901
                         aggregate_list[i], components=var_list[i], append=True
                     )
 
-            df_final_energy.filter(variable=aggregate_list, inplace=True)
+            _filter(df_final_energy, variable=aggregate_list, inplace=True)
             df_final_energy.convert_unit(
                 "GWa", to="EJ/yr", factor=0.03154, inplace=True
             )
@@ -2572,7 +2633,7 @@ def report(context, scenario):  # noqa: C901
             ]
 
             df_final_energy.filter(region=r, year=years, inplace=True)
-            df_final_energy.filter(variable=include, inplace=True)
+            _filter(df_final_energy, variable=include, inplace=True)
 
             # Decompose the pyam table into pandas data frame
 
@@ -2782,7 +2843,7 @@ def report(context, scenario):  # noqa: C901
                         aggregate_list[i], components=var_list[i], append=True
                     )
 
-            df_final_energy.filter(variable=aggregate_list, inplace=True)
+            _filter(df_final_energy, variable=aggregate_list, inplace=True)
             df_final_energy.convert_unit(
                 "GWa", to="EJ/yr", factor=0.03154, inplace=True
             )
@@ -2863,8 +2924,8 @@ def report(context, scenario):  # noqa: C901
             ]
 
             df_final_energy.filter(region=r, year=years, inplace=True)
-            df_final_energy.filter(variable=include, inplace=True)
-            df_final_energy.filter(variable=exclude, keep=False, inplace=True)
+            _filter(df_final_energy, variable=include, inplace=True)
+            _filter(df_final_energy, variable=exclude, keep=False, inplace=True)
 
             # Decompose the pyam table into pandas data frame
 
@@ -3125,7 +3186,7 @@ def report(context, scenario):  # noqa: C901
 
                 i = i + 1
 
-            df_final_energy.filter(variable=aggregate_list, inplace=True)
+            _filter(df_final_energy, variable=aggregate_list, inplace=True)
             df_final_energy.convert_unit(
                 "GWa", to="EJ/yr", factor=0.03154, inplace=True
             )
@@ -3189,7 +3250,7 @@ def report(context, scenario):  # noqa: C901
                     "emis|CO2|meth_exp|M1",
                 ]
 
-                df_emi.filter(variable=exclude, keep=False, inplace=True)
+                _filter(df_emi, variable=exclude, keep=False, inplace=True)
 
                 # Filter the necessary variables
 
@@ -3220,7 +3281,7 @@ def report(context, scenario):  # noqa: C901
                         "emis|CO2_industry|*",
                     ]
 
-                    df_emi.filter(variable=emi_filter, inplace=True)
+                    _filter(df_emi, variable=emi_filter, inplace=True)
                 else:
                     emi_filter = ["emis|" + e + "|*"]
 
@@ -3235,8 +3296,8 @@ def report(context, scenario):  # noqa: C901
                         "emis|CO2|meth_ng_ccs|*",
                     ]
 
-                    df_emi.filter(variable=exclude, keep=False, inplace=True)
-                    df_emi.filter(variable=emi_filter, inplace=True)
+                    _filter(df_emi, variable=exclude, keep=False, inplace=True)
+                    _filter(df_emi, variable=emi_filter, inplace=True)
 
                 # Perform some specific unit conversions
                 if (e == "CO2") | (e == "CO2_industry"):
@@ -3521,7 +3582,7 @@ def report(context, scenario):  # noqa: C901
                         )
 
                     fig, ax1 = plt.subplots(1, 1, figsize=(10, 10))
-                    df_emi.filter(variable=aggregate_list, inplace=True)
+                    _filter(df_emi, variable=aggregate_list, inplace=True)
                     df_emi.plot.stack(ax=ax1)
 
                     df_final.append(df_emi, inplace=True)
@@ -3922,7 +3983,8 @@ def report(context, scenario):  # noqa: C901
                     filt_total, filt_other, var_name_power, axis="variable", append=True
                 )
 
-                df_scrap_by_sector.filter(
+                _filter(
+                    df_scrap_by_sector,
                     variable=[
                         # var_name_buildings,
                         var_name_other,
@@ -3935,7 +3997,8 @@ def report(context, scenario):  # noqa: C901
                     var_name_power, components=[filt_total], append=True
                 )
 
-                df_scrap_by_sector.filter(
+                _filter(
+                    df_scrap_by_sector,
                     variable=[
                         # var_name_buildings,
                         var_name_power
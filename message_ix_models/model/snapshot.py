@@ -1,12 +1,19 @@
 """Prepare base models from snapshot data."""
 
 import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from message_ix import Scenario
-from message_ix.models import MACRO
+from message_ix.models import MACRO, MESSAGE
 from tqdm import tqdm
 
 from message_ix_models import Spec
@@ -19,15 +26,20 @@ from .structure import get_codes
 log = logging.getLogger(__name__)
 
 
-def unpack(path: Path) -> Path:
+def unpack(path: Path, jobs: Optional[int] = None) -> Path:
     """Unpack :ref:`ixmp-format Excel file <ixmp:excel-data-format>` at `path`.
 
     The file is unpacked into a directory with the same name stem as the file (that is,
     without the :file:`.xlsx` suffix). In this directory are created:
 
-    - One :file:`.csv.gz` file for each MESSAGE and/or MACRO parameter.
+    - One :file:`.parquet` file for each MESSAGE and/or MACRO parameter. Dimensions
+      indexed by the set ``year`` are stored as integers; other dimensions and units as
+      strings; and values as floating-point numbers.
     - One file :file:`sets.xlsx` with only the :mod:`ixmp` sets, and no parameter data.
 
+    The Excel file is read in streaming (read-only) mode. Parameter sheets are
+    converted in up to `jobs` worker processes; by default, one per CPU.
+
     If the files exist, they are not updated.
     To force re-unpacking, delete the files.
 
@@ -36,63 +48,153 @@ def unpack(path: Path) -> Path:
     Path
         Path to the directory containing the unpacked files.
     """
+    from openpyxl import load_workbook
+
     assert path.suffix == ".xlsx"
     base = path.with_suffix("")
     base.mkdir(exist_ok=True)
 
-    # Get item name -> ixmp type mapping as a pd.Series
-    xf = pd.ExcelFile(path, engine="openpyxl")
-    name_type = xf.parse("ix_type_mapping")
-
-    # Copied exactly from ixmp.backend.io
-    def parse_item_sheets(name):
-        """Read data for item *name*, possibly across multiple sheets."""
-        dfs = [xf.parse(name)]
-
-        # Collect data from repeated sheets due to max_row limit
-        for x in filter(lambda n: n.startswith(name + "("), xf.sheet_names):
-            dfs.append(xf.parse(x))  # pragma: no cover
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        # Get item name -> ixmp type mapping as a pd.Series
+        name_type = _read_item(wb, "ix_type_mapping").to_pandas()
+
+        # Write set data
+        sets_path = base.joinpath("sets.xlsx")
+        sets_path.unlink(missing_ok=True)
+        with pd.ExcelWriter(sets_path, engine="openpyxl") as ew:
+            for name in name_type.query("ix_type == 'set'")["item"]:
+                _read_item(wb, name).to_pandas().to_excel(
+                    ew, sheet_name=name, index=False
+                )
+            name_type.query("ix_type == 'set'").to_excel(
+                ew, sheet_name="ix_type_mapping"
+            )
+
+        # Parameters not yet unpacked, and the number of rows in their sheets
+        rows = {
+            name: sum(wb[s].max_row or 0 for s in _sheet_names(wb, name))
+            for name in name_type.query("ix_type == 'par'")["item"]
+            if not base.joinpath(f"{name}.parquet").exists()
+        }
+    finally:
+        wb.close()
+
+    # Distribute parameters among jobs, largest first, to balance the number of rows
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(rows)))
+    groups: list[list[str]] = [[] for _ in range(jobs)]
+    size = [0] * jobs
+    for name in sorted(rows, key=rows.__getitem__, reverse=True):
+        i = size.index(min(size))
+        groups[i].append(name)
+        size[i] += rows[name]
+
+    if jobs == 1:
+        _unpack_items(path, base, groups[0])
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from multiprocessing import get_context
+
+        with ProcessPoolExecutor(jobs, mp_context=get_context("spawn")) as pool:
+            futures = [pool.submit(_unpack_items, path, base, g) for g in groups]
+            for f in tqdm(as_completed(futures), total=len(futures)):
+                f.result()
 
-        # Concatenate once and return
-        return pd.concat(dfs, axis=0, ignore_index=True)
+    return base
 
-    sets_path = base.joinpath("sets.xlsx")
-    sets_path.unlink(missing_ok=True)
 
-    with pd.ExcelWriter(sets_path, engine="openpyxl") as ew:
-        for _, (name, ix_type) in tqdm(name_type.iterrows()):
-            item_path = base.joinpath(f"{name}.csv.gz")
-            if item_path.exists():
-                continue
+def _sheet_names(wb, name: str) -> list[str]:
+    """Return names of sheets in `wb` with data for item `name`.
 
-            df = parse_item_sheets(name)
+    Data for one item may be split across repeated sheets due to the limit on the
+    number of rows in a sheet.
+    """
+    return [name] + [n for n in wb.sheetnames if n.startswith(name + "(")]
 
-            if ix_type == "set":
-                df.to_excel(ew, sheet_name=name, index=False)
-            else:  # pragma: no cover
-                df.to_csv(item_path, index=False)
 
-        name_type.query("ix_type == 'set'").to_excel(ew, sheet_name="ix_type_mapping")
+def _read_item(wb, name: str) -> pa.Table:
+    """Read data for item `name` from the read-only workbook `wb`.
 
-    return base
+    Columns for dimensions indexed by the set ``year`` are converted to integers;
+    "value" to floating-point numbers; and all others to strings.
+    """
+    columns: list[str] = []
+    data: list[list] = []
+    for sheet in _sheet_names(wb, name):
+        rows = wb[sheet].iter_rows(values_only=True)
+        header = [h for h in next(rows, ()) if h is not None]
+        if not columns:
+            columns = header
+            data = [[] for _ in columns]
+        for row in rows:
+            for values, v in zip(data, row):
+                values.append(v)
+
+    try:
+        item = MESSAGE.items.get(name) or MACRO.items[name]
+        year = {d for d, c in zip(item.dims or item.coords, item.coords) if c == "year"}
+    except (AttributeError, KeyError):
+        year = {c for c in columns if c == "year" or c.startswith("year_")}
+
+    arrays = []
+    for column, values in zip(columns, data):
+        strings = pa.array([None if v is None else str(v) for v in values], pa.string())
+        if column == "value":
+            arrays.append(pc.cast(strings, pa.float64()))
+        elif column in year:
+            arrays.append(pc.cast(strings, pa.int64()))
+        else:
+            arrays.append(strings)
+
+    return pa.Table.from_arrays(arrays, names=columns)
+
+
+def _unpack_items(path: Path, base: Path, names: list[str]) -> None:
+    """Convert the data for items `names` in the Excel file at `path` to Parquet."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for name in names:
+            table = _read_item(wb, name)
+            # Write to a temporary file, so that an interrupted write is not reused
+            tmp = base.joinpath(f"{name}.parquet.{os.getpid()}")
+            pq.write_table(table, tmp)
+            tmp.replace(base.joinpath(f"{name}.parquet"))
+    finally:
+        wb.close()
+
+
+def _read_parquet(path: Path) -> tuple[str, pd.DataFrame]:
+    return path.name.split(".")[0], pq.read_table(path).to_pandas()
 
 
 def read_excel(scenario: Scenario, path: Path) -> None:
-    """Similar to :meth:`.Scenario.read_excel`, but using :func:`unpack`."""
+    """Similar to :meth:`.Scenario.read_excel`, but using :func:`unpack`.
+
+    Each parameter data file is read in a background thread while the data from the
+    previous file are added to `scenario`.
+    """
     base = unpack(path)
 
     scenario.read_excel(path=base.joinpath("sets.xlsx"))
 
     parameters = set(scenario.par_list())
-
-    with scenario.transact(f"Read snapshot data from {path}"):
-        for p in base.glob("*.csv.gz"):
-            name = p.name.split(".")[0]
-
-            if name not in parameters:
-                continue  # Variable or equation data: don't read
-
-            data = pd.read_csv(p)
+    # Variable or equation data: don't read
+    paths = iter(p for p in sorted(base.glob("*.parquet")) if p.stem in parameters)
+
+    with (
+        scenario.transact(f"Read snapshot data from {path}"),
+        ThreadPoolExecutor(max_workers=1) as pool,
+    ):
+        # Read up to 2 files ahead
+        pending = deque(pool.submit(_read_parquet, p) for p in islice(paths, 2))
+        while pending:
+            name, data = pending.popleft().result()
+            pending.extend(pool.submit(_read_parquet, p) for p in islice(paths, 1))
+
+            if not len(data):
+                continue
 
             # Correct units
             if name == "inv_cost":
@@ -4,9 +4,12 @@ from collections import ChainMap
 from collections.abc import Mapping, MutableMapping
 from copy import copy
 from functools import cache
+from hashlib import blake2b
+from importlib.metadata import version
 from itertools import product
 
 import click
+import genno.caching
 import pandas as pd
 import pycountry
 import xarray as xr
@@ -14,6 +17,7 @@ from iam_units import registry
 from sdmx.model.v21 import Annotation, Code, Codelist
 
 from message_ix_models.util import load_package_data, package_data_path
+from message_ix_models.util.cache import cached
 from message_ix_models.util.sdmx import as_codes
 
 log = logging.getLogger(__name__)
@@ -61,6 +65,58 @@ def get_codes(name: str) -> list[Code]:
         Every Code has :attr:`id`, :attr:`name`, :attr:`description`, and
         :attr:`annotations` attributes. Calling :func:`str` on a code returns its
         :attr:`id`.
+
+    See also
+    --------
+    .cached
+        The processed codes are also cached on disk, keyed on the contents of the file
+        and other inputs, so other Python processes load them from the cache.
+    """
+    # Don't log a cache hit or miss each time a code list is loaded
+    cache_log = logging.getLogger(cached.__module__)
+    cache_log.addFilter(_quiet)
+    try:
+        return _get_codes(name, _digest(name))
+    finally:
+        cache_log.removeFilter(_quiet)
+
+
+def _quiet(record: logging.LogRecord) -> bool:
+    """Log filter for :func:`get_codes` that drops messages below WARNING level."""
+    return record.levelno >= logging.WARNING
+
+
+def _digest(name: str) -> str:
+    """Return a digest of the inputs to :func:`_get_codes` for `name`.
+
+    This includes the contents of the package data file; the versions of
+    :mod:`message_ix_models` and :mod:`sdmx`; for node code lists, the version of
+    :mod:`pycountry`; and the code of the functions that process the codes.
+    """
+    import message_ix_models
+
+    h = blake2b(package_data_path(name).with_suffix(".yaml").read_bytes())
+    h.update(message_ix_models.__version__.encode())
+    h.update(version("sdmx1").encode())
+    h.update(genno.caching.hash_code(as_codes).encode())
+    if "node" in name:
+        h.update(version("pycountry").encode())
+    elif name in ("commodity", "technology"):
+        for func in (
+            process_commodity_codes,
+            process_technology_codes,
+            process_units_anno,
+        ):
+            h.update(genno.caching.hash_code(func).encode())
+    return h.hexdigest()
+
+
+@cached
+def _get_codes(name: str, digest: str) -> list[Code]:
+    """Read and process codes for :func:`get_codes`.
+
+    The result is cached on disk, so other Python processes load it instead of repeating
+    this work. `digest` from :func:`_digest` is part of the cache key.
     """
     # Raw contents of the config file
     config = load_package_data(name)
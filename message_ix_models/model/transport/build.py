@@ -1,22 +1,29 @@
 """Build MESSAGEix-Transport on a base model."""
 
 import logging
+import sys
+import threading
+from contextlib import nullcontext
 from functools import partial
 from importlib import import_module
 from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import genno
 import pandas as pd
+from dask.callbacks import Callback
+from dask.sizeof import sizeof
 from genno import Computer, KeyExistsError, quote
 from message_ix import Scenario
 
 from message_ix_models import Context, ScenarioInfo
 from message_ix_models.model import bare, build
 from message_ix_models.model.structure import get_codelist
-from message_ix_models.util import minimum_version
+from message_ix_models.util import minimum_version, package_data_path
 from message_ix_models.util._logging import mark_time
+from message_ix_models.util.cache import persist
 from message_ix_models.util.graphviz import HAS_GRAPHVIZ
 
 from . import Config
@@ -552,6 +559,177 @@ def get_computer(
     return c
 
 
+def compute(c: Computer, key, config: Config, path: Optional[Path] = None) -> Any:
+    """Compute `key` in `c` with the scheduler given by `config`.
+
+    This is similar to :meth:`genno.Computer.get`, except:
+
+    - If :attr:`.Config.build_scheduler` is "threads", independent tasks are computed
+      concurrently in :attr:`.Config.build_jobs` threads. Tasks that use the
+      ``scenario`` directly are run one at a time, since access to a
+      :class:`.Scenario` is not thread-safe.
+    - Values of the keys in :attr:`.Config.build_persist` are cached on disk, or
+      loaded from the cache if they were computed by an earlier build with identical
+      inputs; see :func:`.util.cache.persist`.
+    - If :attr:`.Config.build_profile` is :any:`True`, a profile is written to `path`
+      as CSV with one row per task and the columns:
+
+      - ``key``, ``worker``: the key computed and the thread which computed it.
+      - ``start``, ``end``, ``duration``: times in seconds since the first task
+        started.
+      - ``size``: approximate size of the result in bytes, as given by
+        :func:`dask.sizeof.sizeof`.
+      - ``max_rss``: peak memory use of the process in bytes, as of the end of the
+        task. On Windows, this is not available and is empty.
+      - ``critical``: :any:`True` for tasks on the critical path, that is the chain
+        of tasks, ending with `key`, each of which was the last of the inputs to the
+        next task to finish.
+    """
+    from threading import Lock
+
+    from dask.core import get_dependencies, istask
+    from dask.optimization import cull
+    from genno.core.computer import ComputationError
+
+    key = c.check_keys(key)[0]
+
+    # Same as in genno.Computer.get()
+    c.graph["config"] = quote(c.graph.get("config", dict()))
+    try:
+        dsk, _ = cull(c.graph, key)
+
+        if config.build_persist:
+            # Output paths in "config" do not affect the values of any keys
+            cfg = c.graph["config"][0].data
+            cfg = {k: v for k, v in cfg.items() if not isinstance(v, Path)}
+            dsk = persist(dsk, config.build_persist, substitute={"config": cfg})
+            # Omit the inputs of keys loaded from cache
+            dsk, _ = cull(dsk, key)
+
+        dsk = dict(dsk)
+
+        if config.build_scheduler == "threads":
+            from dask.threaded import get as get_threaded
+
+            get: Callable = partial(get_threaded, num_workers=config.build_jobs)
+
+            # Serialize tasks that use the scenario
+            lock = Lock()
+            for k, task in dsk.items():
+                if istask(task) and "scenario" in get_dependencies(dsk, k):
+                    dsk[k] = (partial(_locked, lock, task[0]),) + task[1:]
+        else:
+            from dask.local import get_sync
+
+            get = get_sync
+
+        profile = _Profile(dsk) if config.build_profile else nullcontext()
+        with profile:
+            result = get(dsk, str(key))
+    except Exception as exc:
+        raise ComputationError(exc) from None
+    finally:
+        c.graph["config"] = c.graph["config"][0].data
+
+    if isinstance(profile, _Profile) and path:
+        profile.write(path, str(key))
+
+    return result
+
+
+def _input_paths(c: Computer, key) -> list[Path]:
+    """Return paths of existing files read by tasks needed to compute `key` in `c`.
+
+    These include arguments to :func:`.load_file` and the :attr:`path` of
+    :class:`.ExoDataSource` instances, including any private or local data.
+    """
+    from dask.core import literal
+    from dask.optimization import cull
+
+    dsk, _ = cull({k: v for k, v in c.graph.items() if k != "config"}, key)
+
+    result, to_visit = set(), list(dsk.values())
+    while to_visit:
+        obj = to_visit.pop()
+        if isinstance(obj, (list, tuple)):
+            to_visit.extend(obj)
+        elif isinstance(obj, literal):
+            to_visit.append(obj.data)
+        elif isinstance(obj, partial):
+            to_visit.extend(obj.args + tuple(obj.keywords.values()))
+        elif isinstance(obj, Path):
+            result.add(obj)
+        elif isinstance(getattr(obj, "path", None), Path):
+            result.add(obj.path)
+
+    return sorted(p for p in result if p.exists())
+
+
+def _locked(lock, func, *args, **kwargs):
+    with lock:
+        return func(*args, **kwargs)
+
+
+def _max_rss() -> Optional[int]:
+    """Return the peak memory use of the current process, in bytes."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    # Units are bytes on macOS, kilobytes elsewhere
+    factor = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * factor
+
+
+class _Profile(Callback):
+    """Record start and end time, result size, and memory use of each task."""
+
+    def __init__(self, dsk):
+        super().__init__()
+        self.dsk = dsk
+        self.records: dict[str, dict] = {}
+
+    def _pretask(self, key, dsk, state):
+        self.records[key] = dict(
+            key=str(key), worker=threading.get_ident(), start=perf_counter()
+        )
+
+    def _posttask(self, key, result, dsk, state, worker_id):
+        self.records[key].update(
+            end=perf_counter(), size=sizeof(result), max_rss=_max_rss()
+        )
+
+    def write(self, path: Path, key: str) -> None:
+        from dask.core import get_dependencies
+
+        df = pd.DataFrame(list(self.records.values())).set_index("key")
+        df[["start", "end"]] -= df["start"].min()
+        df["duration"] = df["end"] - df["start"]
+        df["worker"] = df["worker"].rank(method="dense").astype(int) - 1
+
+        # Critical path: from `key`, follow the input that finished last
+        df["critical"] = False
+        k: Optional[str] = key
+        while k is not None and k in df.index:
+            df.loc[k, "critical"] = True
+            inputs = [str(i) for i in get_dependencies(self.dsk, k)]
+            ends = df["end"].reindex(inputs).dropna()
+            k = ends.idxmax() if len(ends) else None
+
+        df = df.sort_values("start")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(path)
+
+        log.info(
+            f"Computed {len(df)} tasks in {df['end'].max():.1f} s; profile written to "
+            f"{path}"
+        )
+        log.info("Critical path:")
+        for k, row in df[df["critical"]].iterrows():
+            log.info(f"{row['duration']:8.3f} s  {k}")
+
+
 def main(
     context: Context,
     scenario: Scenario,
@@ -592,13 +770,33 @@ def main(
 
     def _add_data(s, **kw):
         assert s is c.graph["scenario"]
-        result = c.get("add transport data")
+        result = compute(
+            c,
+            "add transport data",
+            context.transport,
+            context.get_local_path("transport", "build-profile.csv"),
+        )
         # For calls to add_par_data(), int() are returned with number of observations
         log.info(f"Added {sum_numeric(result)} total obs")
 
     if dry_run:
         return c.get("transport build debug")
 
+    # Reuse the result of a previous build with identical inputs, if enabled
+    cache = build.BuildCache(
+        context,
+        scenario,
+        context.transport.spec,
+        paths=[package_data_path("transport")] + _input_paths(c, "add transport data"),
+        options=options,
+        regions=context.model.regions,
+        years=context.model.years,
+    )
+    if cached := cache.get():
+        cached.set_as_default()
+        log.info(f"Built {cached.url} from cache and set as default version")
+        return cached
+
     # First strip existing emissions data
     strip_emissions_data(scenario, context)
 
@@ -613,6 +811,8 @@ def main(
 
     mark_time()
 
+    cache.put(scenario)
+
     scenario.set_as_default()
     log.info(f"Built {scenario.url} and set as default version")
 
@@ -50,6 +50,34 @@ class Config(ConfigHelper):
     #: Information about the base model.
     base_model_info: ScenarioInfo = field(default_factory=ScenarioInfo)
 
+    #: Number of worker threads used to compute the build graph, if
+    #: :attr:`build_scheduler` is "threads". Default: the number of CPUs.
+    build_jobs: Optional[int] = None
+
+    #: Keys in the build graph whose computed values are cached on disk and reused by
+    #: later builds with identical inputs, for instance other scenarios that share
+    #: the same GDP and population data. Keys that depend on the target
+    #: :class:`.Scenario` are not cached. See :func:`.util.cache.persist`.
+    build_persist: list[str] = field(
+        default_factory=lambda: [
+            "GDP:n-y:PPP+capita",
+            "energy:c-nl-t:iea+0",
+            "fuel economy:n-t-y:LDV",
+            "mode share:n-t-y",
+            "pdt:n-y-t",
+        ]
+    )
+
+    #: If :any:`True`, write a file :file:`transport/build-profile.csv` in the local
+    #: data directory with the run time, result size, and peak memory use of each
+    #: task in the build graph, and the tasks on its critical path. See
+    #: :func:`.transport.build.compute`.
+    build_profile: bool = False
+
+    #: Scheduler used to compute the build graph: either "sync" (in sequence, in the
+    #: current thread) or "threads" (concurrently, in :attr:`build_jobs` threads).
+    build_scheduler: Literal["sync", "threads"] = "sync"
+
     #: Values for constraints.
     #:
     #: "LDV growth_activity_lo", "LDV growth_activity_up"
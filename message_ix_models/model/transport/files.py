@@ -4,7 +4,7 @@ See :ref:`transport-data-files` for documentation of the data flows in :data:`FI
 """
 
 import logging
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union, cast
 
@@ -16,6 +16,8 @@ from message_ix_models.util.ixmp import get_reversed_rename_dims
 from .key import pdt_cap
 
 if TYPE_CHECKING:
+    from os import PathLike
+
     import genno
     import pint
     import sdmx.message
@@ -65,34 +67,14 @@ class ExogenousDataFile:
         succeed.
     """
 
-    #: :class:`sdmx.Dataflow <sdmx.model.common.BaseDataflowDefinition>` describing the
-    #: input data flow.
-    df: "sdmx.model.common.BaseDataflow"
-
-    # Access to annotations of DFD
-    @property
-    def key(self) -> Key:
-        """:class:`genno.Key`, including preferred dimensions."""
-        return Key(str(self.df.get_annotation(id="genno-key").text))
+    #: :class:`genno.Key`, including preferred dimensions.
+    key: Key
 
-    @property
-    def path(self) -> Path:
-        """Path fragment for the location of a file containing the data."""
-        return Path(str(self.df.get_annotation(id="file-path").text))
+    #: Path fragment for the location of a file containing the data.
+    path: Path
 
-    @property
-    def required(self) -> bool:
-        """:any:`True` if the data must be present for :func:`.transport.build.main`."""
-        return self.df.eval_annotation(id="required-for-build")
-
-    @property
-    def units(self) -> "pint.Unit":
-        """Preferred units."""
-        import pint
-
-        return pint.get_application_registry().Unit(
-            self.df.eval_annotation(id="preferred-units")
-        )
+    #: :any:`True` if the data must be present for :func:`.transport.build.main`.
+    required: bool
 
     def __init__(
         self,
@@ -105,28 +87,12 @@ class ExogenousDataFile:
         description: Optional[str] = None,
         required: bool = True,
     ):
-        import pint
-        from sdmx.model.common import Annotation
-        from sdmx.model.v21 import DataflowDefinition, DataStructureDefinition
-
-        # Collection of annotations for the data flow
-        anno = [Annotation(id="required-for-build", text=repr(required))]
-
         # Handle `path` argument
         if isinstance(path, str):
             _path = Path(path)
         elif path:
             _path = Path(*path)
 
-        # Parse and store units
-        ureg = pint.get_application_registry()
-        try:
-            units = ureg.Unit(units)
-        except Exception as e:
-            log.info(f"Replace units {units!r} with 'dimensionless' due to {e}")
-            units = ureg.dimensionless
-        anno.append(Annotation(id="preferred-units", text=f"{units}"))
-
         if not key:
             # Determine from file path
             key = Key(" ".join(_path.parts).replace("-", " "), dims or (), "exo")
@@ -137,10 +103,45 @@ class ExogenousDataFile:
             if path is None:
                 _path = Path(key.name.replace(" ", "-"))
 
-        anno.append(Annotation(id="genno-key", text=str(key)))
+        self.key = key
+        self.path = _path.with_suffix(".csv")
+        self.required = required
+
+        # Other arguments, used to construct `df` on first access
+        self._name = name
+        self._units = units
+        self._description = description
 
-        _path = _path.with_suffix(".csv")
-        anno.append(Annotation(id="file-path", text=str(_path)))
+    @cached_property
+    def units(self) -> "pint.Unit":
+        """Preferred units."""
+        import pint
+
+        ureg = pint.get_application_registry()
+        try:
+            return ureg.Unit(self._units)
+        except Exception as e:
+            log.info(f"Replace units {self._units!r} with 'dimensionless' due to {e}")
+            return ureg.dimensionless
+
+    @cached_property
+    def df(self) -> "sdmx.model.common.BaseDataflow":
+        """:class:`sdmx.Dataflow <sdmx.model.common.BaseDataflowDefinition>` describing
+        the input data flow.
+
+        This and its data structure are created on first access, so that importing this
+        module does not require :mod:`sdmx` structures or the :mod:`pint` registry.
+        """
+        from sdmx.model.common import Annotation
+        from sdmx.model.v21 import DataflowDefinition, DataStructureDefinition
+
+        # Collection of annotations for the data flow
+        anno = [
+            Annotation(id="required-for-build", text=repr(self.required)),
+            Annotation(id="preferred-units", text=f"{self.units}"),
+            Annotation(id="genno-key", text=str(self.key)),
+            Annotation(id="file-path", text=str(self.path)),
+        ]
 
         # Retrieve the shared concept scheme
         common = common_structures()
@@ -154,7 +155,7 @@ class ExogenousDataFile:
         )
 
         # SDMX IDs for the data flow and data structure
-        name_for_id = key.name.upper().replace(" ", "_")
+        name_for_id = self.key.name.upper().replace(" ", "_")
         df_id = f"DF_{name_for_id}"
         ds_id = f"DS_{name_for_id}"
 
@@ -163,7 +164,7 @@ class ExogenousDataFile:
 
         # Add dimensions
         _rrd = get_reversed_rename_dims()
-        for dim in key.dims:
+        for dim in self.key.dims:
             # Symbol ('n') → Dimension ID ('node') → upper case
             dim_id = _rrd.get(dim, dim).upper()
             # Add to the concept scheme
@@ -171,15 +172,20 @@ class ExogenousDataFile:
             # Add the dimension to the DSD
             dsd.dimensions.getdefault(id=dim_id, concept_identity=concept)
 
-        if description is not None:
-            desc = f"{description.strip()}\n\n"
+        if self._description is not None:
+            desc = f"{self._description.strip()}\n\n"
         else:
             desc = ""
         desc += "Input data for MESSAGEix-Transport."
 
-        # Create and store a data flow definition
-        self.df = DataflowDefinition(
-            id=df_id, **kw, name=name, description=desc, structure=dsd, annotations=anno
+        # Create the data flow definition
+        return DataflowDefinition(
+            id=df_id,
+            **kw,
+            name=self._name,
+            description=desc,
+            structure=dsd,
+            annotations=anno,
         )
 
     # Does nothing except ensure callable(…) == True for inspection by genno
@@ -286,10 +292,13 @@ def common_structures() -> "sdmx.message.StructureMessage":
     return sm
 
 
-def collect_structures() -> "sdmx.message.StructureMessage":
+def collect_structures(
+    base_dir: Optional["PathLike"] = None,
+) -> "sdmx.message.StructureMessage":
     """Collect all SDMX data structures from :data:`FILES` and store.
 
-    The structural metadata are written to :file:`transport-in.xml`.
+    The structural metadata are written to :file:`transport-in.xml` in `base_dir`;
+    by default, the package data directory. See :func:`.util.sdmx.write`.
     """
     from message_ix_models.util.sdmx import write
 
@@ -300,16 +309,22 @@ def collect_structures() -> "sdmx.message.StructureMessage":
         sm.add(file.df)
         sm.add(file.df.structure)
 
-    write(sm, basename="transport-in")
+    write(sm, base_dir=base_dir, basename="transport-in")
 
     return sm
 
 
-def read_structures() -> "sdmx.message.StructureMessage":
-    """Read structural metadata from :file:`transport-in.xml`."""
+def read_structures(
+    base_dir: Optional["PathLike"] = None,
+) -> "sdmx.message.StructureMessage":
+    """Read structural metadata from :file:`transport-in.xml` in `base_dir`.
+
+    By default, the file in the package data directory is read.
+    """
     import sdmx
 
-    with open(package_data_path("sdmx", "transport-in.xml"), "rb") as f:
+    path = Path(base_dir or package_data_path("sdmx")).joinpath("transport-in.xml")
+    with open(path, "rb") as f:
         return cast("sdmx.message.StructureMessage", sdmx.read_sdmx(f))
 
 
@@ -409,6 +409,12 @@ def map_basin(context: Context) -> Mapping[str, ScenarioInfo]:
 def main(context: Context, scenario, **options):
     """Set up MESSAGEix-Nexus on `scenario`.
 
+    Returns
+    -------
+    message_ix.Scenario
+        `scenario`, or—if :attr:`.Config.build_cache` is :obj:`True` and the same
+        build was done before—a clone of the previous result. See :class:`.BuildCache`.
+
     See also
     --------
     add_data
@@ -419,18 +425,38 @@ def main(context: Context, scenario, **options):
 
     log.info("Set up MESSAGEix-Nexus")
 
-    if context.nexus_set == "nexus":
-        # Add water balance
-        spec = map_basin(context)
-
-        # Apply the structural changes AND add the data
-        build.apply_spec(scenario, spec, **options)
+    # Water balance
+    spec = map_basin(context) if context.nexus_set == "nexus" else None
 
     # Core water structure
     spec1 = get_spec(context)
 
+    # Reuse the result of a previous build with identical inputs, if enabled
+    cache = build.BuildCache(
+        context,
+        scenario,
+        spec1,
+        paths=[package_data_path("water")],
+        basin_spec=spec,
+        options=options,
+        **{
+            k: context.get(k)
+            for k in ("nexus_set", "regions", "type_reg", "RCP", "REL", "SDG", "ssp")
+        },
+    )
+    if cached := cache.get():
+        return cached
+
+    if spec:
+        # Apply the structural changes AND add the data
+        build.apply_spec(scenario, spec, **options)
+
     # Apply the structural changes AND add the data
     build.apply_spec(scenario, spec1, partial(add_data, context=context), **options)
 
+    cache.put(scenario)
+
     # Uncomment to dump for debugging
     # scenario.to_excel('debug.xlsx')
+
+    return scenario
@@ -163,6 +163,8 @@ def nexus(context: "Context", regions, rcps, sdgs, rels, macro=False):
         f"RCP is {context.RCP}. REL is {context.REL}."
     )
 
+    from message_ix_models.model.build import clone_for_build
+
     from .build import main as build
 
     # Determine the output scenario name based on the --url CLI option. If the
@@ -172,8 +174,11 @@ def nexus(context: "Context", regions, rcps, sdgs, rels, macro=False):
 
     # Clone and build
     sc_ref = context.get_scenario()
-    scen = sc_ref.clone(
-        model=output_model_name, scenario=output_scenario_name, keep_solution=False
+    scen = clone_for_build(
+        sc_ref,
+        model=output_model_name,
+        scenario=output_scenario_name,
+        keep_solution=False,
     )
     log.info(
         f" clone from {sc_ref.model}.{sc_ref.scenario} to {scen.model}.{scen.scenario}"
@@ -182,7 +187,7 @@ def nexus(context: "Context", regions, rcps, sdgs, rels, macro=False):
     caseName = scen.model + "__" + scen.scenario + "__v" + str(scen.version)
 
     # Build
-    build(context, scen)
+    scen = build(context, scen)
 
     # Set scenario as default
     scen.set_as_default()
@@ -255,6 +260,8 @@ def cooling(context, regions, rcps, rels):
         f"SSP assumption is {context.ssp}. RCP is {context.RCP}. REL is {context.REL}."
     )
 
+    from message_ix_models.model.build import clone_for_build
+
     from .build import main as build
 
     # Determine the output scenario name based on the --url CLI option. If the
@@ -264,8 +271,11 @@ def cooling(context, regions, rcps, rels):
     output_model_name = context.output_model
 
     # Clone and build
-    scen = context.get_scenario().clone(
-        model=output_model_name, scenario=output_scenario_name, keep_solution=False
+    scen = clone_for_build(
+        context.get_scenario(),
+        model=output_model_name,
+        scenario=output_scenario_name,
+        keep_solution=False,
     )
 
     print(scen.model)
@@ -275,7 +285,7 @@ def cooling(context, regions, rcps, rels):
     caseName = scen.model + "__" + scen.scenario + "__v" + str(scen.version)
 
     # Build
-    build(context, scen)
+    scen = build(context, scen)
 
     # Set scenario as default
     scen.set_as_default()
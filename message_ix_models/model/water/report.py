@@ -1,5 +1,7 @@
 import logging
-from typing import Optional
+import re
+from functools import partial
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
@@ -39,38 +41,85 @@ def reg_index(region):
     return temp
 
 
-def remove_duplicate(data):
-    final_list = []
-    indexes = data[data["Variable"].str.contains("basin_to_reg")].index
-    for i in data["Region"].index:
-        strr = data["Region"][i]
-        oprlist = reg_index(strr)
-        # cover the case of repeated region name (e.g. Zambia|Zambia)
-        if ("|" in strr) and (strr.split("|")[0] == strr.split("|")[1]):
-            final_list.append(strr.split("|")[0])
-        else:
-            if i in indexes:
-                if len(oprlist) > 1:
-                    final_list.append(strr[oprlist[0] + 1 :])
-                elif len(oprlist) == 1 and oprlist[0] > 6:
-                    final_list.append(strr[: oprlist[0]])
-                else:
-                    final_list.append(strr)
-            else:
-                if len(oprlist) > 1:
-                    final_list.append(strr[: oprlist[1]])
-                elif len(oprlist) == 1 and oprlist[0] > 6:
-                    final_list.append(strr[: oprlist[0]])
-                else:
-                    final_list.append(strr)
-    return final_list
+def remove_duplicate(data: pd.DataFrame) -> list[str]:
+    """Shorten region names in `data` that combine several node names.
+
+    The "Region" column of `data` contains names like "Zambia|Zambia" or
+    "R12_AFR|B123"; these are reduced to a single name, depending on the number of
+    separators and on whether the "Variable" refers to a basin-to-region flow.
+    """
+    region = data["Region"].astype(str)
+    parts = region.str.split("|")
+    head, second = parts.str[0], parts.str[1]
+    n = region.str.count(r"\|")
+    basin = data["Variable"].str.contains("basin_to_reg")
+
+    return np.select(
+        [
+            # Repeated region name, e.g. Zambia|Zambia
+            (n > 0) & (head == second),
+            (n > 1) & basin,
+            n > 1,
+            (n == 1) & (region.str.find("|") > 6),
+        ],
+        [head, region.str.partition("|")[2], head + "|" + second, head],
+        default=region,
+    ).tolist()
+
+
+#: Technologies for water and sanitation infrastructure, each prefixed with the
+#: sector: "urban", "rural", or "industry".
+INFRASTRUCTURE = ("recycle", "sewerage", "t_d", "treatment", "unconnected", "untreated")
+TREATMENT_RECYCLING = ("recycle", "sewerage", "treatment")
+UNCONNECTED = ("unconnected", "untreated")
+
+#: Crop types for irrigation technologies.
+IRRIGATION = ("cereal", "oilcrops", "sugarcrops")
+
+#: Reporter keys for data used by :func:`report`, in addition to "message::default".
+KEYS = {
+    "demand": "demand:n-c-l-y-h",
+    "in": "in:nl-t-ya-m-h-no-c-l",
+    "out": "out:nl-t-ya-m-h-nd-c-l",
+}
+
+
+def get_data(rep: Reporter) -> dict[str, Any]:
+    """Compute all data used by :func:`report` from `rep` in a single pass.
+
+    The result contains the :class:`pyam.IamDataFrame` for "message::default" and
+    one :class:`.Quantity` for each of the :data:`KEYS`. Computing these together
+    means that intermediate quantities shared among them, for instance the solution
+    variables ``ACT`` and ``CAP_NEW``, are retrieved from the scenario only once.
+    """
+    names = ["default"] + list(KEYS)
+    key = rep.add(
+        "water::report data",
+        lambda *data: dict(zip(names, data)),
+        "message::default",
+        *KEYS.values(),
+    )
+    return rep.get(key)
+
+
+def select(variables: pd.Index, prefix: str, *names: str) -> list[str]:
+    """Select elements of `variables` that match `prefix` followed by any of `names`.
+
+    If no `names` are given, elements matching `prefix` alone are selected. As in
+    :meth:`pyam.IamDataFrame.filter`, "*" matches any sequence of characters.
+    """
+    patterns = [re.escape(prefix + n).replace(r"\*", ".*") for n in names or ("",)]
+    return variables[variables.str.fullmatch("|".join(patterns))].tolist()
+
+
+def _techs(sector: str, names: tuple[str, ...], suffix: str = "") -> list[str]:
+    return [f"{sector}_{n}{suffix}" for n in names]
 
 
 def report_iam_definition(
     sc: Scenario,
-    rep: Reporter,
+    data: dict[str, Any],
     df_dmd: pd.DataFrame,
-    rep_dm: Reporter,
     report_df: pd.DataFrame,
     suban: bool,
 ) -> pyam.IamDataFrame:
@@ -80,12 +129,10 @@ def report_iam_definition(
     ----------
     sc : ixmp.Scenario
         Scenario to report
-    rep : .Reporter
-        Reporter object
+    data : dict
+        Data from :func:`get_data`
     df_dmd : pd.DataFrame
         Dataframe with demands
-    rep_dm : .Reporter
-        Reporter object for demands
     report_df : pd.DataFrame
         Dataframe with report
     suban : bool
@@ -96,125 +143,41 @@ def report_iam_definition(
     report_iam : pyam.IamDataFrame
         Report in pyam format
     """
-
-    if not suban:
-
-        def collapse_callback(df):
-            """Callback function to populate the IAMC 'variable' column."""
-            df["variable"] = "Water Resource|" + df["c"]
-            return df.drop(["c"], axis=1)
-
-        # Mapping from dimension IDs to column names
-        rename = dict(n="region", y="time")
-
-        key = rep_dm.convert_pyam("demand", rename=rename, collapse=collapse_callback)
-        # Making a dataframe for demands
-        df_dmd = rep.get(key).as_pandas()
-        df_dmd = df_dmd.drop(columns=["exclude"])
-    else:
-        df_dmd["model"] = sc.model
-        df_dmd["scenario"] = sc.scenario
-        df_dmd["variable"] = "Water Resource|" + df_dmd["c"]
-        df_dmd.rename(
-            columns={"n": "region", "y": "year", "demand": "value", "h": "subannual"},
-            inplace=True,
-        )
-        df_dmd = df_dmd[
-            ["model", "scenario", "region", "variable", "subannual", "year", "value"]
+    df_dmd = df_dmd.assign(
+        model=sc.model,
+        scenario=sc.scenario,
+        variable="Water Resource|"
+        + df_dmd["c"].replace(
+            {"groundwater_basin": "Groundwater", "surfacewater_basin": "Surface Water"}
+        ),
+        value=df_dmd["demand"].abs(),
+        unit="km3",
+    ).rename(columns={"n": "region", "y": "year", "h": "subannual"})
+    df_dmd1 = pyam.IamDataFrame(
+        df_dmd[
+            ["model", "scenario", "region", "variable", "unit", "year", "value"]
+            + (["subannual"] if suban else [])
         ]
-
-    df_dmd["value"] = df_dmd["value"].abs()
-    df_dmd["variable"].replace(
-        "Water Resource|groundwater_basin", "Water Resource|Groundwater", inplace=True
     )
-    df_dmd["variable"].replace(
-        "Water Resource|surfacewater_basin",
-        "Water Resource|Surface Water",
-        inplace=True,
-    )
-    df_dmd["unit"] = "km3"
-    df_dmd1 = pyam.IamDataFrame(df_dmd)
 
     if not suban:
         report_iam = pyam.IamDataFrame(report_df)
     else:
         # Convert to pyam dataframe
         # if subannual, get and subsittute variables
-        vars_dic = ["in:nl-t-ya-m-h-no-c-l", "out:nl-t-ya-m-h-nd-c-l"]
-
         # other variables do not ahve sub-annual dimension, we just take
         # annual values from report_df
         vars_from_annual = ["CAP_NEW", "inv cost", "total om cost"]
         # get annual variables
         report_df1 = report_df[
             report_df["Variable"].str.contains("|".join(vars_from_annual))
-        ]
-        report_df1["subannual"] = "year"
+        ].assign(subannual="year")
         # Convert to pyam dataframe
         report_iam = pyam.IamDataFrame(report_df1)
 
-        report_df2 = pd.DataFrame()
-        for vs in vars_dic:
-            qty = rep.get(vs)
-            df = qty.to_dataframe()
-            df.reset_index(inplace=True)
-            df["model"] = sc.model
-            df["scenario"] = sc.scenario
-            df["variable"] = (
-                vs.split(":")[0]
-                + "|"
-                + df["l"]
-                + "|"
-                + df["c"]
-                + "|"
-                + df["t"]
-                + "|"
-                + df["m"]
-            )
-
-            df.rename(
-                columns={
-                    "no": "reg2",  # needed to avoid dulicates
-                    "nd": "reg2",
-                    "nl": "reg1",
-                    "ya": "year",
-                    "h": "subannual",
-                },
-                inplace=True,
-            )
-            # take the right node column in case nl and no/nd are different
-            df = (
-                df.groupby(["model", "scenario", "variable", "subannual", "year"])
-                .apply(
-                    lambda x: x.assign(
-                        region=x["reg2"]
-                        if len(x["reg2"].unique()) > len(x["reg1"].unique())
-                        else x["reg1"]
-                    )
-                )
-                .reset_index(drop=True)
-            )
-            # case of
-            exeption = "in|water_supply_basin|freshwater_basin|basin_to_reg"
-            df["region"] = df.apply(
-                lambda row: row["reg2"]
-                if exeption in row["variable"]
-                else row["region"],
-                axis=1,
-            )
-            df = df[
-                [
-                    "model",
-                    "scenario",
-                    "region",
-                    "variable",
-                    "subannual",
-                    "year",
-                    "value",
-                ]
-            ]
-            report_df2 = pd.concat([report_df2, df])
-
+        report_df2 = pd.concat(
+            [_subannual(sc, name, data[name]) for name in ("in", "out")]
+        )
         report_df2["unit"] = ""
         report_df2.columns = report_df2.columns.astype(str)
         report_df2.columns = report_df2.columns.str.title()
@@ -231,6 +194,37 @@ def report_iam_definition(
     return output
 
 
+def _subannual(sc: Scenario, name: str, qty) -> pd.DataFrame:
+    """Convert `qty` with sub-annual data for "in" or "out" to IAMC structure."""
+    df = qty.to_series().rename("value").reset_index()
+    df = df.assign(
+        model=sc.model,
+        scenario=sc.scenario,
+        variable=name + "|" + df["l"] + "|" + df["c"] + "|" + df["t"] + "|" + df["m"],
+    ).rename(
+        columns={
+            "no": "reg2",  # needed to avoid dulicates
+            "nd": "reg2",
+            "nl": "reg1",
+            "ya": "year",
+            "h": "subannual",
+        }
+    )
+
+    # take the right node column in case nl and no/nd are different
+    n_unique = df.groupby(["model", "scenario", "variable", "subannual", "year"])[
+        ["reg1", "reg2"]
+    ].transform("nunique")
+    df["region"] = df["reg2"].where(n_unique["reg2"] > n_unique["reg1"], df["reg1"])
+    # case of
+    exeption = "in|water_supply_basin|freshwater_basin|basin_to_reg"
+    df["region"] = df["reg2"].where(
+        df["variable"].str.contains(exeption, regex=False), df["region"]
+    )
+
+    return df[["model", "scenario", "region", "variable", "subannual", "year", "value"]]
+
+
 def multiply_electricity_output_of_hydro(
     elec_hydro_var: list, report_iam: pyam.IamDataFrame
 ) -> pyam.IamDataFrame:
@@ -275,13 +269,13 @@ def multiply_electricity_output_of_hydro(
 def report(sc: Scenario, reg: str, sdgs: bool = False) -> None:
     """Report nexus module results"""
     log.info(f"Regions given as {reg}; no warranty if it's not in ['R11','R12']")
-    # Generating reporter
+    # Generating reporter; compute all needed data at once
     rep = Reporter.from_scenario(sc)
-    report = rep.get(
-        "message::default"
-    )  # works also with suannual, but aggregates months
-    # Create a timeseries dataframe
-    report_df = report.timeseries()
+    data = get_data(rep)
+
+    # Create a timeseries dataframe. "message::default" works also with subannual,
+    # but aggregates months
+    report_df = data["default"].timeseries()
     report_df.reset_index(inplace=True)
     report_df.columns = report_df.columns.astype(str)
     report_df.columns = report_df.columns.str.title()
@@ -291,77 +285,21 @@ def report(sc: Scenario, reg: str, sdgs: bool = False) -> None:
 
     # Adding Water availability as resource in demands
     # This is not automatically reported using message:default
-    rep_dm = Reporter.from_scenario(sc)
-    rep_dm.set_filters(l="water_avail_basin")
-
-    rep_dm2 = rep.get("demand:n-c-l-y-h")
-    rep_dm_df = rep_dm2.to_dataframe()
-    rep_dm_df.reset_index(inplace=True)
-    df_dmd = rep_dm_df[rep_dm_df["l"] == "water_avail_basin"]
+    df_dmd = (
+        data["demand"]
+        .to_series()
+        .rename("demand")
+        .reset_index()
+        .query("l == 'water_avail_basin'")
+    )
     # setting sub-annual option based on the demand
-    suban = False if "year" in np.unique(df_dmd["h"]) else True
+    suban = "year" not in set(df_dmd["h"])
 
     # if subannual, get and subsittute variables
-    report_iam = report_iam_definition(sc, rep, df_dmd, rep_dm, report_df, suban)
-
-    # mapping model outputs for aggregation
-    urban_infrastructure = [
-        "CAP_NEW|new capacity|rural_recycle",
-        "CAP_NEW|new capacity|rural_sewerage",
-        "CAP_NEW|new capacity|rural_t_d",
-        "CAP_NEW|new capacity|rural_treatment",
-        "CAP_NEW|new capacity|rural_unconnected",
-        "CAP_NEW|new capacity|rural_untreated",
-    ]
-
-    rural_infrastructure = [
-        "CAP_NEW|new capacity|rural_recycle",
-        "CAP_NEW|new capacity|rural_sewerage",
-        "CAP_NEW|new capacity|rural_t_d",
-        "CAP_NEW|new capacity|rural_treatment",
-        "CAP_NEW|new capacity|rural_unconnected",
-        "CAP_NEW|new capacity|rural_untreated",
-    ]
-
-    urban_treatment_recycling = [
-        "CAP_NEW|new capacity|urban_recycle",
-        "CAP_NEW|new capacity|urban_sewerage",
-        "CAP_NEW|new capacity|urban_treatment",
-    ]
-
-    rural_treatment_recycling = [
-        "CAP_NEW|new capacity|rural_recycle",
-        "CAP_NEW|new capacity|rural_sewerage",
-        "CAP_NEW|new capacity|rural_treatment",
-    ]
-
-    rural_dist = ["CAP_NEW|new capacity|rural_t_d"]
-    urban_dist = ["CAP_NEW|new capacity|urban_t_d"]
-
-    rural_unconnected = [
-        "CAP_NEW|new capacity|rural_unconnected",
-        "CAP_NEW|new capacity|rural_untreated",
-    ]
-
-    urban_unconnected = [
-        "CAP_NEW|new capacity|urban_unconnected",
-        "CAP_NEW|new capacity|urban_untreated",
-    ]
+    report_iam = report_iam_definition(sc, data, df_dmd, report_df, suban)
 
-    industry_unconnected = [
-        "CAP_NEW|new capacity|industry_unconnected",
-        "CAP_NEW|new capacity|industry_untreated",
-    ]
-
-    extrt_sw_cap = ["CAP_NEW|new capacity|extract_surfacewater"]
-    extrt_gw_cap = ["CAP_NEW|new capacity|extract_groundwater"]
-    extrt_fgw_cap = ["CAP_NEW|new capacity|extract_gw_fossil"]
-
-    extrt_sw_inv = ["inv cost|extract_surfacewater"]
-    extrt_gw_inv = ["inv cost|extract_groundwater"]
     # Calculating fossil groundwater invwatments
     # 163.56 million USD/km3 x 2 times the reneewable gw costs
-
     report_iam = report_iam.append(
         report_iam.multiply(
             "CAP_NEW|new capacity|extract_gw_fossil",
@@ -370,198 +308,130 @@ def report(sc: Scenario, reg: str, sdgs: bool = False) -> None:
             ignore_units=True,
         )
     )
-    extrt_fgw_inv = report_iam.filter(variable="Fossil GW inv").variable
-
-    rural_infrastructure_inv = [
-        "inv cost|rural_recycle",
-        "inv cost|rural_sewerage",
-        "inv cost|rural_t_d",
-        "inv cost|rural_treatment",
-        "inv cost|rural_unconnected",
-        "inv cost|rural_untreated",
-    ]
-
-    urban_infrastructure_inv = [
-        "inv cost|urban_recycle",
-        "inv cost|urban_sewerage",
-        "inv cost|urban_t_d",
-        "inv cost|urban_treatment",
-        "inv cost|urban_unconnected",
-        "inv cost|urban_untreated",
-    ]
-
-    urban_treatment_recycling_inv = [
-        "inv cost|urban_recycle",
-        "inv cost|urban_sewerage",
-        "inv cost|urban_treatment",
-    ]
-
-    rural_treatment_recycling_inv = [
-        "inv cost|rural_recycle",
-        "inv cost|rural_sewerage",
-        "inv cost|rural_treatment",
-    ]
 
-    rural_dist_inv = ["inv cost|rural_t_d"]
-    urban_dist_inv = ["inv cost|urban_t_d"]
-
-    rural_unconnected_inv = [
-        "inv cost|rural_unconnected",
-        "inv cost|rural_untreated",
-    ]
-
-    urban_unconnected_inv = [
-        "inv cost|urban_unconnected",
-        "inv cost|urban_untreated",
-    ]
-
-    industry_unconnected_inv = [
-        "inv cost|industry_unconnected",
-        "inv cost|industry_untreated",
-    ]
-
-    saline_inv = [
-        "inv cost|membrane",
-        "inv cost|distillation",
-    ]
-    saline_totalom = [
-        "total om cost|membrane",
-        "total om cost|distillation",
-    ]
-
-    extrt_fgw_om = ["total om cost|extract_gw_fossil"]
-
-    urban_infrastructure_totalom = [
-        "total om cost|urban_recycle",
-        "total om cost|urban_sewerage",
-        "total om cost|urban_t_d",
-        "total om cost|urban_treatment",
-        "total om cost|urban_unconnected",
-        "total om cost|urban_untreated",
-    ]
-
-    rural_infrastructure_totalom = [
-        "total om cost|rural_recycle",
-        "total om cost|rural_sewerage",
-        "total om cost|rural_t_d",
-        "total om cost|rural_treatment",
-        "total om cost|rural_unconnected",
-        "total om cost|rural_untreated",
-    ]
-
-    rural_treatment_recycling_totalom = [
-        "total om cost|rural_recycle",
-        "total om cost|rural_sewerage",
-        "total om cost|rural_treatment",
-    ]
-
-    urban_treatment_recycling_totalom = [
-        "total om cost|urban_recycle",
-        "total om cost|urban_sewerage",
-        "total om cost|urban_treatment",
-    ]
-
-    rural_dist_totalom = ["total om cost|rural_t_d"]
-    urban_dist_totalom = ["total om cost|urban_t_d"]
-
-    rural_unconnected_totalom = [
-        "total om cost|rural_unconnected",
-        "total om cost|rural_untreated",
-    ]
-
-    urban_unconnected_totalom = [
-        "total om cost|urban_unconnected",
-        "total om cost|urban_untreated",
-    ]
-
-    industry_unconnected_totalom = [
-        "total om cost|industry_unconnected",
-        "total om cost|industry_untreated",
-    ]
-
-    extract_sw = ["in|water_avail_basin|surfacewater_basin|extract_surfacewater|M1"]
-
-    extract_gw = ["in|water_avail_basin|groundwater_basin|extract_groundwater|M1"]
-    extract_fgw = ["out|water_supply_basin|freshwater_basin|extract_gw_fossil|M1"]
-
-    desal_membrane = ["out|water_supply_basin|freshwater_basin|membrane|M1"]
-    desal_distill = ["out|water_supply_basin|freshwater_basin|distillation|M1"]
-    env_flow = ["in|water_avail_basin|surfacewater_basin|return_flow|M1"]
-    gw_recharge = ["in|water_avail_basin|groundwater_basin|gw_recharge|M1"]
-
-    rural_mwdem_unconnected = ["out|final|rural_disconnected|rural_unconnected|M1"]
-    rural_mwdem_unconnected_eff = ["out|final|rural_disconnected|rural_unconnected|Mf"]
-    rural_mwdem_connected = ["out|final|rural_mw|rural_t_d|M1"]
-    rural_mwdem_connected_eff = ["out|final|rural_mw|rural_t_d|Mf"]
-    urban_mwdem_unconnected = ["out|final|urban_disconnected|urban_unconnected|M1"]
-    urban_mwdem_unconnected_eff = ["out|final|urban_disconnected|urban_unconnected|Mf"]
-    urban_mwdem_connected = ["out|final|urban_mw|urban_t_d|M1"]
-    urban_mwdem_connected_eff = ["out|final|urban_mw|urban_t_d|Mf"]
-    industry_mwdem_unconnected = ["out|final|industry_mw|industry_unconnected|M1"]
-
-    electr_gw = ["in|final|electr|extract_groundwater|M1"]
-    electr_fgw = ["in|final|electr|extract_gw_fossil|M1"]
-    electr_sw = ["in|final|electr|extract_surfacewater|M1"]
-    extract_saline_region = ["out|saline_supply|saline_ppl|extract_salinewater|M1"]
-    extract_saline_basin = [
+    # mapping model outputs for aggregation: selections from the variables present
+    variables = pd.Index(report_iam.variable)
+
+    sel = partial(select, variables)
+
+    cap, inv, om = "CAP_NEW|new capacity|", "inv cost|", "total om cost|"
+    urban_infrastructure = sel(cap, *_techs("urban", INFRASTRUCTURE))
+    rural_infrastructure = sel(cap, *_techs("rural", INFRASTRUCTURE))
+    urban_treatment_recycling = sel(cap, *_techs("urban", TREATMENT_RECYCLING))
+    rural_treatment_recycling = sel(cap, *_techs("rural", TREATMENT_RECYCLING))
+    rural_dist = sel(cap, "rural_t_d")
+    urban_dist = sel(cap, "urban_t_d")
+    rural_unconnected = sel(cap, *_techs("rural", UNCONNECTED))
+    urban_unconnected = sel(cap, *_techs("urban", UNCONNECTED))
+    industry_unconnected = sel(cap, *_techs("industry", UNCONNECTED))
+
+    extrt_sw_cap = sel(cap, "extract_surfacewater")
+    extrt_gw_cap = sel(cap, "extract_groundwater")
+    extrt_fgw_cap = sel(cap, "extract_gw_fossil")
+
+    extrt_sw_inv = sel(inv, "extract_surfacewater")
+    extrt_gw_inv = sel(inv, "extract_groundwater")
+    extrt_fgw_inv = sel("Fossil GW inv")
+
+    rural_infrastructure_inv = sel(inv, *_techs("rural", INFRASTRUCTURE))
+    urban_infrastructure_inv = sel(inv, *_techs("urban", INFRASTRUCTURE))
+    urban_treatment_recycling_inv = sel(inv, *_techs("urban", TREATMENT_RECYCLING))
+    rural_treatment_recycling_inv = sel(inv, *_techs("rural", TREATMENT_RECYCLING))
+    rural_dist_inv = sel(inv, "rural_t_d")
+    urban_dist_inv = sel(inv, "urban_t_d")
+    rural_unconnected_inv = sel(inv, *_techs("rural", UNCONNECTED))
+    urban_unconnected_inv = sel(inv, *_techs("urban", UNCONNECTED))
+    industry_unconnected_inv = sel(inv, *_techs("industry", UNCONNECTED))
+    saline_inv = sel(inv, "membrane", "distillation")
+
+    saline_totalom = sel(om, "membrane", "distillation")
+    extrt_fgw_om = sel(om, "extract_gw_fossil")
+    urban_infrastructure_totalom = sel(om, *_techs("urban", INFRASTRUCTURE))
+    rural_infrastructure_totalom = sel(om, *_techs("rural", INFRASTRUCTURE))
+    rural_treatment_recycling_totalom = sel(om, *_techs("rural", TREATMENT_RECYCLING))
+    urban_treatment_recycling_totalom = sel(om, *_techs("urban", TREATMENT_RECYCLING))
+    rural_dist_totalom = sel(om, "rural_t_d")
+    urban_dist_totalom = sel(om, "urban_t_d")
+    rural_unconnected_totalom = sel(om, *_techs("rural", UNCONNECTED))
+    urban_unconnected_totalom = sel(om, *_techs("urban", UNCONNECTED))
+    industry_unconnected_totalom = sel(om, *_techs("industry", UNCONNECTED))
+
+    avail_basin = "in|water_avail_basin|"
+    supply_basin = "out|water_supply_basin|freshwater_basin|"
+    extract_sw = sel(avail_basin, "surfacewater_basin|extract_surfacewater|M1")
+    extract_gw = sel(avail_basin, "groundwater_basin|extract_groundwater|M1")
+    extract_fgw = sel(supply_basin, "extract_gw_fossil|M1")
+
+    desal_membrane = sel(supply_basin, "membrane|M1")
+    desal_distill = sel(supply_basin, "distillation|M1")
+    env_flow = sel(avail_basin, "surfacewater_basin|return_flow|M1")
+    gw_recharge = sel(avail_basin, "groundwater_basin|gw_recharge|M1")
+
+    final = "out|final|"
+    rural_mwdem_unconnected = sel(final, "rural_disconnected|rural_unconnected|M1")
+    rural_mwdem_unconnected_eff = sel(final, "rural_disconnected|rural_unconnected|Mf")
+    rural_mwdem_connected = sel(final, "rural_mw|rural_t_d|M1")
+    rural_mwdem_connected_eff = sel(final, "rural_mw|rural_t_d|Mf")
+    urban_mwdem_unconnected = sel(final, "urban_disconnected|urban_unconnected|M1")
+    urban_mwdem_unconnected_eff = sel(final, "urban_disconnected|urban_unconnected|Mf")
+    urban_mwdem_connected = sel(final, "urban_mw|urban_t_d|M1")
+    urban_mwdem_connected_eff = sel(final, "urban_mw|urban_t_d|Mf")
+    industry_mwdem_unconnected = sel(final, "industry_mw|industry_unconnected|M1")
+
+    electr = "in|final|electr|"
+    electr_gw = sel(electr, "extract_groundwater|M1")
+    electr_fgw = sel(electr, "extract_gw_fossil|M1")
+    electr_sw = sel(electr, "extract_surfacewater|M1")
+    extract_saline_region = sel("out|saline_supply|saline_ppl|extract_salinewater|M1")
+    extract_saline_basin = sel(
         "out|water_avail_basin|salinewater_basin|extract_salinewater_basin|M1"
-    ]
-    electr_rural_trt = ["in|final|electr|rural_sewerage|M1"]
-    electr_urban_trt = ["in|final|electr|urban_sewerage|M1"]
-    electr_urban_recycle = ["in|final|electr|urban_recycle|M1"]
-    electr_rural_recycle = ["in|final|electr|rural_recycle|M1"]
-    electr_saline = [
-        "in|final|electr|distillation|M1",
-        "in|final|electr|distillation|M1",
-    ]
-
-    electr_urban_t_d = ["in|final|electr|urban_t_d|M1"]
-    electr_urban_t_d_eff = ["in|final|electr|urban_t_d|Mf"]
-    electr_rural_t_d = ["in|final|electr|rural_t_d|M1"]
-    electr_rural_t_d_eff = ["in|final|electr|rural_t_d|Mf"]
+    )
+    electr_rural_trt = sel(electr, "rural_sewerage|M1")
+    electr_urban_trt = sel(electr, "urban_sewerage|M1")
+    electr_urban_recycle = sel(electr, "urban_recycle|M1")
+    electr_rural_recycle = sel(electr, "rural_recycle|M1")
+    electr_saline = sel(electr, "distillation|M1")
 
-    electr_irr = [
-        "in|final|electr|irrigation_cereal|M1",
-        "in|final|electr|irrigation_oilcrops|M1",
-        "in|final|electr|irrigation_sugarcrops|M1",
-    ]
+    electr_urban_t_d = sel(electr, "urban_t_d|M1")
+    electr_urban_t_d_eff = sel(electr, "urban_t_d|Mf")
+    electr_rural_t_d = sel(electr, "rural_t_d|M1")
+    electr_rural_t_d_eff = sel(electr, "rural_t_d|Mf")
 
-    urban_collctd_wstwtr = ["in|final|urban_collected_wst|urban_sewerage|M1"]
-    rural_collctd_wstwtr = ["in|final|rural_collected_wst|rural_sewerage|M1"]
+    electr_irr = sel(electr, *_techs("irrigation", IRRIGATION, "|M1"))
 
-    urban_treated_wstwtr = ["in|water_treat|urban_collected_wst|urban_recycle|M1"]
-    rural_treated_wstwtr = ["in|water_treat|rural_collected_wst|rural_recycle|M1"]
+    urban_collctd_wstwtr = sel("in|final|urban_collected_wst|urban_sewerage|M1")
+    rural_collctd_wstwtr = sel("in|final|rural_collected_wst|rural_sewerage|M1")
 
-    urban_wstwtr_recycle = ["out|water_supply_basin|freshwater_basin|urban_recycle|M1"]
-    rural_wstwtr_recycle = ["out|water_supply_basin|freshwater_basin|rural_recycle|M1"]
+    urban_treated_wstwtr = sel("in|water_treat|urban_collected_wst|urban_recycle|M1")
+    rural_treated_wstwtr = sel("in|water_treat|rural_collected_wst|rural_recycle|M1")
 
-    urban_transfer = ["in|water_supply_basin|freshwater_basin|urban_t_d|M1"]
-    urban_transfer_eff = ["in|water_supply_basin|freshwater_basin|urban_t_d|Mf"]
-    rural_transfer = ["in|water_supply_basin|freshwater_basin|rural_t_d|M1"]
-    rural_transfer_eff = ["in|water_supply_basin|freshwater_basin|rural_t_d|Mf"]
+    urban_wstwtr_recycle = sel(supply_basin, "urban_recycle|M1")
+    rural_wstwtr_recycle = sel(supply_basin, "rural_recycle|M1")
 
-    # irr_water = ["out|water_irr|freshwater|irrigation|M1"]
+    transfer = "in|water_supply_basin|freshwater_basin|"
+    urban_transfer = sel(transfer, "urban_t_d|M1")
+    urban_transfer_eff = sel(transfer, "urban_t_d|Mf")
+    rural_transfer = sel(transfer, "rural_t_d|M1")
+    rural_transfer_eff = sel(transfer, "rural_t_d|Mf")
 
-    irr_c = ["in|water_supply|freshwater|irrigation_cereal|M1"]
-    irr_o = ["in|water_supply|freshwater|irrigation_oilcrops|M1"]
-    irr_s = ["in|water_supply|freshwater|irrigation_sugarcrops|M1"]
+    irr_c = sel("in|water_supply|freshwater|irrigation_cereal|M1")
+    irr_o = sel("in|water_supply|freshwater|irrigation_oilcrops|M1")
+    irr_s = sel("in|water_supply|freshwater|irrigation_sugarcrops|M1")
 
-    region_withdr = report_iam.filter(
-        variable="in|water_supply_basin|freshwater_basin|basin_to_reg|*"
-    ).variable
+    region_withdr = sel(transfer, "basin_to_reg|*")
 
-    cooling_saline_inv = report_iam.filter(variable="inv cost|*saline").variable
-    cooling_air_inv = report_iam.filter(variable="inv cost|*air").variable
-    cooling_ot_fresh = report_iam.filter(variable="inv cost|*ot_fresh").variable
-    cooling_cl_fresh = report_iam.filter(variable="inv cost|*cl_fresh").variable
+    cooling_saline_inv = sel(inv, "*saline")
+    cooling_air_inv = sel(inv, "*air")
+    cooling_ot_fresh = sel(inv, "*ot_fresh")
+    cooling_cl_fresh = sel(inv, "*cl_fresh")
 
-    elec_hydro_var = report_iam.filter(variable="out|secondary|electr|hydro*").variable
+    elec_hydro_var = sel("out|secondary|electr|hydro*")
 
     report_iam = multiply_electricity_output_of_hydro(elec_hydro_var, report_iam)
 
-    water_hydro_var = report_iam.filter(
-        variable="Water Withdrawal|Electricity|Hydro|*"
-    ).variable
+    water_hydro_var = select(
+        pd.Index(report_iam.variable), "Water Withdrawal|Electricity|Hydro|*"
+    )
 
     # mapping for aggregation
     map_agg_pd = pd.DataFrame(
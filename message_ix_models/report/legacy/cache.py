@@ -0,0 +1,128 @@
+"""In-memory data source for :mod:`.report.legacy`."""
+
+import logging
+from functools import partial, wraps
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+import pandas as pd
+from ixmp.util import as_str_list
+from pandas.api.types import is_integer_dtype, is_object_dtype
+
+if TYPE_CHECKING:
+    from message_ix import Scenario
+
+log = logging.getLogger(__name__)
+
+#: Dimension with an index of row positions, for items that have it.
+INDEX_DIM = "technology"
+
+_EMPTY = np.empty(0, dtype=int)
+
+
+class ScenarioCache:
+    """Data source for legacy reporting that retrieves each item only once.
+
+    This can be used in place of `scenario` as the `ds` argument to
+    :class:`.PostProcess` and the :py:`_retr_*()` functions in :mod:`.pp_utils`.
+
+    On the first call to :meth:`par`, :meth:`var`, or :meth:`set` for a given item,
+    all of its data are retrieved from `scenario` and stored with
+    :class:`pandas.CategoricalDtype` for columns of labels. Rows are also indexed by
+    :data:`INDEX_DIM`, if present. This and any later call with `filters` is answered
+    from these data, with the same columns, dtypes, and order of rows as from
+    :meth:`message_ix.Scenario.par` etc.
+
+    Other attributes and methods are those of `scenario`.
+
+    An instance may be shared by several threads. Access to `scenario` is serialized;
+    data already stored are read concurrently.
+    """
+
+    def __init__(self, scenario: "Scenario"):
+        self.scenario = scenario
+        #: Data, original dtypes, and index, keyed by (item type, name).
+        self._data: dict[tuple[str, str], tuple[Any, pd.Series, dict]] = {}
+        self._lock = RLock()
+
+    def __getattr__(self, name):
+        value = getattr(self.scenario, name)
+        if not callable(value):
+            return value
+
+        return wraps(value)(partial(self._call, name))
+
+    def par(self, name: str, filters: Optional[dict] = None, **kwargs) -> pd.DataFrame:
+        """Same as :meth:`message_ix.Scenario.par`."""
+        return self._get("par", name, filters, **kwargs)
+
+    def var(self, name: str, filters: Optional[dict] = None, **kwargs) -> pd.DataFrame:
+        """Same as :meth:`message_ix.Scenario.var`."""
+        return self._get("var", name, filters, **kwargs)
+
+    def set(self, name: str, filters: Optional[dict] = None, **kwargs):
+        """Same as :meth:`message_ix.Scenario.set`."""
+        return self._get("set", name, filters, **kwargs)
+
+    def _get(self, ix_type: str, name: str, filters: Optional[dict], **kwargs):
+        if kwargs:
+            # Not handled here
+            return self._call(ix_type, name, filters, **kwargs)
+
+        try:
+            data, dtypes, index = self._data[(ix_type, name)]
+        except KeyError:
+            data, dtypes, index = self._load(ix_type, name)
+
+        if isinstance(data, pd.Series):
+            # Index set; return a copy
+            return data.copy() if not filters else self._call("set", name, filters)
+
+        result = data
+        filters = dict(filters or {})
+        if index and INDEX_DIM in filters:
+            # Select rows for the given labels using the index
+            labels = as_str_list(filters.pop(INDEX_DIM))
+            positions = [index[v] for v in labels if v in index]
+            result = result.iloc[np.sort(np.concatenate([_EMPTY] + positions))]
+
+        mask = np.ones(len(result), dtype=bool)
+        for dim, values in filters.items():
+            mask &= result[dim].isin(_coerce(as_str_list(values), dtypes[dim]))
+
+        return result[mask].astype(dtypes).reset_index(drop=True)
+
+    def _call(self, method: str, *args, **kwargs):
+        """Call `method` of the scenario."""
+        with self._lock:
+            return getattr(self.scenario, method)(*args, **kwargs)
+
+    def _load(self, ix_type: str, name: str) -> tuple[Any, pd.Series, dict]:
+        """Retrieve all data for item `name` and store."""
+        with self._lock:
+            # Another thread may have stored the data while this one waited
+            if (ix_type, name) in self._data:
+                return self._data[(ix_type, name)]
+
+            data = getattr(self.scenario, ix_type)(name)
+            dtypes = getattr(data, "dtypes", None)
+
+            index: dict = {}
+            if isinstance(data, pd.DataFrame):
+                data = data.astype(
+                    {c: "category" for c, dt in dtypes.items() if is_object_dtype(dt)}
+                )
+                if INDEX_DIM in data.columns:
+                    index = data.groupby(INDEX_DIM, observed=True).indices
+
+            log.debug(f"Cached {ix_type} {name!r}: {len(data)} rows")
+            self._data[(ix_type, name)] = (data, dtypes, index)
+            return data, dtypes, index
+
+
+def _coerce(values: list[str], dtype) -> list:
+    """Convert filter `values` for comparison to a column with `dtype`."""
+    if is_integer_dtype(dtype):
+        return [int(v) for v in values if v.lstrip("-").isdigit()]
+    return values
@@ -1,6 +1,10 @@
 import logging
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from time import perf_counter
+from typing import Callable, Optional
 
 import pandas as pd
 import yaml
@@ -14,6 +18,7 @@ from message_ix_models.util.compat.message_data.utilities import retrieve_region
 
 from . import postprocess
 from . import pp_utils
+from .cache import ScenarioCache
 
 log = logging.getLogger(__name__)
 
@@ -36,6 +41,8 @@ def report(
     lu_hist=None,
     verbose=False,
     *,
+    cache: bool = True,
+    jobs: int = 1,
     context: Optional[Context] = None,
 ):
     """Main reporting function.
@@ -91,6 +98,12 @@ def report(
         Historic land-use GHG emissions for regions.
     verbose : str (default: False)
         Option whther to print onscreen messages.
+    cache : boolean (default: True)
+        If :obj:`True`, retrieve data through a :class:`.ScenarioCache`, so that each
+        item is retrieved from `scen` only once.
+    jobs : int (default: 1)
+        If greater than 1, evaluate up to `jobs` reporting tables concurrently, using
+        :func:`run_tables_parallel`.
     context : .Context
         Only the ``dry_run`` setting is respected. If :data:`True`, configuration is
         read, but nothing is done.
@@ -184,15 +197,19 @@ def report(
     # Set global variables in pp_utils
     # --------------------------------
 
+    if jobs > 1 and not cache:
+        raise ValueError("jobs > 1 requires cache=True")
+    ds = ScenarioCache(scen) if cache else scen
+
     if run_history != "True":
         # Configures reporting tools to retrieve results from optimization (var)
-        pp = postprocess.PostProcess(scen)
+        pp = postprocess.PostProcess(ds)
         pp_utils.firstmodelyear = scen.firstmodelyear
 
         pp_utils.years = get_optimization_years(scen)
     else:
         # Configures reporting tools to retrieve results from "reference_solution" (par)
-        pp = postprocess.PostProcess(scen, ix=False)
+        pp = postprocess.PostProcess(ds, ix=False)
         pp_utils.years = get_historical_years(scen) + get_optimization_years(scen)
 
     # Passes all model years to reporting tools
@@ -279,21 +296,20 @@ def report(
     # Run reporting tables
     # --------------------
 
-    dfs = {}
+    tables = {}
     for i in run_tables:
         if run_tables[i]["active"] is True:
-            print("processing Table:", run_tables[i]["root"])
             if (
                 "condition" in run_tables[i]
                 and eval(run_tables[i]["condition"]) is True
             ):
                 continue
-            dfs[i] = (
-                func_dict[run_tables[i]["function"]]()
-                if "args" not in run_tables[i]
-                else func_dict[run_tables[i]["function"]](**run_tables[i]["args"])
+            tables[i] = partial(
+                func_dict[run_tables[i]["function"]], **run_tables[i].get("args", {})
             )
 
+    dfs = run_tables_parallel(tables, jobs) if jobs > 1 else _run_tables(tables)
+
     # ---------------------------------
     # Convert dataframes to IAMC-format
     # ---------------------------------
@@ -421,3 +437,64 @@ def report(
     if not out_dir.exists():
         out_dir.mkdir()
     pp_utils.write_xlsx(df, out_dir)
+
+
+def _run_table(name: str, func: Callable) -> tuple[pd.DataFrame, float]:
+    """Evaluate the reporting table `name` by calling `func`; return its run time."""
+    print("processing Table:", name)
+    start = perf_counter()
+    return func(), perf_counter() - start
+
+
+def _run_tables(tables: Mapping[str, Callable]) -> dict[str, pd.DataFrame]:
+    """Evaluate `tables` in sequence."""
+    start = perf_counter()
+    result, times = {}, {}
+    for name, func in tables.items():
+        result[name], times[name] = _run_table(name, func)
+
+    _log_times(times, perf_counter() - start)
+    return result
+
+
+def run_tables_parallel(
+    tables: Mapping[str, Callable], jobs: int
+) -> dict[str, pd.DataFrame]:
+    """Evaluate `tables` concurrently in up to `jobs` threads.
+
+    The table functions only read data, through the :class:`.PostProcess` instance
+    and its :class:`.ScenarioCache`, which are shared by all threads. A process pool
+    is not used, because the scenario and the module-level configuration of
+    :mod:`.pp_utils` and :mod:`.default_tables` cannot be passed to other processes.
+
+    Returns
+    -------
+    dict
+        Results with the same keys and in the same order as `tables`, regardless of
+        the order in which evaluation finishes.
+    """
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            name: pool.submit(_run_table, name, func) for name, func in tables.items()
+        }
+        result = {name: f.result()[0] for name, f in futures.items()}
+        times = {name: f.result()[1] for name, f in futures.items()}
+
+    _log_times(times, perf_counter() - start)
+    return result
+
+
+def _log_times(times: dict[str, float], wall: float) -> None:
+    """Log the total `wall` time and the run time of each table, slowest first.
+
+    When tables are evaluated concurrently, the run time of each includes time spent
+    waiting for other threads, for instance for access to the :class:`.ScenarioCache`,
+    so the sum of these may exceed `wall`.
+    """
+    log.info(
+        f"Evaluated {len(times)} tables in {wall:.1f} s (wall clock); "
+        f"sum of per-table times {sum(times.values()):.1f} s"
+    )
+    for name, seconds in sorted(times.items(), key=lambda kv: -kv[1]):
+        log.info(f"{seconds:8.2f} s  {name}")
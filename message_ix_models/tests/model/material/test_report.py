@@ -0,0 +1,49 @@
+import pandas as pd
+import pyam
+import pytest
+
+from message_ix_models.model.material.report.reporting import IAMC_IDX, _filter
+
+
+@pytest.fixture
+def df() -> pyam.IamDataFrame:
+    variables = [
+        "in|final|electr|meth_ng|feedstock",
+        "in|final|gas|meth_ng|M1",
+        "in|secondary|coal|coal_NH3|M1",
+        "out|final_material|aluminum|prebake_aluminum|M1",
+        "out|final_material|steel|eaf_steel|M1",
+        "emis|CO2|*",
+    ]
+    return pyam.IamDataFrame(
+        pd.DataFrame(
+            [["m", "s", "R12_AFR", v, "", float(i)] for i, v in enumerate(variables)],
+            columns=IAMC_IDX + [2020],
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "variable, kwargs, expected",
+    (
+        (["in|final|*"], {}, 2),
+        ("in|final|*", {}, 2),
+        (["in|final|*", "out|*|aluminum|*"], {}, 3),
+        (["in|*|meth_ng|*", "in|secondary|coal|coal_NH3|M1"], {}, 3),
+        (["in|final|*"], dict(keep=False), 4),
+        # Special characters other than "*" are matched literally
+        (["in|final|gas|meth.ng|M1"], {}, 0),
+        ([], {}, 0),
+    ),
+)
+def test_filter(df, variable, kwargs, expected) -> None:
+    # Result is the same as from pyam
+    exp = df.filter(variable=variable, **kwargs)
+    result = _filter(df, variable, **kwargs)
+    assert result is not None
+    assert expected == len(result)
+    assert exp.equals(result)
+
+    # inplace= is handled
+    assert _filter(df, variable, inplace=True, **kwargs) is None
+    assert expected == len(df)
@@ -1,14 +1,21 @@
 import logging
 from collections.abc import Generator
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
+import pandas as pd
 import pytest
 from ixmp.testing import assert_logs
 from message_ix import make_df
 from message_ix.testing import make_dantzig
 
 from message_ix_models import Spec
-from message_ix_models.model.build import apply_spec
+from message_ix_models.model.build import (
+    BuildCache,
+    apply_spec,
+    clone_for_build,
+    plan_spec,
+)
 
 if TYPE_CHECKING:
     from message_ix import Scenario
@@ -130,3 +137,146 @@ def test_apply_spec4(request, caplog, scenario: "Scenario", spec: Spec):
 
     # Nothing logged for the already-existing region ID
     assert not any("already defined" in message for message in caplog.messages)
+
+
+def test_build_cache(caplog, tmp_path, test_context, scenario: "Scenario", spec: Spec):
+    spec.add.set["technology"] = ["build-cache-tech"]
+    data_path = tmp_path.joinpath("data.txt")
+    data_path.write_text(str(uuid4()))
+
+    def add_data_func(scenario, dry_run):
+        return dict(
+            demand=make_df(
+                "demand",
+                commodity="cases",
+                level="consumption",
+                node="chicago",
+                time="year",
+                unit="case",
+                value=float(len(data_path.read_text())),
+                year=1963,
+            )
+        )
+
+    def build(base: "Scenario", name: str) -> "Scenario":
+        s = clone_for_build(base, scenario=name, keep_solution=False)
+        cache = BuildCache(test_context, s, spec, paths=[tmp_path], option=1)
+        if cached := cache.get():
+            return cached
+        apply_spec(s, spec, data=add_data_func)
+        cache.put(s)
+        return s
+
+    # Disabled by default: no cache key is computed
+    assert BuildCache(test_context, scenario, spec).key is None
+
+    test_context.core.build_cache = True
+    try:
+        # First build is a miss
+        s1 = build(scenario, "build 1")
+        assert not any("Build cache hit" in m for m in caplog.messages)
+
+        # Same base scenario, spec, and data: the result of the first build is cloned
+        caplog.clear()
+        s2 = build(scenario, "build 2")
+        assert any("Build cache hit" in m for m in caplog.messages)
+        assert ("Canning problem (MESSAGE scheme)", "build 2") == (
+            s2.model,
+            s2.scenario,
+        )
+        assert "build-cache-tech" in set(s2.set("technology"))
+        pd.testing.assert_frame_equal(s1.par("demand"), s2.par("demand"))
+
+        # A plain clone has a key from its own version, and thus misses; unless the
+        # scenario it was cloned from is given explicitly
+        s = scenario.clone(scenario="build 2a", keep_solution=False)
+        assert (
+            BuildCache(test_context, s, spec, paths=[tmp_path], option=1).get() is None
+        )
+        cache = BuildCache(test_context, s, spec, [tmp_path], base=scenario, option=1)
+        assert cache.get() is not None
+
+        # Changed contents of a data file: miss
+        data_path.write_text(f"{uuid4()} changed")
+        caplog.clear()
+        s3 = build(scenario, "build 3")
+        assert not any("Build cache hit" in m for m in caplog.messages)
+        assert 1 == sum(44.0 == s3.par("demand")["value"])
+
+        # Changed contents of the base scenario: miss
+        caplog.clear()
+        build(s1, "build 4")
+        assert not any("Build cache hit" in m for m in caplog.messages)
+    finally:
+        test_context.core.build_cache = False
+
+
+def test_plan_spec(caplog, request, scenario: "Scenario", spec: Spec):
+    # Missing required element raises ValueError
+    spec["require"].set["node"].append("vienna")
+    with pytest.raises(ValueError):
+        plan_spec(scenario, spec)
+
+    node = f"{request.node.name} {uuid4().hex[:8]}"
+    spec["require"].set["node"] = ["seattle"]
+    spec["remove"].set["node"] = ["new-york", "not-a-node"]
+    spec["add"].set["node"] = [node, "seattle"]
+    spec["add"].set["technology"] = ["foo"]
+    spec["add"].set["cat_tec"] = [("all", "foo")]
+
+    def add_data_func(scenario, dry_run):
+        return dict(
+            demand=make_df(
+                "demand",
+                commodity="cases",
+                level="consumption",
+                node="chicago",
+                time="year",
+                unit="case",
+                value=302.0,
+                year=1963,
+            )
+        )
+
+    plan = plan_spec(scenario, spec, data=add_data_func)
+
+    # Counts of elements and rows to add and remove
+    expected = pd.DataFrame(
+        [
+            ["cat_tec", "set", 1, 0],
+            ["node", "set", 1, 1],
+            ["technology", "set", 1, 0],
+            ["demand", "par", 1, 1],
+            ["output", "par", 0, 2],
+        ],
+        columns=["name", "type", "add", "remove"],
+    ).set_index("name")
+    pd.testing.assert_frame_equal(expected, plan.summary())
+    assert 8 == len(plan)
+    assert [node] == plan.add_region
+
+    # With fast=True, as for apply_spec(), existing parameter data are not removed
+    assert {} == plan_spec(scenario, spec, data=add_data_func, fast=True).remove_par
+
+    # A data function that returns nothing is noted
+    plan_spec(scenario, spec, data=lambda s, dry_run: None)
+    assert any("returned no parameter data" in m for m in caplog.messages)
+
+    # Nothing was changed
+    assert "new-york" in set(scenario.set("node"))
+    assert node not in set(scenario.set("node"))
+
+    # Result of executing the plan is the same as apply_spec()
+    other = scenario.clone(scenario="test_plan_spec", keep_solution=False)
+    apply_spec(other, spec, data=add_data_func)
+    plan.execute(scenario)
+
+    for name in ("node", "technology", "cat_tec"):
+        assert sorted(map(str, other.set(name).values.tolist())) == sorted(
+            map(str, scenario.set(name).values.tolist())
+        )
+    for name in ("demand", "output"):
+        pd.testing.assert_frame_equal(
+            other.par(name).sort_values(other.idx_names(name), ignore_index=True),
+            scenario.par(name).sort_values(scenario.idx_names(name), ignore_index=True),
+        )
@@ -16,3 +16,31 @@ log = logging.getLogger(__name__)
 @pytest.mark.snapshot
 def test_load(test_context, loaded_snapshot):
     assert loaded_snapshot.model == "MESSAGEix-GLOBIOM_1.1_R11_no-policy"
+
+
+def test_unpack_read_excel(tmp_path, test_context) -> None:
+    from message_ix.testing import make_dantzig
+
+    mp = test_context.get_platform()
+    s0 = make_dantzig(mp)
+    path = tmp_path.joinpath("dantzig.xlsx")
+    s0.to_excel(path)
+
+    # Unpack using 2 worker processes
+    base = snapshot.unpack(path, jobs=2)
+    assert base.joinpath("sets.xlsx").exists()
+    assert base.joinpath("demand.parquet").exists()
+
+    # Data are read into an empty scenario
+    s1 = type(s0)(mp, model="dantzig", scenario="read_excel", version="new")
+    snapshot.read_excel(s1, path)
+
+    for name in "demand", "input", "var_cost":
+        exp, obs = s0.par(name), s1.par(name)
+        assert exp.dtypes.to_dict() == obs.dtypes.to_dict()
+        assert len(exp) == len(obs)
+        assert (
+            exp.sort_values(list(exp.columns))
+            .reset_index(drop=True)
+            .equals(obs.sort_values(list(obs.columns)).reset_index(drop=True))
+        )
@@ -1,3 +1,4 @@
+import logging
 import re
 from collections import defaultdict
 from copy import deepcopy
@@ -8,6 +9,8 @@ from iam_units import registry
 from sdmx.model.v21 import Annotation, Code
 
 from message_ix_models.model.structure import (
+    _digest,
+    _get_codes,
     codelists,
     generate_set_elements,
     get_codes,
@@ -76,6 +79,32 @@ class TestGetCodes:
         """The included code lists can be loaded."""
         get_codes(name)
 
+    def test_get_codes_cache(self, caplog, monkeypatch):
+        """Processed codes are cached on disk, and the cached values are the same."""
+        name = "node/R12"
+        exp = get_codes(name)
+
+        # Digest is stable and differs by code list
+        assert _digest(name) == _digest(name) != _digest("node/R11")
+
+        # Digest differs by package version
+        digest = _digest(name)
+        with monkeypatch.context() as m:
+            m.setattr("message_ix_models.__version__", "0.0.0")
+            assert digest != _digest(name)
+
+        with caplog.at_level(logging.INFO, logger="message_ix_models.util.cache"):
+            # Calling twice ensures the second is a cache hit
+            _get_codes(name, _digest(name))
+            result = _get_codes(name, _digest(name))
+
+        assert "Cache hit for _get_codes(" in caplog.text
+
+        # Same codes; hierarchy is preserved
+        assert list(map(repr, exp)) == list(map(repr, result))
+        World = result[result.index("World")]
+        assert all(c.parent is World for c in World.child)
+
     def test_hierarchy(self):
         """get_codes() returns objects with the expected hierarchical relationship."""
         codes = get_codes("node/R11")
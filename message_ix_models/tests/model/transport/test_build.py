@@ -1,6 +1,7 @@
 import logging
 from collections.abc import Collection
 from copy import copy
+from functools import partial
 from typing import TYPE_CHECKING, Literal
 
 import genno
@@ -45,6 +46,54 @@ def N_node(request) -> int:
         raise NotImplementedError
 
 
+@pytest.mark.parametrize("scheduler", ["sync", "threads"])
+def test_compute(tmp_path, scheduler) -> None:
+    from time import sleep
+
+    import pandas as pd
+
+    from message_ix_models.model.transport.config import Config
+
+    def f(*args, delay=0.0):
+        sleep(delay)
+        return sum(args)
+
+    c = genno.Computer()
+    c.add("scenario", 0)
+    c.add("a", 1)
+    c.add("b", partial(f, delay=0.2), "a")
+    c.add("c", partial(f, delay=0.01), "a")
+    c.add("d", f, "scenario", "a")
+    c.add("e", f, "b", "c", "d")
+
+    config = Config(build_scheduler=scheduler, build_jobs=3, build_profile=True)
+    path = tmp_path.joinpath("build-profile.csv")
+
+    # Same result as from Computer.get()
+    assert c.get("e") == build.compute(c, "e", config, path)
+
+    # Profile is written, with one row per task (not for literal data)
+    df = pd.read_csv(path, index_col="key")
+    assert {"b", "c", "d", "e"} == set(df.index)
+    assert {"worker", "start", "end", "duration", "size", "max_rss"} < set(df.columns)
+    assert (df["duration"] >= 0).all()
+
+    # The critical path passes through the slowest task
+    assert {"b", "e"} == set(df.query("critical").index)
+
+
+def test_input_paths(tmp_path, test_context) -> None:
+    c, _ = configure_build(test_context, regions="R12", years="B", tmp_path=tmp_path)
+
+    result = build._input_paths(c, "add transport data")
+
+    # Files for exogenous data, including those outside data/transport/, are found
+    assert any("R12" == p.parent.name for p in result)
+    assert any("ssp" == p.parent.name for p in result)
+    # Output paths from "config" are excluded
+    assert not any(tmp_path in p.parents for p in result)
+
+
 @pytest.mark.parametrize("years", [None, "A", "B"])
 @pytest.mark.parametrize(
     "regions_arg, regions_exp",
@@ -135,6 +184,47 @@ def test_build_bare_res(
         # assert result.all(), f"\n{result}"
 
 
+@build.get_computer.minimum_version
+def test_build_cache(caplog, request, test_context) -> None:
+    """Repeated builds on new clones of the same base scenario reuse the first."""
+    from message_ix_models.workflow import Workflow
+
+    ctx = test_context
+    ctx.update(regions="R12", years="B")
+    base = bare_res(request, ctx)
+    options = {
+        "data source": {"non-LDV": "IKARUS"},
+        "dummy_LDV": False,
+        "dummy_supply": True,
+    }
+
+    # As in .transport.workflow, each step clones the base scenario before building
+    wf = Workflow(ctx)
+    wf.add_step("base", None, target=f"ixmp://{base.platform.name}/{base.url}")
+    for name in "A", "B":
+        wf.add_step(
+            name,
+            "base",
+            build.main,
+            target=f"{base.model}/build cache {name}",
+            clone=True,
+            options=options,
+            fast=True,
+        )
+
+    ctx.core.build_cache = True
+    try:
+        wf.run("A")
+        assert not any("Build cache hit" in m for m in caplog.messages)
+
+        caplog.clear()
+        result = wf.run("B")
+        assert any("Build cache hit" in m for m in caplog.messages)
+        assert "build cache B" == result.scenario
+    finally:
+        ctx.core.build_cache = False
+
+
 @pytest.mark.ece_db
 @pytest.mark.parametrize(
     "url",
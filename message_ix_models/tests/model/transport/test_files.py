@@ -1,3 +1,6 @@
+import logging
+import subprocess
+import sys
 from typing import TYPE_CHECKING
 
 import genno
@@ -15,6 +18,8 @@ from message_ix_models.model.transport.files import (
 if TYPE_CHECKING:
     from genno import Computer
 
+log = logging.getLogger(__name__)
+
 
 class TestExogenousDataFile:
     """Test :class:`.ExogenousDataFile."""
@@ -61,6 +66,15 @@ class TestExogenousDataFile:
         """The :`ExogenousDataFiles.required` property has a :class:`bool` value."""
         assert isinstance(FILES[0].required, bool)
 
+    def test_df(self) -> None:
+        """:attr:`.ExogenousDataFile.df` is consistent with other attributes."""
+        file = FILES[0]
+        assert file.df is file.df
+        assert file.key == Key(str(file.df.get_annotation(id="genno-key").text))
+        assert str(file.path) == str(file.df.get_annotation(id="file-path").text)
+        assert file.required is file.df.eval_annotation(id="required-for-build")
+        assert ["NODE"] == [d.id for d in file.df.structure.dimensions]
+
     def test_units(self):
         """The :`ExogenousDataFiles.units` property has a :class:`pint.Unit` value."""
         import pint
@@ -68,12 +82,40 @@ class TestExogenousDataFile:
         assert isinstance(FILES[0].units, pint.Unit)
 
 
-def test_collect_structures():
-    sm1 = collect_structures()
+def test_collect_structures(tmp_path):
+    # Write to a temporary directory, not the package data
+    sm1 = collect_structures(base_dir=tmp_path)
 
-    sm2 = read_structures()
+    sm2 = read_structures(base_dir=tmp_path)
 
     # Structures are retrieved from file successfully
     # The value is either 30 or 31 depending on whether .build.add_exogenous_data() has
     # run
     assert 30 <= len(sm1.dataflow) == len(sm2.dataflow)
+
+
+def test_import() -> None:
+    """Importing :mod:`.transport.files` does not create SDMX structures.
+
+    The time to import the module and to create the structures is logged.
+    """
+    code = (
+        "from time import perf_counter\n"
+        "import message_ix_models\n"
+        "t0 = perf_counter()\n"
+        "from message_ix_models.model.transport.files import FILES\n"
+        "t1 = perf_counter()\n"
+        "print(sum('df' in f.__dict__ for f in FILES))\n"
+        "[f.df for f in FILES]\n"
+        "print(t1 - t0, perf_counter() - t1)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    created, times = result.stdout.splitlines()
+
+    # No data flow definitions were created on import
+    assert "0" == created
+
+    t_import, t_df = map(float, times.split())
+    log.info(f"Import: {t_import:.3f} s; create {len(FILES)} data flows: {t_df:.3f} s")
@@ -1,11 +1,20 @@
 import os.path
+from types import SimpleNamespace
+from typing import cast
 
+import pandas as pd
 import pytest
+from genno import Quantity
 from message_ix import Scenario
 
 from message_ix_models import ScenarioInfo
 from message_ix_models.model.structure import get_codes
-from message_ix_models.model.water.report import report_full
+from message_ix_models.model.water.report import (
+    _subannual,
+    remove_duplicate,
+    report_full,
+    select,
+)
 from message_ix_models.util import package_data_path
 
 
@@ -53,3 +62,73 @@ def test_report_full(test_context, request):
         package_data_path().parents[0] / f"reporting_output/{s.model}_{s.scenario}.csv"
     )
     assert os.path.isfile(result_file)
+
+
+def test_remove_duplicate() -> None:
+    data = pd.DataFrame(
+        [
+            ["Zambia|Zambia", "in|water|x"],
+            ["R12_AFR|B123", "in|water_supply_basin|freshwater_basin|basin_to_reg|M1"],
+            ["R12_AFR|B1|R12_AFR", "in|freshwater_basin|basin_to_reg|M1"],
+            ["R12_AFR|B1|R12_AFR", "out|final|rural_mw|rural_t_d|M1"],
+            ["AFR|B1", "out|final|rural_mw|rural_t_d|M1"],
+            ["R12_AFR", "out|final|rural_mw|rural_t_d|M1"],
+        ],
+        columns=["Region", "Variable"],
+    )
+    assert [
+        "Zambia",
+        "R12_AFR",
+        "B1|R12_AFR",
+        "R12_AFR|B1",
+        "AFR|B1",
+        "R12_AFR",
+    ] == remove_duplicate(data)
+
+
+def test_select() -> None:
+    variables = pd.Index(
+        [
+            "CAP_NEW|new capacity|urban_t_d",
+            "CAP_NEW|new capacity|urban_t_d_x",
+            "inv cost|coal_ppl__saline",
+            "inv cost|urban_t_d",
+        ]
+    )
+    assert ["CAP_NEW|new capacity|urban_t_d"] == select(
+        variables, "CAP_NEW|new capacity|", "urban_t_d", "rural_t_d"
+    )
+    assert ["inv cost|coal_ppl__saline"] == select(variables, "inv cost|", "*saline")
+    assert ["inv cost|urban_t_d"] == select(variables, "inv cost|urban_t_d")
+    assert [] == select(variables, "inv cost|", "urban_t_d|*")
+
+
+def test_subannual() -> None:
+    # Only the model and scenario names are used
+    sc = cast(Scenario, SimpleNamespace(model="m", scenario="s"))
+    dims = ["nl", "t", "ya", "m", "h", "no", "c", "l"]
+    qty = Quantity(
+        pd.DataFrame(
+            [
+                ["R12_AFR", "t", 2020, "M1", "1", "B1|R12_AFR", "c", "l", 1.0],
+                ["R12_AFR", "t", 2020, "M1", "1", "B2|R12_AFR", "c", "l", 2.0],
+                ["R12_AFR", "u", 2020, "M1", "1", "R12_AFR", "c", "l", 3.0],
+            ],
+            columns=dims + ["value"],
+        ).set_index(dims)["value"]
+    )
+
+    result = _subannual(sc, "in", qty)
+
+    assert [
+        "model",
+        "scenario",
+        "region",
+        "variable",
+        "subannual",
+        "year",
+        "value",
+    ] == result.columns.tolist()
+    assert {"in|l|c|t|M1", "in|l|c|u|M1"} == set(result["variable"])
+    # Nodes from "no" are used where these differ within a variable
+    assert ["B1|R12_AFR", "B2|R12_AFR", "R12_AFR"] == result["region"].tolist()
@@ -1,10 +1,15 @@
 import logging
+import re
 import sys
+from functools import partial
 
 import pytest
+from message_ix.testing import make_dantzig
+from pandas.testing import assert_frame_equal, assert_series_equal
 
 from message_ix_models.model import snapshot
 from message_ix_models.report import report
+from message_ix_models.report.legacy.cache import ScenarioCache
 from message_ix_models.testing import GHA
 
 log = logging.getLogger(__name__)
@@ -35,3 +40,96 @@ def test_legacy_report(test_context, loaded_snapshot):
     )
 
     report(test_context)
+
+
+@pytest.mark.parametrize(
+    "ix_type, name, filters",
+    (
+        ("par", "input", None),
+        ("par", "input", {"technology": ["transport_from_seattle"]}),
+        (
+            "par",
+            "input",
+            {"technology": "transport_from_seattle", "node_loc": "seattle"},
+        ),
+        ("par", "output", {"technology": ["transport_from_seattle", "foo"]}),
+        ("par", "output", {"technology": ["foo"]}),
+        ("par", "demand", {"node": ["new-york", "topeka"], "year": [1963]}),
+        ("par", "demand", {"year": ["1963"]}),
+        ("par", "var_cost", {"year_vtg": 1963, "mode": ["to_new-york"]}),
+        ("set", "cat_year", {"type_year": ["firstmodelyear"]}),
+        ("set", "technology", None),
+    ),
+)
+def test_scenario_cache(test_context, ix_type, name, filters) -> None:
+    scenario = make_dantzig(test_context.get_platform())
+    ds = ScenarioCache(scenario)
+
+    # Same data, columns, and dtypes as from the Scenario; also for repeated calls
+    exp = getattr(scenario, ix_type)(name, filters)
+    for _ in range(2):
+        obs = getattr(ds, ix_type)(name, filters)
+        if ix_type == "set" and filters is None:
+            assert_series_equal(exp, obs)
+        else:
+            assert_frame_equal(exp, obs)
+
+    # Other attributes are those of the scenario
+    assert scenario.model == ds.model
+    assert scenario.par_list() == ds.par_list()
+
+
+def test_run_tables_parallel(caplog) -> None:
+    from time import sleep
+
+    import pandas as pd
+
+    from message_ix_models.report.legacy.iamc_report_hackathon import (
+        _run_tables,
+        run_tables_parallel,
+    )
+
+    def table(value, delay):
+        sleep(delay)
+        return pd.DataFrame([[value]], columns=["value"])
+
+    # Tables that finish in the reverse of the order they are started
+    tables = {f"t{i}": partial(table, i, 0.05 * (4 - i)) for i in range(4)}
+
+    with caplog.at_level(logging.INFO):
+        result = run_tables_parallel(tables, 4)
+
+    # Results are in the same order as `tables`
+    assert list(tables) == list(result)
+    assert [0, 1, 2, 3] == [df.at[0, "value"] for df in result.values()]
+
+    # Same results as sequential evaluation
+    exp = _run_tables(tables)
+    assert all(exp[k].equals(result[k]) for k in tables)
+
+    # Wall-clock time and the sum of per-table times are logged
+    match = re.match(
+        r"Evaluated 4 tables in ([\d.]+) s \(wall clock\); sum of per-table times "
+        r"([\d.]+) s",
+        caplog.messages[0],
+    )
+    assert match
+    # Tables ran concurrently, so the wall-clock time is less than the sum
+    assert float(match.group(1)) < float(match.group(2))
+
+    # Run time of each table is logged, slowest first
+    assert caplog.messages[1].endswith("  t0")
+
+
+def test_scenario_cache_threads(test_context) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    scenario = make_dantzig(test_context.get_platform())
+    ds = ScenarioCache(scenario)
+
+    args = [("input", None), ("output", None), ("demand", None), ("var_cost", None)]
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda a: ds.par(*a), args * 5))
+
+    for (name, filters), obs in zip(args * 5, results):
+        assert_frame_equal(scenario.par(name, filters), obs)
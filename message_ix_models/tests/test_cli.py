@@ -1,10 +1,13 @@
 """Basic tests of the command line."""
 
+from importlib import import_module
+
 import ixmp
 import pytest
 from message_ix.testing import make_dantzig
 
 from message_ix_models import util
+from message_ix_models.cli import COMMANDS as COMMANDS_LAZY
 
 COMMANDS = [
     tuple(),
@@ -65,3 +68,14 @@ def test_cli_export_test_data(monkeypatch, tmp_path, test_context, mix_models_cl
     # The file is created in the expected location
     assert str(dest_file) in result.output
     assert dest_file.exists()
+
+
+@pytest.mark.parametrize("name", sorted(COMMANDS_LAZY))
+def test_lazy_commands(name):
+    """Static short help in :data:`.cli.COMMANDS` matches the actual commands."""
+    module_name, attr, short_help = COMMANDS_LAZY[name]
+    cmd = getattr(import_module(module_name), attr)
+
+    assert short_help == cmd.get_short_help_str(limit=1000)
+    # The command is also known by `name`, except for ixmp's "config" group
+    assert name == cmd.name or module_name.startswith("ixmp.")
@@ -1,7 +1,12 @@
+import logging
+import subprocess
+import sys
 from importlib import import_module
 
 import pytest
 
+log = logging.getLogger(__name__)
+
 MODULES_WITHOUT_TESTS = [
     None,
     "model.water",
@@ -20,3 +25,54 @@ def test_import(name):
     """
     full_name = ".".join(filter(None, ["message_ix_models", name]))
     import_module(full_name)
+
+
+#: Modules that take a long time to import. These **should not** be imported by
+#: :py:`import message_ix_models` or :program:`mix-models --help`.
+HEAVY = ["ixmp", "message_ix", "pandas", "pint"]
+
+
+@pytest.mark.parametrize(
+    "code, budget",
+    (
+        ("import message_ix_models", 0.5),
+        (
+            "from message_ix_models.cli import main\n"
+            "main(['--help'], standalone_mode=False)",
+            1.0,
+        ),
+    ),
+    ids=["import", "mix-models --help"],
+)
+def test_importtime(code: str, budget: float) -> None:
+    """Importing :mod:`message_ix_models` and showing the CLI help are fast.
+
+    None of the :data:`HEAVY` modules are imported. The total import time, as reported
+    by :program:`python -X importtime`, is only logged, with a warning if it exceeds
+    `budget` (seconds): wall-clock time depends on the machine and its load, for
+    instance from parallel test workers.
+    """
+    code += f"\nimport sys\nprint(*sorted(set({HEAVY!r}) & set(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    # Heavy modules were not imported
+    assert "" == result.stdout.splitlines()[-1]
+
+    # Sum the cumulative time of top-level imports (no indentation) after the site
+    # module, which is imported on interpreter startup
+    lines = result.stderr.splitlines()
+    start = next(i for i, line in enumerate(lines) if line.endswith("| site"))
+    t = 1e-6 * sum(
+        int(line.split("|")[1])
+        for line in lines[start + 1 :]
+        if line.startswith("import time:") and not line.split("|")[2].startswith("  ")
+    )
+    log.info(f"Import time: {t:.3f} s")
+
+    if t >= budget:
+        log.warning(f"Import time {t:.3f} s exceeds budget of {budget:.1f} s")
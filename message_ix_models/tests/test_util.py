@@ -13,12 +13,13 @@ from ixmp.testing import assert_logs
 from message_ix import Scenario, make_df
 from message_ix.testing import make_dantzig
 from packaging.version import parse
-from pandas.testing import assert_series_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 
 from message_ix_models import ScenarioInfo
 from message_ix_models.util import (
     MESSAGE_DATA_PATH,
     MESSAGE_MODELS_PATH,
+    add_par_data,
     as_codes,
     broadcast,
     check_support,
@@ -40,9 +41,41 @@ from message_ix_models.util import (
     strip_par_data,
 )
 
+log = logging.getLogger(__name__)
+
 _actual_package_data = Path(__file__).parents[1].joinpath("data")
 
 
+def test_add_par_data(caplog, test_context):
+    s = make_dantzig(test_context.get_platform())
+
+    # Existing data for "demand", with empty units and also "-"
+    df = s.par("demand").assign(unit="")
+    df.loc[0, "unit"] = "-"
+    data = dict(demand=df)
+    N = len(data["demand"])
+
+    # Invalid data are caught before anything is added
+    with s.transact(), pytest.raises(KeyError, match="not_a_par"):
+        add_par_data(s, dict(not_a_par=data["demand"], **data))
+    with s.transact(), pytest.raises(ValueError, match=r"lacks column\(s\) \['node'\]"):
+        add_par_data(s, dict(demand=data["demand"].drop(columns="node")))
+
+    # Data are added in chunks of at most 2 rows
+    with s.transact(), caplog.at_level(logging.INFO, logger="message_ix_models"):
+        assert N == add_par_data(s, data, chunk_size=2)
+
+    assert f"{N} rows in 'demand'" in caplog.messages
+    assert re.match(r"  …added in [\d\.]+ s; \d+ rows/s", caplog.messages[-1])
+
+    # Empty units were replaced with "-"
+    assert {"-"} == set(s.par("demand")["unit"])
+
+    # The caller's data are not modified
+    assert df is data["demand"] and object == df["unit"].dtype
+    assert {"", "-"} == set(df["unit"])
+
+
 def test_as_codes():
     """Forward reference to a child is silently dropped."""
     data = dict(
@@ -111,6 +144,76 @@ def test_broadcast(caplog):
         base.pipe(broadcast, labels, d=["d0"])
 
 
+def _broadcast_reference(df, labels=None, **kwargs):
+    """Original, loop-based implementation of :func:`.broadcast`, for comparison."""
+    if labels is not None:
+        df = pd.concat(
+            [df.assign(**row) for _, row in labels.iterrows()],
+            ignore_index=True,
+            sort=False,
+        )
+    for dim, levels in kwargs.items():
+        df = (
+            pd.concat([df] * len(levels), keys=levels, names=[dim], sort=False)
+            .drop(dim, axis=1)
+            .reset_index(dim)
+            .reset_index(drop=True)
+        )
+    return df
+
+
+def _broadcast_args(N: int) -> tuple[pd.DataFrame, pd.DataFrame, dict]:
+    """Arguments to :func:`.broadcast` that give a result with `N` rows.
+
+    The base data has 10 rows; `labels` contributes a factor of 10; and `N` / 100 is
+    split between two keyword dimensions.
+    """
+    base = make_df(
+        "input", technology=[f"t{i}" for i in range(10)], value=1.0, unit="GWa"
+    )
+    labels = pd.DataFrame(
+        dict(commodity=[f"c{i}" for i in range(10)], level=[f"l{i}" for i in range(10)])
+    )
+    n_node = 10 ** ((len(str(N)) - 3) // 2)
+    kwargs = dict(
+        node_loc=[f"n{i}" for i in range(n_node)],
+        year_act=list(range(N // (100 * n_node))),
+    )
+    return base, labels, kwargs
+
+
+@pytest.mark.parametrize("N", [10**2, 10**3, 10**4])
+def test_broadcast_reference(N) -> None:
+    """:func:`.broadcast` gives identical results to the original implementation."""
+    base, labels, kwargs = _broadcast_args(N)
+
+    expected = base.pipe(_broadcast_reference, labels, **kwargs)
+    result = base.pipe(broadcast, labels, **kwargs)
+
+    # Identical results, including column order and dtypes
+    assert N == len(result)
+    assert_frame_equal(expected, result)
+
+
+def test_broadcast_benchmark() -> None:
+    """Time taken by :func:`.broadcast` and the original implementation."""
+    from time import perf_counter
+
+    N = 10**5
+    base, labels, kwargs = _broadcast_args(N)
+
+    times = []
+    for func in _broadcast_reference, broadcast:
+        start = perf_counter()
+        base.pipe(func, labels, **kwargs)
+        times.append(perf_counter() - start)
+
+    log.info(
+        f"broadcast() to {N:.0e} rows: {times[0]:.3f} s → {times[1]:.3f} s; "
+        f"{times[0] / times[1]:.1f}×"
+    )
+
+
 @pytest.mark.parametrize(
     "data",
     (
@@ -434,3 +537,26 @@ def test_strip_par_data(caplog, test_context):
     )
     # Nothing was actually removed
     assert N == len(s.par("output"))
+
+
+def test_strip_par_data_bulk(test_context):
+    """Multiple elements are stripped together by :func:`.strip_par_data`."""
+    s = make_dantzig(test_context.get_platform())
+
+    elements = ["canning_plant", "transport_from_seattle", "not_a_technology"]
+    filters = dict(technology=elements)
+    N_exp = sum(len(s.par(n, filters=filters)) for n in ("input", "output", "var_cost"))
+
+    dump: dict[str, pd.DataFrame] = dict()
+    with s.transact():
+        total = strip_par_data(s, "technology", elements, dump=dump)
+
+    # Data for both existing elements were removed and dumped
+    assert 0 < N_exp <= total == sum(len(df) for df in dump.values())
+    assert {"canning_plant", "transport_from_seattle"} == set(
+        dump["output"]["technology"]
+    )
+    assert 0 == len(s.par("output", filters=filters))
+
+    # Both existing set elements were removed; the other technology remains
+    assert ["transport_from_san-diego"] == s.set("technology").tolist()
@@ -1,10 +1,11 @@
+import json
 import platform
 import re
 from typing import Optional
 
 import ixmp
 import pytest
-from message_ix import make_df
+from message_ix import Scenario, make_df
 
 from message_ix_models import Workflow, testing
 from message_ix_models.testing import GHA
@@ -206,3 +207,239 @@ def test_workflow(caplog, request, test_context, wf) -> None:
   - None""",
         wf.describe("B"),
     )
+
+
+def test_branches(test_context) -> None:
+    wf = Workflow(test_context)
+    wf.add_step("base", None, target="ixmp://example/m/s")
+    wf.add_step("A", "base", changes_a)
+    wf.add_step("B1", "A", changes_b, value=1.0)
+    wf.add_step("B2", "A", changes_b, value=2.0)
+    wf.add_step("C1", "B1", changes_a)
+    wf.add_step("C2", "B2", changes_a)
+    wf.add_step("D", "C2", changes_a)  # Not needed for the targets below
+    wf.add("all", ["C1", "C2"])
+
+    # The needed steps are split at the fork after "A"
+    assert [
+        (None, ["base", "A"]),
+        (0, ["B1", "C1"]),
+        (0, ["B2", "C2"]),
+    ] == wf.branches(["all"])
+
+    # A single target gives a single branch
+    assert [(None, ["base", "A", "B1"])] == wf.branches(["B1"])
+
+
+def test_run_branches_unpicklable(test_context) -> None:
+    """Context values that cannot be sent to worker processes raise ValueError."""
+    wf = Workflow(test_context)
+    wf.add_step("base", None, target="ixmp://example/m/s")
+    wf.add_step("A", "base", changes_a)
+
+    test_context.foo = lambda: None
+
+    with pytest.raises(ValueError, match="Context.foo cannot be sent to worker"):
+        wf.run("A", jobs=2)
+
+
+def test_summarize() -> None:
+    from message_ix_models.workflow import _summarize
+
+    branches = [(None, ["base", "A"]), (0, ["B1"]), (0, ["B2"])]
+    info = {
+        "base": dict(start=0.0, end=1.0, pid=1),
+        "A": dict(start=1.0, end=2.0, pid=1),
+        "B1": dict(start=2.0, end=5.0, pid=1),
+        "B2": dict(start=2.5, end=4.0, pid=2),
+    }
+
+    result = _summarize(branches, info)
+
+    assert "  B1: 2.0–5.0 s (3.0 s)" in result
+    assert ["  0: none", "  1: 2", "  2: 1"] == result[-3:]
+
+
+def test_run_branch(request, test_context) -> None:
+    from copy import deepcopy
+
+    from message_ix_models import Context
+    from message_ix_models.workflow import _run_branch
+
+    base = testing.bare_res(request, test_context, solved=False)
+    info = dict(
+        platform=base.platform.name,
+        model=base.model,
+        scenario=base.scenario,
+        version=base.version,
+    )
+    steps = [
+        ("A", WorkflowStep(changes_a)),
+        ("B", WorkflowStep(changes_b, value=100.0)),
+    ]
+
+    # Values for the Context in the worker process
+    c = deepcopy(test_context)
+    state = c._values
+    c.delete()
+
+    # Function runs in this process
+    try:
+        result = _run_branch(state, steps, info)
+    finally:
+        Context.get_instance(-1).delete()
+
+    # Information is returned for each step, in order
+    assert ["A", "B"] == [r["step"] for r in result]
+    assert all(r["start"] <= r["end"] for r in result)
+    assert {info["platform"]} == {r["platform"] for r in result}
+
+    # The scenario identified by the last step contains changes from both steps
+    mp = test_context.get_platform()
+    s = Scenario(mp, result[-1]["model"], result[-1]["scenario"], result[-1]["version"])
+    assert "test_tech" in set(s.set("technology"))
+    assert 1 == len(s.par("technical_lifetime"))
+
+
+def test_fingerprint(test_context) -> None:
+    wf = Workflow(test_context)
+    wf.add_step("base", None, target="ixmp://example/m/s")
+    wf.add_step("A", "base", changes_a)
+    wf.add_step("B", "A", changes_b, value=1.0)
+
+    fp = {name: wf.fingerprint(name) for name in ("base", "A", "B")}
+
+    # Fingerprints are distinct and stable
+    assert 3 == len(set(fp.values()))
+    assert fp["B"] == wf.fingerprint("B")
+
+    # Changing keyword arguments changes the fingerprint of the step only
+    wf.add_step("B", "A", changes_b, value=2.0, replace=True)
+    assert fp["A"] == wf.fingerprint("A")
+    assert fp["B"] != wf.fingerprint("B")
+    wf.add_step("B", "A", changes_b, value=1.0, replace=True)
+    assert fp["B"] == wf.fingerprint("B")
+
+    # Changing a precursor step changes the fingerprint of later steps
+    wf.add_step("A", "base", changes_b, replace=True)
+    assert fp["B"] != wf.fingerprint("B")
+    wf.add_step("A", "base", changes_a, replace=True)
+
+    # Changing the target of the base step does, too
+    wf.add_step("base", None, target="ixmp://example/m/s2", replace=True)
+    assert fp["B"] != wf.fingerprint("B")
+    wf.add_step("base", None, target="ixmp://example/m/s", replace=True)
+
+    # Changing settings on the Context does, too
+    test_context.model.regions, regions = "ZZZ", test_context.model.regions
+    try:
+        assert fp["B"] != wf.fingerprint("B")
+    finally:
+        test_context.model.regions = regions
+
+    # …but not identifiers of the platform or scenario
+    test_context.core.scenario_info.update(model="foo", scenario="bar")
+    assert fp["B"] == wf.fingerprint("B")
+
+
+def test_fingerprint_context(caplog, request, test_context) -> None:
+    """Context values that are config classes or sets can be fingerprinted."""
+    from message_ix_models.model.transport import Config
+
+    test_context.model.regions = "R12"
+    Config.from_context(test_context)
+    test_context.foo = {1, 2}
+
+    base = testing.bare_res(request, test_context, solved=False)
+
+    wf = Workflow(test_context)
+    wf.add_step("base", None, target=f"ixmp://{base.platform.name}/{base.url}")
+    wf.add_step("A", "base", changes_a)
+
+    # Fingerprint can be computed and is stable
+    fp = wf.fingerprint("A")
+    assert fp == wf.fingerprint("A")
+
+    # Changing the transport Config changes the fingerprint
+    test_context.transport.dummy_supply = not test_context.transport.dummy_supply
+    assert fp != wf.fingerprint("A")
+
+    # Changing a set changes the fingerprint
+    fp = wf.fingerprint("A")
+    test_context.foo = {2, 3}
+    assert fp != wf.fingerprint("A")
+
+    # The workflow runs, with or without manifest files
+    wf.run("A")
+    wf.run("A", manifest=True)
+    assert wf.manifest_dir.joinpath(f"{wf.fingerprint('A')}.json").exists()
+
+    # A value that cannot be encoded prevents fingerprinting…
+    test_context.foo = object()
+    with pytest.raises(ValueError, match="Cannot fingerprint Context.foo"):
+        wf.fingerprint("A")
+
+    # …but the workflow still runs, without resume
+    caplog.clear()
+    wf.run("A", resume=True)
+    assert "run without manifest files or resume" in caplog.messages[0]
+    assert not any(m.startswith("Resume:") for m in caplog.messages)
+
+
+def test_resume(caplog, request, test_context) -> None:
+    base = testing.bare_res(request, test_context, solved=False)
+    # Load the default version of `base`
+    url = f"ixmp://{base.platform.name}/{base.model}/{base.scenario}"
+
+    wf = Workflow(test_context)
+    wf.add_step("base", None, target=url)
+    wf.add_step("A", "base", changes_a, clone=True, target=f"{base.model}/resume A")
+    wf.add_step("B", "A", changes_b, value=100.0)
+
+    # Run the workflow once without manifests; no files are written
+    wf.run("B")
+    for name in ("base", "A", "B"):
+        assert not wf.manifest_dir.joinpath(f"{wf.fingerprint(name)}.json").exists()
+
+    # Run again; manifest files are written
+    wf.run("B", manifest=True)
+    for name in ("base", "A", "B"):
+        assert wf.manifest_dir.joinpath(f"{wf.fingerprint(name)}.json").exists()
+
+    # Change the kwargs of the last step and resume
+    wf.add_step("B", "A", changes_b, value=200.0, replace=True)
+    caplog.clear()
+    s = wf.run("B", resume=True)
+
+    # The unchanged steps are skipped; the changed step runs
+    assert f"Resume: skip step 'A'; load {url.split('/')[0]}" in caplog.messages[0]
+    assert not any("changes_a" in m for m in caplog.messages)
+    assert any(m.startswith("Execute <function changes_b") for m in caplog.messages)
+    assert [200.0] == s.par("technical_lifetime")["value"].tolist()
+
+    # The original step is restored
+    assert "changes_a" == wf.graph["A"][0].action.__name__
+
+    # Resume again: nothing runs
+    caplog.clear()
+    wf.run("B", resume=True)
+    assert caplog.messages[0].startswith("Resume: skip step 'B'")
+    assert not any(m.startswith("Execute") for m in caplog.messages)
+
+    # A missing scenario version is not used
+    path = wf.manifest_dir.joinpath(f"{wf.fingerprint('B')}.json")
+    info = json.loads(path.read_text())
+    path.write_text(json.dumps(dict(info, version=info["version"] + 100)))
+    caplog.clear()
+    wf.run("B", resume=True)
+    assert caplog.messages[0].startswith("Resume: skip step 'A'")
+
+    # A new default version of the base scenario changes the fingerprints of all steps
+    fp = {name: wf.fingerprint(name) for name in ("base", "A", "B")}
+    base.clone().set_as_default()
+    assert all(fp[name] != wf.fingerprint(name) for name in fp)
+
+    # …so no step is skipped
+    caplog.clear()
+    wf.run("B", resume=True)
+    assert not any(m.startswith("Resume:") for m in caplog.messages)
@@ -1,8 +1,11 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from message_ix_models.model.structure import get_codes
 from message_ix_models.tools.costs import Config
 from message_ix_models.tools.costs.gdp import (
+    _constrain_cost_ratio,
     adjust_cost_ratios_with_gdp,
     process_raw_ssp_data,
 )
@@ -94,3 +97,44 @@ def test_adjust_cost_ratios_with_gdp(test_context, module) -> None:
     assert all(
         result.query("region == @config.ref_region").reg_cost_ratio_adj.values == 1.0
     )
+
+
+def _constrain_cost_ratio_reference(df: pd.DataFrame, base_year):
+    """Previous implementation of :func:`._constrain_cost_ratio`."""
+
+    def _constrain(df: pd.DataFrame, base_year):
+        ref = df.query("year == @base_year").iloc[0]
+        if ref.gdp_ratio_reg_to_reference < 1 and ref.reg_cost_ratio_adj > 1:
+            return df.assign(
+                reg_cost_ratio_adj=df.reg_cost_ratio_adj.clip(
+                    upper=ref.reg_cost_ratio_adj
+                )
+            )
+        else:
+            return df
+
+    return df.groupby(
+        ["scenario_version", "scenario", "region", "message_technology"],
+        group_keys=False,
+    ).apply(_constrain, base_year)
+
+
+def test_constrain_cost_ratio() -> None:
+    from .test_projections import grid
+
+    # Random data for a random subset of the full grid
+    rng = np.random.default_rng(seed=0)
+    df = grid(scenarios=["SSP1", "SSP2"]).sample(frac=0.05, random_state=rng)
+    df = pd.concat(
+        [df.assign(scenario_version=v, year=y) for v in "AB" for y in (2025, 2050)],
+        ignore_index=True,
+    )
+    df = df.assign(
+        gdp_ratio_reg_to_reference=rng.uniform(0.5, 1.5, len(df)),
+        reg_cost_ratio_adj=rng.uniform(0.5, 1.5, len(df)),
+    )
+
+    # Results are identical to the previous implementation
+    pd.testing.assert_frame_equal(
+        _constrain_cost_ratio_reference(df, 2025), _constrain_cost_ratio(df, 2025)
+    )
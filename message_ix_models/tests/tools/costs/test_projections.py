@@ -1,10 +1,19 @@
+import logging
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
 import pytest
 from message_ix import make_df
+from numpy.polynomial import Polynomial
 
 from message_ix_models import testing
 from message_ix_models.model.structure import get_codelist
 from message_ix_models.tools.costs import Config, create_cost_projections
-from message_ix_models.util import add_par_data
+from message_ix_models.tools.costs.projections import _fit_linear
+from message_ix_models.util import add_par_data, package_data_path
+
+log = logging.getLogger(__name__)
 
 
 @pytest.mark.parametrize(
@@ -147,3 +156,87 @@ def test_ccs_costs(module):
 
     # Assert that costs for CCS technologies are greater than for non-CCS technologies
     assert ccs.sub(non_ccs).dropna().ge(0).all().all()
+
+
+def grid(node: str = "R12", scenarios=("LED", "SSP1", "SSP2", "SSP3", "SSP4", "SSP5")):
+    """Return a data frame with all (scenario, technology, region) for all modules."""
+    technology = set()
+    for module in "energy", "materials", "cooling":
+        path = package_data_path("costs", module, "tech_map.csv")
+        technology |= set(pd.read_csv(path, comment="#")["message_technology"])
+
+    region = list(map(str, get_codelist(f"node/{node}")["World"].child))
+    return pd.MultiIndex.from_product(
+        [scenarios, sorted(technology), region],
+        names=["scenario", "message_technology", "region"],
+    ).to_frame(index=False)
+
+
+def _fit_linear_reference(df, by, x, y, x_predict, name):
+    """Previous implementation of :func:`._fit_linear`."""
+    x_index = pd.Index(x_predict, name=x)
+
+    def _predict(df: pd.DataFrame) -> pd.DataFrame:
+        p = Polynomial.fit(df[x], df[y], deg=1)
+        return pd.DataFrame({name: p(np.array(x_predict))}, index=x_index)
+
+    return df.groupby(by, group_keys=True).apply(_predict).reset_index()
+
+
+@pytest.mark.parametrize(
+    "scenarios", [("SSP2",), pytest.param(None, marks=pytest.mark.slow)]
+)
+def test_fit_linear(scenarios) -> None:
+    """:func:`._fit_linear` matches the previous implementation.
+
+    The time taken by each is logged. With `scenarios` :obj:`None`, this uses the full
+    R12 × all-modules × all-scenarios grid.
+    """
+    df = grid(**(dict(scenarios=scenarios) if scenarios else {}))
+    rng = np.random.default_rng(seed=0)
+    df = pd.concat([df.assign(year=2025), df.assign(year=2050)], ignore_index=True)
+    df = df.assign(inv_cost_tmp=rng.uniform(100, 1000, len(df)))
+
+    config = Config()
+    args = (
+        ["scenario", "message_technology", "region"],
+        "year",
+        "inv_cost_tmp",
+        config.seq_years,
+        "inv_pre_converge_decay",
+    )
+
+    times, results = [], []
+    for func in _fit_linear_reference, _fit_linear:
+        start = perf_counter()
+        results.append(func(df, *args))
+        times.append(perf_counter() - start)
+
+    pd.testing.assert_frame_equal(*results, check_dtype=False)
+    log.info(
+        f"{len(df) // 2} groups: {times[0]:.3f} s → {times[1]:.3f} s "
+        f"({times[0] / times[1]:.1f}×)"
+    )
+
+
+def test_fit_linear_edge_cases() -> None:
+    """:func:`._fit_linear` handles groups with NaN or a single value of `x`."""
+    df = pd.DataFrame(
+        dict(
+            g=list("aabbccdd"),
+            x=[2020, 2050] * 4,
+            y=[1.0, 4.0, 2.0, np.nan, np.nan, np.nan, 3.0, 3.0],
+        )
+    )
+    # Group "d" has a single distinct value of x
+    df.loc[7, "x"] = 2020
+
+    result = _fit_linear(df, ["g"], "x", "y", [2020, 2035, 2050], "z")
+    z = result.set_index(["g", "x"])["z"]
+
+    # Ordinary group
+    assert np.allclose([1.0, 2.5, 4.0], z["a"])
+    # NaN y: the other point only; no data: NaN; zero variance: mean of y
+    assert np.allclose([2.0] * 3, z["b"])
+    assert z["c"].isna().all()
+    assert np.allclose([3.0] * 3, z["d"])
@@ -1,14 +1,12 @@
 import genno
+import numpy as np
 import pandas as pd
 import pytest
 
 from message_ix_models.tools.exo_data import prepare_computer
-from message_ix_models.tools.iea.eei import IEA_EEI  # noqa: F401
+from message_ix_models.tools.iea.eei import IEA_EEI, _map_unique, wavg  # noqa: F401
 from message_ix_models.util import HAS_MESSAGE_DATA
-
-pytestmark = pytest.mark.skipif(
-    condition=not HAS_MESSAGE_DATA, reason="No fuzzed/random test data for this source."
-)
+from message_ix_models.util.pycountry import iso_3166_alpha_3
 
 # Infill data for R12 nodes not present in the IEA data
 # NB these are hand-picked as of 2022-07-20 so that the ratio of freight activity / GDP
@@ -30,6 +28,9 @@ R12_MAP = [
 ]
 
 
+@pytest.mark.skipif(
+    condition=not HAS_MESSAGE_DATA, reason="No fuzzed/random test data for this source."
+)
 class TestIEA_EEI:
     @pytest.mark.parametrize(
         "source_kw, dimensionality",
@@ -74,3 +75,51 @@ class TestIEA_EEI:
         assert 400 <= result.size
         assert {"n", "y"} | dimensionality == set(result.dims)
         assert N_n == len(result.coords["n"])
+
+
+def test_map_unique() -> None:
+    s = pd.Series(["Austria", "Korea", "Foo", "Austria", np.nan], index=list("abcde"))
+
+    result = _map_unique(s, iso_3166_alpha_3)
+    assert ["AUT", "KOR", None, "AUT", None] == result.tolist()
+    assert s.index.equals(result.index)
+
+
+def _wavg_reference(measure, df, weight_data) -> pd.DataFrame:
+    """Previous implementation of :func:`.wavg`, for the given weights."""
+    id_cols = ["region", "year", "Mode/vehicle type"]
+    data = df.merge(weight_data, on=id_cols)
+
+    def _wavg(group):
+        d = np.ma.masked_invalid(group["value_x"].values)
+        w = np.ma.masked_invalid(group["value_y"].values)
+        return np.ma.average(d, weights=w)
+
+    return (
+        data.groupby(id_cols)
+        .apply(_wavg, include_groups=False)
+        .rename("value")
+        .reset_index()
+        .assign(units=data["units_x"].unique()[0], variable=measure)
+    )
+
+
+def test_wavg() -> None:
+    rng = np.random.default_rng(seed=0)
+    index = pd.MultiIndex.from_product(
+        [["R1", "R2"], [2000, 2010], ["Cars", "Buses"], range(5)],
+        names=["region", "year", "Mode/vehicle type", "n"],
+    )
+    df = pd.DataFrame(dict(value=rng.random(len(index)), units="kg"), index=index)
+    df.iloc[::7, 0] = np.nan
+    weights = df.assign(value=rng.random(len(index)), units="vkm")
+    weights.iloc[::5, 0] = np.nan
+    df, weights = df.reset_index(), weights.reset_index()
+
+    result = wavg("Fuel intensity", df, {"vehicle-kilometres": weights})
+
+    # Result has the expected structure and values
+    assert 8 == len(result)
+    pd.testing.assert_frame_equal(
+        _wavg_reference("Fuel intensity", df, weights), result
+    )
@@ -3,6 +3,7 @@
 from importlib.metadata import version
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 import pytest
 from genno import Computer
@@ -12,9 +13,13 @@ from message_ix_models.testing import GHA
 from message_ix_models.tools.exo_data import prepare_computer
 from message_ix_models.tools.iea.web import (
     DIMS,
+    _query_to_expression,
+    convert_to_parquet,
     generate_code_lists,
     get_mapping,
+    iea_web_data_for_query,
     load_data,
+    read_fwf,
 )
 from message_ix_models.util import HAS_MESSAGE_DATA
 
@@ -146,6 +151,113 @@ def test_load_data(test_context, tmp_path, provider, edition):
     assert (set(DIMS) & {"Value"}) < set(result.columns)
 
 
+@pytest.mark.parametrize(
+    "query_expr",
+    (
+        "TIME >= 1980",
+        "TIME > 0",
+        "MEASURE == 'TJ' and 1990 <= TIME < 2000 and COUNTRY in ['A', 'B']",
+        "~(FLOW == 'F1') | (PRODUCT not in ('P0',))",
+        # Not supported by _query_to_expression(); applied after reading
+        "TIME.isin([1990, 2000])",
+    ),
+)
+def test_iea_web_data_for_query(tmp_path, query_expr) -> None:
+    # Random data in the OECD CSV format
+    rng = np.random.default_rng(seed=0)
+    N = 10_000
+    df = pd.DataFrame(
+        {
+            "COUNTRY": rng.choice(list("ABCD"), N),
+            "Country": "foo",  # Extra column, not read
+            "PRODUCT": rng.choice(["P0", "P1"], N),
+            "FLOW": rng.choice(["F0", "F1"], N),
+            "MEASURE": rng.choice(["TJ", "KTOE"], N),
+            "TIME": rng.integers(1970, 2020, N),
+            "Value": rng.random(N),
+        }
+    )
+    df.loc[::7, "Value"] = np.nan
+    # Data split across 2 files
+    df.iloc[: N // 2].to_csv(tmp_path.joinpath("0.csv"), index=False, na_rep=".. ")
+    df.iloc[N // 2 :].to_csv(tmp_path.joinpath("1.csv"), index=False, na_rep=".. ")
+
+    result = iea_web_data_for_query(tmp_path, "0.csv", "1.csv", query_expr=query_expr)
+
+    # Result contains the same data as a query on the full data
+    expected = (
+        df.query("MEASURE == 'TJ'")
+        .query(query_expr)
+        .dropna(subset=["Value"])[DIMS + ["Value"]]
+    )
+    sort = list(result.columns)
+    pd.testing.assert_frame_equal(
+        expected.sort_values(sort, ignore_index=True),
+        result.sort_values(sort, ignore_index=True),
+    )
+
+
+def test_convert_to_parquet(tmp_path, test_context) -> None:
+    test_context.core.cache_path = tmp_path.joinpath("cache")
+    pd.DataFrame(
+        dict(COUNTRY=["A"], PRODUCT="P0", FLOW="F0", MEASURE="TJ", TIME=1990, Value=1.0)
+    ).to_csv(tmp_path.joinpath("0.csv"), index=False)
+
+    # Dataset is stored within Config.cache_path
+    result = convert_to_parquet(tmp_path, "0.csv")
+    assert test_context.core.cache_path.joinpath("iea") == result.parent
+    assert result.joinpath("_SUCCESS").exists()
+
+    # Failed conversion raises and leaves no partial dataset
+    tmp_path.joinpath("1.csv").write_text("COUNTRY,TIME\nA,foo\n")
+    with pytest.raises(Exception):
+        convert_to_parquet(tmp_path, "1.csv")
+    assert {result} == set(result.parent.iterdir())
+
+
+FWF = """WORLD       HARDCOAL    2005  TOTTRANS    TJ        ..
+DOMINICANR  NATGAS      1970  TOTTRANS    KTOE      5477.525
+
+AUSTRALI    NATGAS      2018  INDPROD     TJ        -12 """
+
+
+@pytest.mark.parametrize("block_size", (10, 1 << 20))
+def test_read_fwf(tmp_path, block_size) -> None:
+    path = tmp_path.joinpath("WB.TXT")
+    path.write_text(FWF)
+
+    # Fixed-width data can be read
+    result = read_fwf(path, block_size=block_size).read_pandas()
+
+    # Blank line is skipped; values are parsed
+    assert 3 == len(result)
+    assert DIMS + ["Value"] == list(result.columns)
+    assert ["WORLD", "DOMINICANR", "AUSTRALI"] == result["COUNTRY"].tolist()
+    assert [2005, 1970, 2018] == result["TIME"].tolist()
+    assert (
+        np.isnan(result["Value"][0])
+        and [5477.525, -12.0] == result["Value"][1:].tolist()
+    )
+
+    # Data in this format are converted and read by iea_web_data_for_query()
+    result = iea_web_data_for_query(tmp_path, "WB.TXT", query_expr="TIME > 2000")
+    assert ["AUSTRALI"] == result["COUNTRY"].tolist()
+
+    # Lines with missing fields raise an exception
+    path.write_text(FWF + "\nWORLD  HARDCOAL  2005\n")
+    with pytest.raises(ValueError, match="Line without 6 fields: 'WORLD  HARDCOAL"):
+        read_fwf(path).read_all()
+
+
+def test_query_to_expression() -> None:
+    assert "(TIME >= 1980)" == str(_query_to_expression("TIME >= 1980"))
+
+    with pytest.raises(ValueError, match="Unsupported query syntax"):
+        _query_to_expression("`A B` == 1")
+    with pytest.raises(ValueError, match="Unsupported query syntax"):
+        _query_to_expression("TIME + 1 > 1980")
+
+
 @MARK_DASK_PYTHON
 @pytest.mark.parametrize("provider, edition", PROVIDER_EDITION)
 def test_generate_code_lists(tmp_path, provider, edition):
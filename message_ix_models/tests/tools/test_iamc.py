@@ -1,5 +1,16 @@
+import genno
+import numpy as np
+import pandas as pd
+import pytest
+
 from message_ix_models.project.advance.data import LOCATION, NAME
-from message_ix_models.tools.iamc import describe
+from message_ix_models.tools.iamc import (
+    _index_selection,
+    _read_indexed,
+    describe,
+    iamc_like_data_for_query,
+    to_quantity,
+)
 from message_ix_models.util import MESSAGE_MODELS_PATH, package_data_path
 
 
@@ -32,3 +43,74 @@ def test_describe(test_context):
     # from message_ix_models.util.sdmx import write
 
     # write(sm, basename="ADVANCE")
+
+
+@pytest.mark.parametrize(
+    "query, expected",
+    (
+        ("VARIABLE == 'GDP'", [slice(None), slice(None), ["GDP"]]),
+        (
+            "SCENARIO in ('s0', 's1') and VARIABLE == 'GDP' and MODEL != 'm0'",
+            [slice(None), ["s0", "s1"], ["GDP"]],
+        ),
+        # Conditions combined with "or" are not used
+        ("MODEL == 'm0' or VARIABLE == 'GDP'", [slice(None)] * 3),
+        ("`MODEL` == 'm0'", [slice(None)] * 3),
+    ),
+)
+def test_index_selection(query, expected) -> None:
+    assert expected == _index_selection(query, ["MODEL", "SCENARIO", "VARIABLE"])
+
+
+def test_iamc_like_data_for_query(test_context, tmp_path) -> None:
+    test_context.cache_path = tmp_path.joinpath("cache")
+
+    # Random data in IAMC wide format
+    index = pd.MultiIndex.from_product(
+        [["m0", "m1"], ["s0", "s1", "s2"], ["AUT", "Foo"], ["GDP", "POP", "Other"]],
+        names=["Model", "Scenario", "Region", "Variable"],
+    )
+    rng = np.random.default_rng(seed=0)
+    data = (
+        pd.DataFrame(
+            rng.random((len(index), 3)), index=index, columns=[2020, 2030, 2040]
+        )
+        .reset_index()
+        .assign(Unit="kg")
+    )
+    path = tmp_path.joinpath("data.csv")
+    data.to_csv(path, index=False)
+
+    _read_indexed.cache_clear()
+    for query in (
+        "Scenario == 's1' and Variable == 'GDP' and Model == 'm0'",
+        "Variable == 'POP' and Scenario == 's2' and Model != 'm1'",
+        "Variable == 'Other' and Scenario in ['s0'] and 1 == 1 and Model == 'm1'",
+    ):
+        result = iamc_like_data_for_query(path, query)
+
+        # Result is the same as converting the full data
+        genno.testing.assert_qty_equal(
+            to_quantity(pd.read_csv(path), query=query), result
+        )
+
+    # The file is read only once
+    assert 1 == _read_indexed.cache_info().misses
+
+    # Keyword arguments that are not JSON-serializable: the file is read, but not kept
+    # in memory
+    def to_g(value: str) -> str:
+        return value.replace("kg", "g")
+
+    result = iamc_like_data_for_query(
+        path,
+        "Model == 'm0' and Scenario == 's0' and Variable == 'GDP'",
+        engine="c",
+        converters={"Unit": to_g},
+    )
+    assert "gram" == str(result.units)
+    assert 1 == _read_indexed.cache_info().currsize
+
+    # Query matching no data raises an exception
+    with pytest.raises(RuntimeError, match="0 rows matching"):
+        iamc_like_data_for_query(path, "Variable == 'Bar'")
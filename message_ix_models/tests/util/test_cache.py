@@ -1,15 +1,28 @@
+import json
 import logging
+import os
+import subprocess
+import sys
+import time
 from copy import deepcopy
+from datetime import timedelta
+from time import perf_counter
 
+import genno
+import genno.testing
+import numpy as np
+import pandas as pd
 import pytest
 import sdmx.model.v21 as sdmx_model
 import xarray as xr
 from genno.caching import hash_args
 from ixmp.testing import assert_logs
+from pandas.testing import assert_frame_equal
 
 import message_ix_models.util.cache
 from message_ix_models import ScenarioInfo
 from message_ix_models.util import cached
+from message_ix_models.util.cache import CacheIndex, _quantity, persist
 
 log = logging.getLogger(__name__)
 
@@ -24,6 +37,56 @@ class TestEncoder:
         expected = "40a0735385448dcbe745904ebfec7255995ca451"
         assert expected == hash_args(codes0, bar="baz") == hash_args(codes1, bar="baz")
 
+    @staticmethod
+    def _quantity(N: int) -> "genno.Quantity":
+        idx = pd.MultiIndex.from_product(
+            [[f"n{i}" for i in range(N // 100)], list(range(2000, 2100))],
+            names=["n", "y"],
+        )
+        return genno.Quantity(
+            pd.Series(np.arange(len(idx), dtype=float), idx), units="kg"
+        )
+
+    def test_quantity(self):
+        """Digests of :class:`.Quantity` are stable and sensitive to contents."""
+        q = self._quantity(1000)
+
+        # Same contents → same key
+        assert hash_args(q) == hash_args(self._quantity(1000))
+
+        # Different values, coords, or units → different key
+        assert hash_args(q) != hash_args(q * 2)
+        assert hash_args(q) != hash_args(self._quantity(1100))
+        assert hash_args(q) != hash_args(genno.Quantity(q, units="g"))
+
+        # Same key in a separate Python process, i.e. with different PYTHONHASHSEED
+        code = (
+            "from genno.caching import hash_args\n"
+            "import message_ix_models.util.cache\n"
+            "from message_ix_models.tests.util.test_cache import TestEncoder\n"
+            "print(hash_args(TestEncoder._quantity(1000)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        )
+        assert hash_args(q) == result.stdout.strip()
+
+    def test_quantity_benchmark(self):
+        """Time to compute cache keys for a :class:`.Quantity` of 10⁵ elements."""
+        N = 10**5
+        q = self._quantity(N)
+
+        times = []
+        for func in (lambda o: tuple(o.to_series().to_dict())), _quantity:
+            start = perf_counter()
+            json.dumps(func(q))
+            times.append(perf_counter() - start)
+
+        log.info(
+            f"Cache key for {N:.0e} elements: {times[0]:.3f} s → {times[1]:.4f} s; "
+            f"{times[0] / times[1]:.0f}×"
+        )
+
 
 def test_cached(caplog, test_context, tmp_path):
     """:func:`.cached` works as expected.
@@ -107,3 +170,293 @@ def test_cached(caplog, test_context, tmp_path):
         TypeError, match="Object of type slice is not JSON serializable"
     ):
         func1(arg=slice(None))
+
+
+def test_persist_encoder() -> None:
+    """:class:`._PersistEncoder` distinguishes values that differ in any element."""
+    from operator import itemgetter
+
+    from message_ix_models.util.cache import _PersistEncoder, _Uncacheable
+
+    def encode(o):
+        return json.dumps(o, cls=_PersistEncoder)
+
+    # Large arrays, for which repr() is abbreviated
+    a = np.arange(5000.0)
+    b = a.copy()
+    b[2500] = -1.0
+    assert encode(a) == encode(a.copy()) != encode(b)
+    assert encode(a) != encode(a.reshape(50, 100)) != encode(a.astype(int))
+
+    assert encode(itemgetter(0)) != encode(itemgetter(1))
+
+    # Objects with no other usable representation are not cacheable
+    with pytest.raises(_Uncacheable):
+        encode(object())
+
+
+def test_persist(caplog, monkeypatch, test_context, tmp_path) -> None:
+    """:func:`.persist` stores and reloads the values of keys in a graph."""
+    from dask.local import get_sync
+    from dask.optimization import cull
+
+    cache_path = tmp_path.joinpath("cache")
+    calls = []
+
+    def load(path):
+        calls.append("load")
+        df = pd.read_csv(path)
+        return genno.Quantity(df.set_index("x")["value"], units="kg")
+
+    def double(qty, factor):
+        calls.append("double")
+        return qty * factor
+
+    path = tmp_path.joinpath("input.csv")
+    path.write_text("x,value\na,1.0\nb,2.0\n")
+    dsk = {
+        "path": path,
+        "factor": 2.0,
+        "a": (load, "path"),
+        "b": (double, "a", "factor"),
+        "mp": test_context.get_platform(),
+        "c": (lambda qty, mp: qty, "b", "mp"),
+    }
+    keys = ["a", "b", "c", "factor"]
+
+    def compute(dsk):
+        # Same as in .transport.build.compute()
+        result, _ = cull(persist(dsk, keys, cache_path), "b")
+        return get_sync(result, "b")
+
+    # Values are computed and stored
+    result0 = compute(dsk)
+    assert ["load", "double"] == calls
+    assert 2 == len(list(cache_path.glob("*.arrow")))
+
+    # Key depending on an ixmp.Platform is not cached; nor a literal value
+    persisted = persist(dsk, keys, cache_path)
+    assert persisted["c"] is dsk["c"] and persisted["factor"] is dsk["factor"]
+
+    # Value of "b" is loaded; "a" is not computed or loaded
+    calls.clear()
+    with caplog.at_level(logging.INFO, "message_ix_models"):
+        result1 = compute(dsk)
+    assert [] == calls
+    assert "Cache hit for 'b'" in caplog.messages
+    genno.testing.assert_qty_equal(result0, result1)
+    assert 1 == CacheIndex(cache_path).stats()["hits"].sum()
+
+    # Changed value of an upstream key invalidates the cache for "b" only
+    compute(dsk | {"factor": 3.0})
+    assert ["double"] == calls
+
+    # Changed input file invalidates the cache for both
+    calls.clear()
+    path.write_text("x,value\na,1.0\nb,3.0\n")
+    compute(dsk)
+    assert ["load", "double"] == calls
+
+    # Changed package version invalidates the cache
+    calls.clear()
+    monkeypatch.setattr(message_ix_models, "__version__", "0.0.0")
+    compute(dsk)
+    assert ["load", "double"] == calls
+    monkeypatch.undo()
+
+    # Values are recomputed when SKIP_CACHE is set
+    calls.clear()
+    message_ix_models.util.cache.SKIP_CACHE = True
+    try:
+        compute(dsk)
+    finally:
+        message_ix_models.util.cache.SKIP_CACHE = False
+    assert ["load", "double"] == calls
+
+
+class TestArrow:
+    @pytest.fixture
+    def funcs(self, test_context, tmp_path):
+        test_context.cache_path = tmp_path.joinpath("cache")
+
+        @cached
+        def func5(n):
+            return pd.DataFrame(
+                dict(
+                    n=np.arange(n) % 3,
+                    t=pd.Categorical(np.array(["a", "b"])[np.arange(n) % 2]),
+                    value=np.arange(n, dtype=float),
+                )
+            ).set_index("n")
+
+        @cached
+        def func6(n):
+            return TestEncoder._quantity(n)
+
+        @cached
+        def func7(n):
+            # Cannot be represented in Arrow
+            return pd.DataFrame(dict(mixed=[1, "a"] * n))
+
+        yield func5, func6, func7
+
+        test_context.cache_path = None
+
+    def test_dataframe(self, funcs, tmp_path) -> None:
+        func5, _, func7 = funcs
+        cache_path = tmp_path.joinpath("cache")
+
+        df = func5(10)
+
+        # Stored as Arrow IPC; round-trips exactly on a cache hit
+        assert 1 == len(list(cache_path.glob("func5-*.arrow")))
+        assert_frame_equal(df, func5(10))
+
+        # Projection and filters
+        expected = df.query("value >= 5")[["value"]]
+        for _ in range(2):  # Cache miss, then hit
+            result = func5.project(columns=["value"], filters=[("value", ">=", 5)])(11)
+            assert_frame_equal(expected, result.head(5))
+
+        # Data that cannot be represented in Arrow are pickled
+        assert 2 == len(func7(1))
+        assert 1 == len(list(cache_path.glob("func7-*.pickle")))
+        assert 2 == len(func7(1))
+
+    def test_quantity(self, funcs, tmp_path) -> None:
+        _, func6, _ = funcs
+
+        q0 = func6(300)
+        q1 = func6(300)
+        assert 1 == len(list(tmp_path.joinpath("cache").glob("func6-*.arrow")))
+        genno.testing.assert_qty_equal(q0, q1)
+        assert q0.units == q1.units
+
+        # Filters apply to dimensions
+        q2 = func6.project(filters=[("n", "in", ["n0", "n1"])])(300)
+        assert {"n0", "n1"} == set(q2.coords["n"].values)
+
+        # Columns cannot be selected
+        with pytest.raises(ValueError):
+            func6.project(columns=["n"])(300)
+
+    def test_pickle_fallback(self, funcs, tmp_path) -> None:
+        """Values that Arrow would not round-trip exactly are pickled."""
+
+        @cached
+        def func8(x):
+            return genno.Quantity(x, units="kg")
+
+        @cached
+        def func9(n):
+            return pd.DataFrame({2020: np.arange(n, dtype=float), "name": ["a"] * n})
+
+        # 0-dimensional Quantity; cache miss, then hit
+        for _ in range(2):
+            q = func8(1.5)
+            assert 0 == len(q.dims) and 1.5 == q.item()
+            assert "kilogram" == str(q.units)
+
+        # DataFrame with mixed-type column labels
+        expected = pd.DataFrame({2020: np.arange(3, dtype=float), "name": ["a"] * 3})
+        for _ in range(2):
+            assert_frame_equal(expected, func9(3))
+            assert [2020, "name"] == list(func9(3).columns)
+
+        assert 2 == len(list(tmp_path.joinpath("cache").glob("func*.pickle")))
+
+
+class TestCacheIndex:
+    @pytest.fixture
+    def funcs(self, test_context, tmp_path):
+        test_context.cache_path = tmp_path.joinpath("cache")
+
+        @cached
+        def func2(x):
+            return "x" * x
+
+        @cached
+        def func3(x):
+            return list(range(x))
+
+        yield func2, func3
+
+        test_context.cache_path = None
+        test_context.core.cache_max_size = None
+
+    def test_index(self, monkeypatch, funcs, tmp_path) -> None:
+        func2, func3 = funcs
+        index = CacheIndex(tmp_path.joinpath("cache"))
+
+        # 3 misses, then 2 hits
+        for x in 10, 1000, 10, 10:
+            func2(x)
+        func3(10)
+
+        # Entries are indexed, least recently used first
+        df = index.entries()
+        assert 3 == len(df)
+        assert ["func3", "func2", "func2"] == df["func"].tolist()[::-1]
+        assert 2 == df.query("func == 'func2'")["hits"].max()
+
+        # Hits and misses are counted
+        stats = index.stats()
+        assert [2, 0] == stats["hits"].tolist()
+        assert [2, 1] == stats["misses"].tolist()
+
+        # A file not written via cached() is indexed by sync(), using its mtime
+        path = tmp_path.joinpath("cache", f"func4-{'0' * 40}.pickle")
+        path.write_bytes(b"foo")
+        os.utime(path, (0, 0))
+        assert 4 == len(index.entries())
+
+        # Prune by age compares with the current time in UTC: in a local time zone
+        # ahead of UTC, only the old file is removed
+        monkeypatch.setenv("TZ", "Etc/GMT-12")
+        if hasattr(time, "tzset"):  # Not on Windows
+            time.tzset()
+        try:
+            assert [path] == index.prune(max_age=timedelta(hours=1), dry_run=True)
+        finally:
+            monkeypatch.undo()
+            if hasattr(time, "tzset"):
+                time.tzset()
+
+        # Prune with dry_run=True does nothing
+        assert 1 <= len(index.prune(max_size=1000, dry_run=True))
+        assert 4 == len(index.entries())
+
+        # Prune by size removes the least recently used files
+        removed = index.prune(max_size=1000)
+        assert path in removed and not path.exists()
+        assert 1000 >= index.entries()["size"].sum()
+
+        # Prune by function name
+        index.prune(func="func2")
+        assert {"func3"} == set(index.entries()["func"])
+
+    def test_max_size(self, funcs, test_context, tmp_path) -> None:
+        """Automatic pruning according to :attr:`.Config.cache_max_size`."""
+        func2, _ = funcs
+        test_context.core.cache_max_size = 1500
+
+        for x in 1000, 1001, 10:
+            func2(x)
+
+        df = CacheIndex(tmp_path.joinpath("cache")).entries()
+        assert 1500 >= df["size"].sum()
+        assert 2 == len(df)
+
+    def test_cli(self, mix_models_cli, tmp_path) -> None:
+        mix_models_cli.assert_exit_0(["cache", "ls"])
+        mix_models_cli.assert_exit_0(["cache", "prune", "--max-size=1G", "--dry-run"])
+
+        path = tmp_path.joinpath("stats.csv")
+        mix_models_cli.assert_exit_0(["cache", "stats", f"--output={path}"])
+        assert path.exists()
+
+        # Missing or invalid options
+        result = mix_models_cli.invoke(["cache", "prune"])
+        assert 0 != result.exit_code
+        result = mix_models_cli.invoke(["cache", "prune", "--max-size=foo"])
+        assert 0 != result.exit_code
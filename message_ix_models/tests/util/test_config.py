@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
 
 import pytest
+from sdmx.model.common import Code
 
 from message_ix_models.util.config import ConfigHelper
+from message_ix_models.util.scenarioinfo import Spec
 
 
 class TestConfigHelper:
@@ -62,6 +64,29 @@ class TestConfigHelper:
         with pytest.raises(ValueError):
             cls.from_dict(values)
 
+    def test_hexdigest(self, cls, c) -> None:
+        assert 32 == len(c.hexdigest())
+        assert c.hexdigest(5) == c.hexdigest()[:5]
+        assert c.hexdigest() == cls(foo_1=99, foo_2="bar", foo_3=False).hexdigest()
+        assert c.hexdigest() != c.replace(foo_1=98).hexdigest()
+
+        @dataclass
+        class Config4(ConfigHelper):
+            spec: Spec = field(default_factory=Spec)
+
+        def deep(N: int) -> Config4:
+            # A hierarchy of codes deeper than the recursion limit
+            codes = [Code(id=f"t{i}") for i in range(N)]
+            for parent, child in zip(codes, codes[1:]):
+                parent.append_child(child)
+            result = Config4()
+            result.spec.add.set["technology"].extend(codes)
+            return result
+
+        # Method runs
+        assert deep(2000).hexdigest() == deep(2000).hexdigest()
+        assert deep(2000).hexdigest() != deep(2001).hexdigest()
+
     def test_read_file(self, caplog, tmp_path, cls, cls2, c, c2):
         # Write a YAML snippet to file
         yaml_path = tmp_path.joinpath("config.yaml")
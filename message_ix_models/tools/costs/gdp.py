@@ -123,6 +123,36 @@ def process_raw_ssp_data(context: Context, config: Config) -> pd.DataFrame:
     return result
 
 
+def _constrain_cost_ratio(df: pd.DataFrame, base_year: int) -> pd.DataFrame:
+    """Constrain "reg_cost_ratio_adj".
+
+    In cases where gdp_ratio_reg_to_reference is < 1 and reg_cost_ratio_adj > 1 in the
+    base period, ensure reg_cost_ratio_adj(y) <= reg_cost_ratio_adj(base_year) for all
+    future periods y.
+
+    This is done for all groups of (scenario_version, scenario, region,
+    message_technology) at once, without iterating over groups.
+    """
+    by = ["scenario_version", "scenario", "region", "message_technology"]
+
+    # Base-period values for each group, aligned with the rows of `df`
+    ref = (
+        df.loc[
+            df.year == base_year,
+            by + ["gdp_ratio_reg_to_reference", "reg_cost_ratio_adj"],
+        ]
+        .drop_duplicates(subset=by)
+        .set_index(by)
+    )
+    ref = ref.reindex(pd.MultiIndex.from_frame(df[by])).to_numpy()
+
+    adj = df.reg_cost_ratio_adj.to_numpy()
+    constrain = (ref[:, 0] < 1) & (ref[:, 1] > 1)
+    return df.assign(
+        reg_cost_ratio_adj=np.where(constrain, np.minimum(adj, ref[:, 1]), adj)
+    )
+
+
 def adjust_cost_ratios_with_gdp(region_diff_df, config: Config):
     """Calculate adjusted region-differentiated cost ratios.
 
@@ -190,23 +220,6 @@ def adjust_cost_ratios_with_gdp(region_diff_df, config: Config):
         log.warning(f"Use year={new_base_year} GDP data as proxy for {base_year}")
         base_year = new_base_year
 
-    def _constrain_cost_ratio(df: pd.DataFrame, base_year):
-        """Constrain "reg_cost_ratio_adj".
-
-        In cases where gdp_ratio_reg_to_reference is < 1 and reg_cost_ratio_adj > 1 in
-        the base period, ensure reg_cost_ratio_adj(y) <= reg_cost_ratio_adj(base_year)
-        for all future periods y.
-        """
-        ref = df.query("year == @base_year").iloc[0]
-        if ref.gdp_ratio_reg_to_reference < 1 and ref.reg_cost_ratio_adj > 1:
-            return df.assign(
-                reg_cost_ratio_adj=df.reg_cost_ratio_adj.clip(
-                    upper=ref.reg_cost_ratio_adj
-                )
-            )
-        else:
-            return df
-
     #  1. Select base-year GDP data for "gdp_ratio_reg_to_reference".
     #  2. Drop "year".
     #  3. Merge `df_region_diff` for "reg_cost_ratio".
@@ -218,8 +231,7 @@ def adjust_cost_ratios_with_gdp(region_diff_df, config: Config):
     #     distinct values for each period.
     #  8. Compute ref_cost_ratio_adj
     #  9. Fill 1.0 where NaNs occur in (8), i.e. for the reference region.
-    # 10. Group by (sv, s, r, t) and apply _constrain_cost_ratio(), above, to each
-    #     group.
+    # 10. Apply _constrain_cost_ratio() to each group of (sv, s, r, t).
     # 11. Select the desired columns.
     return (
         df_gdp.query("year == @base_year")
@@ -231,11 +243,7 @@ def adjust_cost_ratios_with_gdp(region_diff_df, config: Config):
         .merge(df_gdp, on=["scenario_version", "scenario", "region"], how="right")
         .eval("reg_cost_ratio_adj = slope * gdp_ratio_reg_to_reference + intercept")
         .fillna({"reg_cost_ratio_adj": 1.0})
-        .groupby(
-            ["scenario_version", "scenario", "region", "message_technology"],
-            group_keys=False,
-        )
-        .apply(_constrain_cost_ratio, base_year)[
+        .pipe(_constrain_cost_ratio, base_year)[
             [
                 "scenario_version",
                 "scenario",
@@ -4,7 +4,6 @@ from itertools import product
 
 import numpy as np
 import pandas as pd
-from numpy.polynomial import Polynomial
 
 from .config import Config
 from .decay import project_ref_region_inv_costs_using_reduction_rates
@@ -22,6 +21,52 @@ def larger_than(sequence, value):
     return [item for item in sequence if item > value]
 
 
+def _fit_linear(
+    df: pd.DataFrame, by: list[str], x: str, y: str, x_predict, name: str
+) -> pd.DataFrame:
+    """Fit a line to (`x`, `y`) for each group of `df` and predict at `x_predict`.
+
+    The least-squares fit is computed in closed form for all groups at once. This gives
+    the same result as :meth:`numpy.polynomial.Polynomial.fit` with :py:`deg=1` for each
+    group. Rows where `x` or `y` is NaN are ignored. For a group with a single distinct
+    value of `x`, the prediction is the mean of `y`; for a group with no valid rows, it
+    is NaN.
+
+    Returns
+    -------
+    pandas.DataFrame
+        with columns `by`, `x`, and `name` and, for each group in order, one row for
+        each value in `x_predict`.
+    """
+    x_predict = np.asarray(x_predict)
+
+    # Mask x and y jointly, so the means below are over the same rows
+    valid = df[x].notna() & df[y].notna()
+
+    # Center `x` for numerical accuracy; means of x, y, x², and x·y in each group, and
+    # the range of x
+    x0 = x_predict.mean()
+    g = (
+        df[by]
+        .assign(x=df[x].where(valid) - x0, y=df[y].where(valid))
+        .eval("xx = x * x\nxy = x * y")
+        .groupby(by)
+    )
+    m = g.mean()
+    span = (g["x"].max() - g["x"].min()).to_numpy()
+
+    # Slope is zero where the variance of x is zero
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(span > 0, (m.xy - m.x * m.y) / (m.xx - m.x**2), 0.0)
+    intercept = m.y.to_numpy() - slope * m.x.to_numpy()
+
+    N = len(x_predict)
+    result = {c: m.index.get_level_values(c).repeat(N) for c in by}
+    result[x] = np.tile(x_predict, len(m))
+    result[name] = (intercept[:, None] + slope[:, None] * (x_predict - x0)).ravel()
+    return pd.DataFrame(result)
+
+
 def _maybe_query_scenario(df: pd.DataFrame, config: "Config") -> pd.DataFrame:
     """Filter `df` for :attr`.Config.scenario`, if any is specified."""
     if config.scenario == "all":
@@ -257,30 +302,20 @@ def create_projections_converge(config: "Config"):
         .drop_duplicates()
     )
 
-    y_predict = np.array(config.seq_years)
-    y_index = pd.Index(config.seq_years, name="year")
-
-    def _predict(df: pd.DataFrame) -> pd.Series:
-        """Fit a degree-3 polynomial to `df` and predict for :attr:`.seq_years`."""
-        # Fit
-        p = Polynomial.fit(df.year, df.inv_cost_tmp, deg=1)
-
-        # - Predict using config.seq_years.
-        # - Assemble a single-column data frame with "year" as the index name.
-        return pd.DataFrame({"inv_pre_converge_decay": p(y_predict)}, index=y_index)
-
     # Columns for grouping and merging
     cols = ["scenario", "message_technology", "region"]
 
-    # Apply polynomial regression to costs at base year and convergence year
+    # Apply linear regression to costs at base year and convergence year
     # (interpolating)
-    df_pre_converge_costs = (
+    df_pre_converge_costs = _fit_linear(
         df_tmp_costs.query(
             "year == @config.base_year or year == @config.convergence_year"
-        )
-        .groupby(cols[:3], group_keys=True)
-        .apply(_predict)
-        .reset_index()
+        ),
+        cols,
+        "year",
+        "inv_cost_tmp",
+        config.seq_years,
+        "inv_pre_converge_decay",
     )
 
     # Get final investment costs
@@ -1,6 +1,9 @@
 """Tools for working with IAMC-structured data."""
 
+import ast
+import json
 from collections.abc import MutableMapping
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
 import genno
@@ -113,6 +116,97 @@ def _raise_empty(df: pd.DataFrame, *, query: str) -> pd.DataFrame:
     return df
 
 
+#: Dimensions of IAMC-structured data that are indexed by :func:`_read_indexed`.
+INDEX_DIMS = ("MODEL", "SCENARIO", "VARIABLE")
+
+
+@lru_cache(maxsize=4)
+def _read_indexed(
+    path: "pathlib.Path", mtime: float, archive_member: Optional[str], kwargs: str
+) -> pd.DataFrame:
+    """Read an IAMC-like data file once, for use by :func:`iamc_like_data_for_query`.
+
+    The result of :func:`_read` is kept in memory. `mtime` and `kwargs`—a JSON string of
+    keyword arguments to :func:`pandas.read_csv`—are part of the key, so that a file
+    that is modified, or read with different arguments, is read again.
+
+    Up to 4 complete data frames are held for the life of the process. To release the
+    memory, call :py:`_read_indexed.cache_clear()`.
+    """
+    return _read(path, archive_member, json.loads(kwargs))
+
+
+def _read(
+    path: "pathlib.Path", archive_member: Optional[str], kwargs: dict
+) -> pd.DataFrame:
+    """Read an IAMC-like data file, indexed for selection with :func:`_index_selection`.
+
+    Columns of strings are converted to :class:`pandas.Categorical`. The rows are
+    sorted on the columns for :data:`INDEX_DIMS` (in any case), which also form a
+    :class:`pandas.MultiIndex` on the result.
+    """
+    # Identify the source object/buffer to read from
+    if archive_member:
+        # A single member in a ZIP archive that has >1 members
+        import zipfile
+
+        zf = zipfile.ZipFile(path)
+        source: Any = zf.open(archive_member)
+    else:
+        # A direct path, possibly compressed
+        source = path
+
+    df = pd.read_csv(source, **kwargs)
+
+    categorical = [c for c in df.columns if pd.api.types.is_string_dtype(df[c])]
+    df = df.astype({c: "category" for c in categorical})
+
+    if index := [c for c in df.columns if str(c).upper() in INDEX_DIMS]:
+        df = df.sort_values(index, ignore_index=True)
+        df.index = pd.MultiIndex.from_frame(df[index])
+    return df
+
+
+def _index_selection(query: str, names: list[str]) -> list:
+    """Return a selection on the index `names`, from the conditions in `query`.
+
+    Only conditions like :py:`NAME == 'value'` or :py:`NAME in ['a', 'b']` that are
+    combined with :py:`and` at the top level of `query` are used. The result contains
+    :py:`slice(None)` for any of `names` not so constrained, and is suitable for
+    :meth:`pandas.MultiIndex.get_locs`.
+    """
+    result: dict[str, Any] = {}
+    try:
+        node = ast.parse(query, mode="eval").body
+    except SyntaxError:
+        return [slice(None)] * len(names)
+
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+        conditions = node.values
+    else:
+        conditions = [node]
+
+    for cond in conditions:
+        if not (
+            isinstance(cond, ast.Compare)
+            and len(cond.ops) == 1
+            and isinstance(cond.left, ast.Name)
+            and cond.left.id in names
+            and cond.left.id not in result
+        ):
+            continue
+        try:
+            value = ast.literal_eval(cond.comparators[0])
+        except ValueError:
+            continue
+        if isinstance(cond.ops[0], ast.Eq) and isinstance(value, str):
+            result[cond.left.id] = [value]
+        elif isinstance(cond.ops[0], ast.In) and isinstance(value, (list, tuple)):
+            result[cond.left.id] = list(value)
+
+    return [result.get(name, slice(None)) for name in names]
+
+
 @cached
 def iamc_like_data_for_query(
     path: "pathlib.Path",
@@ -131,11 +225,15 @@ def iamc_like_data_for_query(
 
     1. Read the data file. Additional `kwargs` are passed to :func:`pandas.read_csv`.
        By default (unless `kwargs` explicitly give a different value), pyarrow is used
-       for better performance.
-    2. Pass the result through :func:`to_quantity`, with the parameters `query`,
+       for better performance. The parsed file is kept in memory and indexed on its
+       MODEL, SCENARIO, and VARIABLE columns, so that it is read only once for any
+       number of different `query` values.
+    2. Select rows using the conditions in `query` of the form :py:`VARIABLE == 'x'` or
+       :py:`MODEL in ['a', 'b']` on these 3 columns, via the index.
+    3. Pass the result through :func:`to_quantity`, with the parameters `query`,
        `drop`, `non_iso_3166`, `replace`, and `unique`.
-    3. Cache the result using :obj:`.cached`. Subsequent calls with the same arguments
-       will yield the cached result rather than repeating steps (1) and (2).
+    4. Cache the result using :obj:`.cached`. Subsequent calls with the same arguments
+       will yield the cached result rather than repeating steps (1) to (3).
 
     Parameters
     ----------
@@ -148,23 +246,29 @@ def iamc_like_data_for_query(
     genno.Quantity
         of the same structure returned by :func:`to_quantity`.
     """
-    import pandas as pd
-
-    # Identify the source object/buffer to read from
-    if archive_member:
-        # A single member in a ZIP archive that has >1 members
-        import zipfile
-
-        zf = zipfile.ZipFile(path)
-        source: Any = zf.open(archive_member)
-    else:
-        # A direct path, possibly compressed
-        source = path
-
     kwargs.setdefault("engine", "pyarrow")
 
+    try:
+        key = json.dumps(kwargs, sort_keys=True)
+    except (TypeError, ValueError):
+        # `kwargs` cannot be part of the key of the in-memory data, for instance
+        # callables in converters=; read the file for this call only
+        data = _read(path, archive_member, kwargs)
+    else:
+        data = _read_indexed(path, path.stat().st_mtime, archive_member, key)
+
+    # Select rows using the index
+    locs: Any = slice(None)
+    if isinstance(data.index, pd.MultiIndex):
+        try:
+            locs = data.index.get_locs(_index_selection(query, data.index.names))
+        except KeyError:  # A label in `query` does not appear in the data
+            locs = []
+
+    # Restore ordinary columns, then convert
+    subset = data.iloc[locs].reset_index(drop=True)
     return to_quantity(
-        pd.read_csv(source, **kwargs),
+        subset.astype({c: object for c, t in subset.dtypes.items() if t == "category"}),
         query=query,
         drop=drop,
         non_iso_3166=non_iso_3166,
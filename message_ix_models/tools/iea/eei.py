@@ -266,6 +266,22 @@ def melt(df: pd.DataFrame) -> pd.DataFrame:
     return df.melt(id_vars=sorted(index_cols), var_name="TIME_PERIOD")
 
 
+def _map_unique(s: pd.Series, func) -> pd.Series:
+    """Apply `func` to each distinct value in `s`, and map the results to `s`.
+
+    This calls `func` once per distinct value, rather than once per element. Null
+    values in `s` are mapped to :obj:`None`.
+    """
+    codes, uniques = pd.factorize(s)
+    values = np.array([func(v) for v in uniques] + [None], dtype=object)
+    return pd.Series(values[codes], index=s.index, name=s.name)
+
+
+def _rstrip(value):
+    """Same as :meth:`pandas.Series.str.rstrip` for a single `value`."""
+    return value.rstrip() if isinstance(value, str) else np.nan
+
+
 @cached
 def iea_eei_data_raw(path, non_iso_3166: Literal["keep", "discard"] = "discard"):
     from message_ix_models.util.pycountry import iso_3166_alpha_3
@@ -289,7 +305,8 @@ def iea_eei_data_raw(path, non_iso_3166: Literal["keep", "discard"] = "discard")
 
         # - Read the sheet.
         # - Drop rows containing only null values.
-        # - Right-strip whitespaces from columns containing strings.
+        # - Right-strip whitespaces from columns containing strings, once for each
+        #   distinct value.
         # - Assign sector and/or measure ID.
         # - Extract units.
         # - Melt from wide to long layout.
@@ -297,7 +314,9 @@ def iea_eei_data_raw(path, non_iso_3166: Literal["keep", "discard"] = "discard")
         df = (
             xf.parse(sheet_name, header=1, na_values="..")
             .dropna(how="all")
-            .apply(lambda col: col.str.rstrip() if col.dtype == object else col)
+            .apply(
+                lambda col: _map_unique(col, _rstrip) if col.dtype == object else col
+            )
             .assign(**assign)
             .pipe(extract_measure_and_units)
             # .replace(REPLACE)
@@ -310,7 +329,7 @@ def iea_eei_data_raw(path, non_iso_3166: Literal["keep", "discard"] = "discard")
     return (
         pd.concat(dfs)
         .fillna("__NA")
-        .assign(n=lambda df: df["Country"].apply(iso_3166_alpha_3))
+        .assign(n=lambda df: _map_unique(df["Country"], iso_3166_alpha_3))
         .drop("Country", axis=1)
     )
 
@@ -359,19 +378,22 @@ def wavg(measure: str, df: pd.DataFrame, weight_data: pd.DataFrame) -> pd.DataFr
     units = data["units_x"].unique()
     assert 1 == len(units), units
 
-    def _wavg(group):
-        # Create masked arrays, masking NaNs from the weighted average computation:
-        d = np.ma.masked_invalid(group["value_x"].values)
-        w = np.ma.masked_invalid(group["value_y"].values)
-        # Compute weighted average
-        return np.ma.average(d, weights=w)
-
-    # - Apply _wavg() to groups by `id_cols`.
-    # - Return to a data frame.
+    # - Mask NaNs in either the data or the weights.
+    # - Compute sums of value × weight and of weight within groups by `id_cols`.
+    # - Divide to obtain the weighted average; return to a data frame.
     # - Re-insert "units" and "variable" columns.
+    valid = data["value_x"].notna() & data["value_y"].notna()
+    sums = (
+        data[id_cols]
+        .assign(
+            xw=(data["value_x"] * data["value_y"]).where(valid),
+            w=data["value_y"].where(valid),
+        )
+        .groupby(id_cols)
+        .sum(min_count=1)
+    )
     return (
-        data.groupby(id_cols)
-        .apply(_wavg)
+        (sums["xw"] / sums["w"])
         .rename("value")
         .reset_index()
         .assign(units=units[0], variable=measure)
@@ -1,28 +1,34 @@
 """Tools for IEA (Extended) World Energy Balance (WEB) data."""
 
+import ast
 import logging
+import operator
+import shutil
+import tempfile
 import zipfile
 from collections.abc import Iterable
 from copy import copy
+from functools import reduce
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Optional
+from typing import TYPE_CHECKING, Literal, Optional
 
 import genno
 import pandas as pd
 from genno import Key
 from genno.core.key import single_key
 from genno.operator import concat
-from platformdirs import user_cache_path
 
 from message_ix_models.model.structure import get_codelist
 from message_ix_models.tools.exo_data import ExoDataSource, register_source
 from message_ix_models.util import cached, package_data_path, path_fallback
-from message_ix_models.util._logging import silence_log
 
 if TYPE_CHECKING:
     import os
 
     import genno
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.dataset
     from genno.types import AnyQuantity
 
     from message_ix_models.types import KeyLike
@@ -232,9 +238,12 @@ def fwf_to_csv(path: Path, progress: bool = False) -> Path:  # pragma: no cover
 
     This appears to operate at about 900k lines / second, about 1 minute for the IEA
     2023 .TXT files. This is faster than doing full pandas I/O, which takes 5–10 minutes
-    depending on formats.
+    depending on formats. The file is processed line by line, so memory use does not
+    depend on its size.
+
+    :func:`convert_to_parquet` uses :func:`read_fwf` instead. This function is used by
+    :program:`mix-models testing fuzz-private-data`, which reads the data from CSV.
     """
-    import io
     import re
 
     # Output path
@@ -243,33 +252,146 @@ def fwf_to_csv(path: Path, progress: bool = False) -> Path:  # pragma: no cover
         log.info(f"Skip conversion; file exists and is newer than source: {path_out}")
         return path_out
 
-    # Input and output buffers; read the entire file into memory immediately
-    file_in = io.BytesIO(path.read_bytes())
-    file_out = io.BytesIO()
-
     # Regular expression to split lines
     expr = re.compile(b"  +")
 
-    if progress:
-        from tqdm import tqdm
+    with open(path, "rb") as file_in, open(path_out, "wb") as file_out:
+        if progress:
+            from tqdm import tqdm
 
-        iterator: Iterable[bytes] = tqdm(file_in, desc=f"{path} → {path_out}")
-    else:
-        iterator = file_in
-
-    # Convert to CSV
-    for line in iterator:
-        file_out.write(b",".join(expr.split(line)))
+            iterator: Iterable[bytes] = tqdm(file_in, desc=f"{path} → {path_out}")
+        else:
+            iterator = file_in
 
-    # Write to file
-    path_out.write_bytes(file_out.getbuffer())
+        # Convert to CSV
+        for line in iterator:
+            file_out.write(b",".join(expr.split(line)))
 
     return path_out
 
 
+def read_fwf(
+    path: Path, block_size: int = 1 << 24, use_threads: bool = True
+) -> "pyarrow.RecordBatchReader":
+    """Read the IEA fixed-width file format as a stream of Arrow record batches.
+
+    The file is read in blocks of about `block_size` bytes, ending at a line break.
+    Each block is parsed by :func:`_parse_fwf` into the columns :data:`DIMS` plus
+    "Value". With `use_threads`, blocks are parsed concurrently, with at most one block
+    per CPU submitted and not yet consumed. Memory use thus does not depend on the size
+    of the file.
+
+    On a single CPU, this operates at about 800–900k lines / second, including
+    conversion of the "TIME" and "Value" columns; on the same machine,
+    :func:`fwf_to_csv` operates at about 500–600k lines / second, and its output must
+    then be read and converted.
+    """
+    import os
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    import pyarrow as pa
+
+    schema = pa.schema(
+        [(d, pa.int64() if d == "TIME" else pa.string()) for d in DIMS]
+        + [("Value", pa.float64())]
+    )
+
+    def _blocks():
+        with open(path, "rb") as f:
+            remainder = b""
+            while block := f.read(block_size):
+                # Split after the last complete line
+                block = remainder + block
+                split = block.rfind(b"\n") + 1
+                remainder = block[split:]
+                yield block[:split]
+            if remainder:
+                yield remainder + b"\n"
+
+    def _batches():
+        workers = (os.cpu_count() or 1) if use_threads else 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque = deque()
+            for block in _blocks():
+                pending.append(executor.submit(_parse_fwf, block, schema))
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    return pa.RecordBatchReader.from_batches(schema, _batches())
+
+
+def _parse_fwf(block: bytes, schema: "pyarrow.Schema") -> "pyarrow.RecordBatch":
+    """Parse complete lines of the IEA fixed-width format into a batch with `schema`.
+
+    Fields are separated by 2 or more spaces. The parsing uses vectorized operations on
+    the bytes of `block`, not Python objects for each line or field. Blank lines are
+    ignored. Values "..", "c", and "x" in the "Value" column are read as null.
+
+    Raises
+    ------
+    ValueError
+        if any line does not have one field for each name in `schema`.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    buf = np.frombuffer(block, dtype=np.uint8)
+    eol = (buf == ord("\n")) | (buf == ord("\r"))
+
+    # Separators: ends of line, and spaces adjacent to another space or an end of line
+    blank = np.zeros(len(buf) + 2, dtype=bool)
+    blank[1:-1] = eol | (buf == ord(" "))
+    sep = np.ones(len(buf) + 2, dtype=bool)
+    sep[1:-1] = eol | (blank[1:-1] & (blank[:-2] | blank[2:]))
+
+    # Positions of the first byte and one past the last byte of each field
+    starts = np.flatnonzero(~sep[1:-1] & sep[:-2])
+    ends = np.flatnonzero(~sep[1:-1] & sep[2:]) + 1
+
+    # Number of fields in each line
+    N = len(schema)
+    count = np.bincount(np.searchsorted(np.flatnonzero(eol), starts))
+    if np.any((count != 0) & (count != N)):
+        line = block.splitlines()[np.flatnonzero((count != 0) & (count != N))[0]]
+        raise ValueError(f"Line without {N} fields: {line.decode()!r}")
+
+    columns = []
+    for i, field in enumerate(schema):
+        # Gather the bytes of this field in all lines, contiguously
+        s, e = starts[i::N], ends[i::N]
+        offsets = np.zeros(len(s) + 1, dtype=np.int64)
+        np.cumsum(e - s, out=offsets[1:])
+        data = buf[np.repeat(s - offsets[:-1], e - s) + np.arange(offsets[-1])]
+        values = pa.LargeStringArray.from_buffers(
+            len(s), pa.py_buffer(offsets), pa.py_buffer(data)
+        )
+
+        if field.name == "Value":
+            # Mask symbols for missing or confidential values
+            values = pc.if_else(
+                pc.is_in(values, pa.array(["..", "c", "x"])), None, values
+            )
+        columns.append(values.cast(field.type))
+
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def _cache_dir() -> Path:
+    """Return the directory :file:`iea/` within :attr:`.Config.cache_path`."""
+    from message_ix_models import Context
+
+    result = Context.get_instance(-1).core.get_cache_path("iea")
+    result.mkdir(exist_ok=True)
+    return result
+
+
 def unpack_zip(path: Path) -> Path:
     """Unpack a ZIP archive."""
-    cache_dir = user_cache_path("message-ix-models", ensure_exists=True).joinpath("iea")
+    cache_dir = _cache_dir()
 
     log.info(f"Decompress {path} to {cache_dir}")
     with zipfile.ZipFile(path) as zf:
@@ -286,44 +408,228 @@ def unpack_zip(path: Path) -> Path:
             return Path(zf.extract(members[0], path=cache_dir))
 
 
-@cached
-def iea_web_data_for_query(
-    base_path: Path, *filenames: str, query_expr: str
-) -> pd.DataFrame:
-    """Load data from `base_path` / `filenames` in IEA WEB formats."""
-    import dask.dataframe as dd
+def convert_to_parquet(base_path: Path, *filenames: str) -> Path:
+    """Convert data from `base_path` / `filenames` to a partitioned Parquet dataset.
 
-    names_to_read = []  # Filenames to pass to dask.dataframe
-    # Keyword arguments for read_csv()
-    # - Certain values appearing in (IEA, 2024) are mapped to NaN.
+    The dataset is stored in :attr:`.Config.cache_path`, with one partition for each
+    distinct (MEASURE, TIME), and contains the columns :data:`DIMS` plus "Value". Each
+    file is streamed through :mod:`pyarrow.csv` in blocks, so the full data are never
+    held in memory. Conversion is skipped if the dataset exists and is newer than all
+    the source files.
+
+    The dataset is written to a temporary directory, which is then renamed, so that
+    readers and concurrent conversions in other processes never see partial data.
+
+    Returns
+    -------
+    pathlib.Path
+        Directory containing the dataset.
+    """
+    from hashlib import blake2b
+
+    import pyarrow as pa
+    import pyarrow.csv
+    import pyarrow.dataset as ds
+
+    # Source paths
+    paths = [base_path.joinpath(f) for f in filenames]
+
+    # Output directory; the name distinguishes files with the same names in different
+    # `base_path`, e.g. test data and full data
+    name = "+".join(
+        Path(f).with_suffix("").as_posix().replace("/", "_") for f in filenames
+    )
+    digest = blake2b(str(base_path.resolve()).encode(), digest_size=4).hexdigest()
+    cache_dir = _cache_dir()
+    path_out = cache_dir.joinpath(f"{name}-{digest}.parquet")
+
+    # File written after successful conversion
+    done = path_out.joinpath("_SUCCESS")
+    if done.exists() and done.stat().st_mtime > max(p.stat().st_mtime for p in paths):
+        log.info(
+            f"Skip conversion; dataset exists and is newer than source: {path_out}"
+        )
+        return path_out
+
+    # Options for pyarrow.csv
+    # - Certain values appearing in (IEA, 2024) are mapped to null.
     # - The Value column is numeric.
-    args: dict[str, Any] = dict(
-        dtype={"Value": float},
-        na_values=[".. ", "c ", "x "],
+    convert_options = pa.csv.ConvertOptions(
+        column_types={d: pa.string() for d in DIMS}
+        | {"TIME": pa.int64(), "Value": pa.float64()},
+        include_columns=DIMS + ["Value"],
+        null_values=[".. ", "c ", "x "],
     )
 
-    # Iterate over origin filenames
-    for filename in filenames:
-        path = base_path.joinpath(filename)
+    # Temporary directory for the new dataset
+    path_tmp = Path(tempfile.mkdtemp(prefix=f"{path_out.name}.", dir=cache_dir))
+
+    try:
+        for i, path in enumerate(paths):
+            if path.suffix == ".zip":
+                path = unpack_zip(path)
+
+            log.info(f"Convert {path} → {path_out}")
+            if path.suffix == ".TXT":
+                reader = read_fwf(path)
+            else:
+                reader = pa.csv.open_csv(path, convert_options=convert_options)
+
+            with reader:
+                ds.write_dataset(
+                    reader,
+                    path_tmp,
+                    format="parquet",
+                    partitioning=_partitioning(),
+                    basename_template=f"part-{i}-{{i}}.parquet",
+                    existing_data_behavior="overwrite_or_ignore",
+                )
 
-        if path.suffix == ".zip":
-            path = unpack_zip(path)
+        path_tmp.joinpath(done.name).touch()
+    except BaseException:
+        # Remove the partial dataset
+        shutil.rmtree(path_tmp, ignore_errors=True)
+        raise
+
+    # Move any outdated dataset aside, then move the new dataset into place
+    path_old = path_tmp.with_name(f"{path_tmp.name}.old")
+    try:
+        if path_out.exists():
+            path_out.rename(path_old)
+        path_tmp.rename(path_out)
+    except OSError as e:
+        # Another process replaced `path_out` concurrently; use its dataset
+        log.info(f"Discard {path_tmp}: {e}")
+        shutil.rmtree(path_tmp, ignore_errors=True)
+    shutil.rmtree(path_old, ignore_errors=True)
 
-        if path.suffix == ".TXT":  # pragma: no cover
-            names_to_read.append(fwf_to_csv(path, progress=True))
-            args.update(header=None, names=DIMS + ["Value"])
-        else:
-            names_to_read.append(path)
-            args.update(header=0, usecols=DIMS + ["Value"])
+    return path_out
+
+
+def _partitioning() -> "pyarrow.dataset.Partitioning":
+    """Partitioning of the dataset written by :func:`convert_to_parquet`."""
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(
+        pa.schema([("MEASURE", pa.string()), ("TIME", pa.int64())]), flavor="hive"
+    )
+
+
+#: Python operators corresponding to :mod:`ast` node types, for
+#: :func:`_query_to_expression`.
+_QUERY_OPS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.And: operator.and_,
+    ast.BitAnd: operator.and_,
+    ast.Or: operator.or_,
+    ast.BitOr: operator.or_,
+}
+
+
+def _query_to_expression(query_expr: str) -> "pyarrow.compute.Expression":
+    """Convert `query_expr` to a :class:`pyarrow.compute.Expression`.
+
+    Only a subset of the syntax of :meth:`pandas.DataFrame.query` is supported:
+    comparisons (including chained comparisons and :py:`in` / :py:`not in` with a list
+    or tuple) between column names and literal values, combined with :py:`and`,
+    :py:`or`, :py:`not`, :py:`&`, :py:`|`, or :py:`~`.
+
+    Raises
+    ------
+    ValueError
+        if `query_expr` contains any other syntax.
+    """
+    try:
+        tree = ast.parse(query_expr, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Unsupported query syntax: {e}")
+
+    return _convert_node(tree.body)
+
+
+def _convert_node(node: ast.AST) -> "pyarrow.compute.Expression":
+    """Convert a node in a query to an Expression; see :func:`_query_to_expression`."""
+    if isinstance(node, ast.BoolOp):
+        return reduce(_QUERY_OPS[type(node.op)], map(_convert_node, node.values))
+    elif isinstance(node, ast.BinOp) and type(node.op) in _QUERY_OPS:
+        op = _QUERY_OPS[type(node.op)]
+        return op(_convert_node(node.left), _convert_node(node.right))
+    elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)):
+        return ~_convert_node(node.operand)
+    elif isinstance(node, ast.Compare):
+        operands = [node.left] + node.comparators
+        return reduce(
+            operator.and_,
+            (_convert_compare(*a) for a in zip(node.ops, operands, operands[1:])),
+        )
+    raise ValueError(f"Unsupported query syntax: {ast.unparse(node)!r}")
+
+
+def _convert_compare(
+    op: ast.cmpop, left: ast.AST, right: ast.AST
+) -> "pyarrow.compute.Expression":
+    """Convert a single comparison; see :func:`_query_to_expression`."""
+    import pyarrow.compute as pc
+
+    def _literal(node: ast.AST):
+        try:
+            return ast.literal_eval(node)
+        except ValueError:
+            raise ValueError(f"Unsupported query syntax: {ast.unparse(node)!r}")
+
+    def _operand(node: ast.AST):
+        return pc.field(node.id) if isinstance(node, ast.Name) else _literal(node)
+
+    if isinstance(op, (ast.In, ast.NotIn)) and isinstance(left, ast.Name):
+        result = pc.field(left.id).isin(list(_literal(right)))
+        return ~result if isinstance(op, ast.NotIn) else result
+    elif type(op) in _QUERY_OPS:
+        return _QUERY_OPS[type(op)](_operand(left), _operand(right))
+    raise ValueError(f"Unsupported query syntax: {type(op).__name__}")
+
+
+@cached
+def iea_web_data_for_query(
+    base_path: Path, *filenames: str, query_expr: str
+) -> pd.DataFrame:
+    """Load data from `base_path` / `filenames` in IEA WEB formats.
+
+    On first use, the files are converted with :func:`convert_to_parquet`. Only rows
+    with MEASURE "TJ", a non-null "Value", and matching `query_expr` are returned.
+    Where possible, `query_expr` is converted by :func:`_query_to_expression` and
+    applied while reading the dataset; this skips partitions and row groups that
+    contain no matching data. Otherwise, it is applied using
+    :meth:`pandas.DataFrame.query` after reading.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
 
-    with silence_log("fsspec.local"):
-        ddf = dd.read_csv(names_to_read, engine="pyarrow", **args)
-        ddf = ddf[ddf["MEASURE"] == "TJ"]
-        # NB compute() must precede query(), else "ValueError: The columns in the
-        # computed data do not match the columns in the provided metadata" occurs with
-        # the CSV-formatted data.
-        result = ddf.compute().query(query_expr).dropna(subset=["Value"])
+    path = convert_to_parquet(base_path, *filenames)
+
+    dataset = ds.dataset(path, format="parquet", partitioning=_partitioning())
+    columns = DIMS + ["Value"]
+    # Filter applied in all cases
+    base_filter = (pc.field("MEASURE") == "TJ") & pc.field("Value").is_valid()
+
+    try:
+        table = dataset.to_table(
+            columns=columns, filter=base_filter & _query_to_expression(query_expr)
+        )
+    except (ValueError, pa.ArrowException) as e:
+        log.info(f"Apply query_expr={query_expr!r} after reading: {e}")
+        table = dataset.to_table(columns=columns, filter=base_filter)
+        result = table.to_pandas().query(query_expr)
+    else:
+        result = table.to_pandas()
 
+    result = result.reset_index(drop=True)
     log.info(f"{len(result)} observations")
     return result
 
@@ -343,7 +649,8 @@ def load_data(
     edition : str
         Second entry in :data:`.FILES`.
     query_expr : str, optional
-        Used with :meth:`pandas.DataFrame.query` to reduce the returned data.
+        Expression in the syntax of :meth:`pandas.DataFrame.query` to reduce the
+        returned data. See :func:`iea_web_data_for_query`.
     base_path : os.Pathlike, optional
         Path containing :data:`.FILES`. If not provided, locations within
         :mod:`message_data` or :mod:`message_ix_models` are used.
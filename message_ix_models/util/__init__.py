@@ -15,35 +15,41 @@ from itertools import count
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Optional, Protocol, Union
 
-import message_ix
-import pandas as pd
-import pint
 from platformdirs import user_cache_path
 
-from ._convert_units import convert_units
 from ._logging import mark_time, preserve_log_level, silence_log
-from .cache import cached
-from .common import (
-    HAS_MESSAGE_DATA,
-    MESSAGE_DATA_PATH,
-    MESSAGE_MODELS_PATH,
-    Adapter,
-    MappingAdapter,
-    load_package_data,
-    load_private_data,
-    local_data_path,
-    package_data_path,
-    private_data_path,
-)
-from .node import adapt_R11_R12, adapt_R11_R14, identify_nodes, nodes_ex_world
-from .scenarioinfo import ScenarioInfo, Spec
-from .sdmx import CodeLike, as_codes, eval_anno
 
 if TYPE_CHECKING:
     import genno
+    import message_ix
+    import pandas as pd
+    import pint
 
     from message_ix_models.types import MutableParameterData, ParameterData
 
+    from ._convert_units import convert_units
+    from .cache import cached
+    from .common import (
+        HAS_MESSAGE_DATA,
+        MESSAGE_DATA_PATH,
+        MESSAGE_MODELS_PATH,
+        Adapter,
+        MappingAdapter,
+        load_package_data,
+        load_private_data,
+        local_data_path,
+        package_data_path,
+        private_data_path,
+    )
+    from .node import (  # noqa: F401
+        adapt_R11_R12,
+        adapt_R11_R14,
+        identify_nodes,
+        nodes_ex_world,
+    )
+    from .scenarioinfo import ScenarioInfo, Spec  # noqa: F401
+    from .sdmx import CodeLike, as_codes, eval_anno
+
 __all__ = [
     "HAS_MESSAGE_DATA",
     "MESSAGE_DATA_PATH",
@@ -61,6 +67,7 @@ __all__ = [
     "convert_units",
     "copy_column",
     "datetime_now_with_tz",
+    "ellipsize",
     "eval_anno",
     "ffill",
     "identify_nodes",
@@ -89,9 +96,47 @@ __all__ = [
 
 log = logging.getLogger(__name__)
 
+#: Names of the submodules from which other names in :data:`__all__` are imported on
+#: first access. This avoids importing :mod:`message_ix`, :mod:`pandas`, and others
+#: until they are needed.
+_LAZY = {
+    "_convert_units": ["convert_units"],
+    "cache": ["cached"],
+    "common": [
+        "HAS_MESSAGE_DATA",
+        "MESSAGE_DATA_PATH",
+        "MESSAGE_MODELS_PATH",
+        "Adapter",
+        "MappingAdapter",
+        "load_package_data",
+        "load_private_data",
+        "local_data_path",
+        "package_data_path",
+        "private_data_path",
+    ],
+    "node": ["adapt_R11_R12", "adapt_R11_R14", "identify_nodes", "nodes_ex_world"],
+    "scenarioinfo": ["ScenarioInfo", "Spec"],
+    "sdmx": ["CodeLike", "as_codes", "eval_anno"],
+}
+_LAZY_NAME = {name: module for module, names in _LAZY.items() for name in names}
+
+
+def __getattr__(name: str):
+    from importlib import import_module
+
+    try:
+        module = import_module(f"{__name__}.{_LAZY_NAME.get(name, name)}")
+    except ModuleNotFoundError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    return getattr(module, name) if name in _LAZY_NAME else module
+
 
 def add_par_data(
-    scenario: message_ix.Scenario, data: "ParameterData", dry_run: bool = False
+    scenario: "message_ix.Scenario",
+    data: "ParameterData",
+    dry_run: bool = False,
+    chunk_size: int = 1_000_000,
 ) -> int:
     """Add `data` to `scenario`.
 
@@ -103,39 +148,76 @@ def add_par_data(
         :meth:`message_ix.Scenario.add_par`.
     dry_run : optional
         Only show what would be done.
+    chunk_size : optional
+        Maximum number of rows to pass to :meth:`~message_ix.Scenario.add_par` in one
+        call. Larger data frames are added in successive chunks, which limits the peak
+        memory used by :mod:`ixmp` to prepare the data for the backend.
 
     See also
     --------
     strip_par_data
     """
+    from time import perf_counter
+
     # TODO optionally add units automatically
     # TODO allow units column entries to be pint.Unit objects
 
+    if not dry_run:
+        _check_par_data(scenario, data)
+
     total = 0
 
     for par_name, values in data.items():
         N = values.shape[0]
         log.info(f"{N} rows in {repr(par_name)}")
-        log.debug("\n" + values.to_string(max_rows=5))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("\n" + values.to_string(max_rows=5))
 
         total += N
 
         if dry_run:
             continue
 
-        # Work around iiasa/ixmp#425
-        values["unit"] = values["unit"].str.replace("^$", "-", regex=True)
+        # Work around iiasa/ixmp#425: replace empty units with "-". Use a copy, so the
+        # caller's data are not modified.
+        values = values.assign(unit=values["unit"].replace("", "-").astype("category"))
 
+        start = perf_counter()
         try:
-            scenario.add_par(par_name, values)
+            for i in range(0, max(N, 1), chunk_size):
+                scenario.add_par(par_name, values.iloc[i : i + chunk_size])
         except Exception:  # pragma: no cover
             print(values.head())
             raise
 
+        elapsed = perf_counter() - start
+        log.info(f"  …added in {elapsed:.3f} s; {N / max(elapsed, 1e-9):.0f} rows/s")
+
     return total
 
 
-def aggregate_codes(df: pd.DataFrame, dim: str, codes):  # pragma: no cover
+def _check_par_data(scenario: "message_ix.Scenario", data: "ParameterData") -> None:
+    """Check `data` for :func:`add_par_data` before any of it is added to `scenario`.
+
+    Raises
+    ------
+    KeyError
+        if any key of `data` is not a parameter in `scenario`.
+    ValueError
+        if any value of `data` lacks a column for a dimension of the parameter, or for
+        "value" or "unit".
+    """
+    par_list = set(scenario.par_list())
+    if missing := sorted(set(data) - par_list):
+        raise KeyError(f"Parameter(s) {missing} not in {scenario.url}")
+
+    for par_name, values in data.items():
+        expected = set(scenario.idx_names(par_name)) | {"value", "unit"}
+        if missing := sorted(expected - set(values.columns)):
+            raise ValueError(f"Data for {par_name!r} lacks column(s) {missing}")
+
+
+def aggregate_codes(df: "pd.DataFrame", dim: str, codes):  # pragma: no cover
     """Aggregate `df` along dimension `dim` according to `codes`."""
     raise NotImplementedError
 
@@ -149,8 +231,8 @@ def aggregate_codes(df: pd.DataFrame, dim: str, codes):  # pragma: no cover
 
 
 def broadcast(
-    df: pd.DataFrame, labels: Optional[pd.DataFrame] = None, **kwargs
-) -> pd.DataFrame:
+    df: "pd.DataFrame", labels: Optional["pd.DataFrame"] = None, **kwargs
+) -> "pd.DataFrame":
     """Fill missing data in `df` by broadcasting.
 
     :func:`broadcast` is suitable for use with partly-filled data frames returned by
@@ -201,6 +283,7 @@ def broadcast(
     6   m1   node B          t    1.1
     7   m1   node B          t    2.2
     """
+    import pandas as pd
 
     def _check_dim(d):
         try:
@@ -209,38 +292,68 @@ def broadcast(
         except KeyError:
             raise ValueError(f"Dimension {d} not among {list(df.columns)}")
 
+    # Collect (labels, dimensions) to broadcast over, from the innermost to the
+    # outermost. Each item is a data frame with one column per dimension.
+    factors: list[pd.DataFrame] = []
+    columns = list(df.columns)
+
     # Broadcast using matched labels for 1+ dimensions from a data frame
     if labels is not None:
         # Check the dimensions
         for dim in labels.columns:
             _check_dim(dim)
-        # Concatenate 1 copy of `df` for each row in `labels`
-        df = pd.concat(
-            [df.assign(**row) for _, row in labels.iterrows()],
-            ignore_index=True,
-            sort=False,
-        )
+        factors.append(labels)
 
     # Next, broadcast other dimensions given as keyword arguments
     for dim, levels in kwargs.items():
         _check_dim(dim)
-        if len(levels) == 0:
+        if labels is not None and dim in labels.columns:
+            raise ValueError(f"Dimension {dim} was not empty\n\n{labels.head()}")
+        elif len(levels) == 0:
             log.debug(
                 f"Don't broadcast over {repr(dim)}; labels {levels} have length 0"
             )
             continue
+        factors.append(pd.DataFrame({dim: pd.Index(list(levels))}))
+        # Each dimension broadcast in this way becomes the first column
+        columns.remove(dim)
+        columns.insert(0, dim)
+
+    return _product(df, factors, columns) if factors else df
+
 
-        # - Duplicate the data
-        # - Drop the existing column named 'dim'
-        # - Re-add the column from the constructed MultiIndex
-        # - Reindex for sequential row numbers
-        df = (
-            pd.concat([df] * len(levels), keys=levels, names=[dim], sort=False)
-            .drop(dim, axis=1)
-            .reset_index(dim)
-            .reset_index(drop=True)
+def _product(
+    df: "pd.DataFrame", factors: list["pd.DataFrame"], columns: list[str]
+) -> "pd.DataFrame":
+    """Cartesian product of the rows of `df` and of each of `factors`, for broadcast.
+
+    The rows of `df` vary fastest, then those of each factor in turn. Each column in
+    `factors` replaces the column of the same name in `df`. The result has `columns`,
+    in order.
+    """
+    import numpy as np
+    import pandas as pd
+    from pandas.api.extensions import ExtensionDtype
+
+    # Length of the result
+    N = len(df) * int(np.prod([len(f) for f in factors]))
+
+    # Labels from `factors`, selected by positional indices
+    data, inner = {}, len(df)
+    for f in factors:
+        idx = np.tile(np.repeat(np.arange(len(f)), inner), N // max(inner * len(f), 1))
+        data.update({dim: f[dim].to_numpy()[idx] for dim in f.columns})
+        inner *= len(f)
+
+    # Duplicate the other columns of `df`, preserving their dtypes
+    idx = np.tile(np.arange(len(df)), N // max(len(df), 1))
+    for c in filter(lambda c: c not in data, df.columns):
+        values = (
+            df[c].array if isinstance(df[c].dtype, ExtensionDtype) else df[c].values
         )
-    return df
+        data[c] = values.take(idx)
+
+    return pd.DataFrame({c: data[c] for c in columns}, copy=False)
 
 
 def check_support(context, settings=dict(), desc: str = "") -> None:
@@ -293,9 +406,24 @@ def datetime_now_with_tz() -> datetime:
     return datetime.now(tz)
 
 
+def ellipsize(elements: list) -> str:
+    """Generate a short string representation of `elements`.
+
+    If the list has more than 5 elements, only the first two and last two are shown,
+    with "..." between.
+    """
+    if len(elements) > 5:
+        return ", ".join(map(str, elements[:2] + ["..."] + elements[-2:]))
+    else:
+        return ", ".join(map(str, elements))
+
+
 def ffill(
-    df: pd.DataFrame, dim: str, values: Sequence[CodeLike], expr: Optional[str] = None
-) -> pd.DataFrame:
+    df: "pd.DataFrame",
+    dim: str,
+    values: Sequence["CodeLike"],
+    expr: Optional[str] = None,
+) -> "pd.DataFrame":
     """Forward-fill `df` on `dim` to cover `values`.
 
     Parameters
@@ -312,6 +440,8 @@ def ffill(
         = year_vtg", then forward filling is performed along the "year_vtg" dimension/
         column, and then the filled values are copied to the "year_act" column.
     """
+    import pandas as pd
+
     if dim in ("value", "unit"):
         raise ValueError(dim)
 
@@ -405,6 +535,8 @@ def make_io(
     dict (str -> pd.DataFrame)
         Keys are 'input' and 'output'; values are data frames.
     """
+    import message_ix
+
     return dict(
         input=message_ix.make_df(
             "input",
@@ -426,8 +558,8 @@ def make_io(
 
 
 def make_matched_dfs(
-    base: Union[MutableMapping, pd.DataFrame],
-    **par_value: Union[float, pint.Quantity, dict],
+    base: Union[MutableMapping, "pd.DataFrame"],
+    **par_value: Union[float, "pint.Quantity", dict],
 ) -> "MutableParameterData":
     """Return data frames derived from `base` for multiple parameters.
 
@@ -458,6 +590,9 @@ def make_matched_dfs(
     >>>     technical_lifetime=pint.Quantity(8, "year"),
     >>> )
     """
+    import message_ix
+    import pint
+
     replace: dict[str, Any] = dict()
     data = ChainMap(replace, base)
     result = dict()
@@ -482,7 +617,7 @@ def make_matched_dfs(
 
 
 def make_source_tech(
-    info: Union[message_ix.Scenario, ScenarioInfo], common, **values
+    info: Union["message_ix.Scenario", "ScenarioInfo"], common, **values
 ) -> "MutableParameterData":
     """Return parameter data for a ‘source’ technology.
 
@@ -504,6 +639,11 @@ def make_source_tech(
     dict
         Suitable for :func:`add_par_data`.
     """
+    import message_ix
+
+    from .node import nodes_ex_world
+    from .scenarioinfo import ScenarioInfo
+
     # Check arguments
     if isinstance(info, message_ix.Scenario):
         info = ScenarioInfo(info)
@@ -534,7 +674,7 @@ def make_source_tech(
     return result
 
 
-def maybe_query(series: pd.Series, query: Optional[str]) -> pd.Series:
+def maybe_query(series: "pd.Series", query: Optional[str]) -> "pd.Series":
     """Apply :meth:`pandas.DataFrame.query` if the `query` arg is not :obj:`None`.
 
     :meth:`~pandas.DataFrame.query` is not chainable (`pandas-dev/pandas#37941
@@ -548,6 +688,8 @@ def maybe_query(series: pd.Series, query: Optional[str]) -> pd.Series:
 
 def merge_data(base: "MutableParameterData", *others: "ParameterData") -> None:
     """Merge dictionaries of DataFrames together into `base`."""
+    import pandas as pd
+
     for other in others:
         for par, df in other.items():
             base[par] = pd.concat([base.get(par, None), df])
@@ -667,6 +809,8 @@ def path_fallback(
     ValueError
         If `where` is empty or `parts` are not found in any of the indicated locations.
     """
+    from .common import local_data_path, package_data_path, private_data_path
+
     dirs = []
     for item in where.split() if isinstance(where, str) else where:
         if isinstance(item, str):
@@ -696,7 +840,7 @@ def path_fallback(
 
 
 def replace_par_data(
-    scenario: message_ix.Scenario,
+    scenario: "message_ix.Scenario",
     parameters: Union[str, Sequence[str]],
     filters: Mapping[str, Union[str, int, Collection[str], Collection[int]]],
     to_replace: Mapping[str, Union[Mapping[str, str], Mapping[int, int]]],
@@ -730,6 +874,8 @@ def replace_par_data(
     """
     from message_ix_models.model.build import apply_spec
 
+    from .scenarioinfo import Spec
+
     pars = parameters.split() if isinstance(parameters, str) else parameters
 
     # Create a Spec that requires `scenario` to have all the set elements mentioned by
@@ -760,7 +906,7 @@ def replace_par_data(
 
 
 @singledispatch
-def same_node(data: pd.DataFrame, from_col: str = "node_loc") -> pd.DataFrame:
+def same_node(data: "pd.DataFrame", from_col: str = "node_loc") -> "pd.DataFrame":
     """Fill 'node_{,dest,loc,origin,rel,share}' in `df` from `from_col`."""
     cols = list(
         set(data.columns)
@@ -780,7 +926,7 @@ def _(
 
 
 @singledispatch
-def same_time(data: pd.DataFrame) -> pd.DataFrame:
+def same_time(data: "pd.DataFrame") -> "pd.DataFrame":
     """Fill 'time_origin'/'time_dest' in `df` from 'time'."""
     cols = list(set(data.columns) & {"time_origin", "time_dest"})
     return data.assign(**{c: copy_column("time") for c in cols})
@@ -813,9 +959,9 @@ def show_versions() -> str:
 
 # FIXME Reduce complexity from 14 to ≤13
 def strip_par_data(  # noqa: C901
-    scenario: message_ix.Scenario,
+    scenario: "message_ix.Scenario",
     set_name: str,
-    element: str,
+    element: Union[str, Collection[str]],
     dry_run: bool = False,
     dump: Optional["MutableParameterData"] = None,
 ) -> int:
@@ -823,6 +969,12 @@ def strip_par_data(  # noqa: C901
 
     Parameters
     ----------
+    element : str or collection of str
+        Element(s) to remove. If a collection is given, all the elements are stripped
+        together: each affected parameter is retrieved and modified with a single call
+        each to :meth:`~ixmp.Scenario.par` and :meth:`~ixmp.Scenario.remove_par`,
+        regardless of the number of elements. This is much faster than calling
+        :func:`strip_par_data` once per element.
     dry_run : bool, optional
         If :data:`True`, only show what would be done.
     dump : dict, optional
@@ -838,17 +990,27 @@ def strip_par_data(  # noqa: C901
     --------
     add_par_data
     """
+    import pandas as pd
+
+    elements = [element] if isinstance(element, str) else list(element)
+    if not elements:
+        return 0
+
     par_list = scenario.par_list()
     no_data = set()  # Names of parameters with no data being stripped
     total = 0  # Total observations stripped
 
+    # Description of the element(s) for log messages
+    desc = (
+        f"{set_name}={elements[0]!r}"
+        if len(elements) == 1
+        else f"{set_name} in {ellipsize(elements)}"
+    )
+
     if dump is None:
         pars = []  # Don't iterate over parameters unless dumping
     else:
-        log.info(
-            f"Remove data with {set_name}={element!r}"
-            + (" (DRY RUN)" if dry_run else "")
-        )
+        log.info(f"Remove data with {desc}" + (" (DRY RUN)" if dry_run else ""))
         # Iterate over parameters with ≥1 dimensions indexed by `set_name`
         pars = iter_parameters(set_name, scenario=scenario)
 
@@ -864,8 +1026,8 @@ def strip_par_data(  # noqa: C901
             lambda item: item[1] == set_name,
             zip(scenario.idx_names(par_name), scenario.idx_sets(par_name)),
         ):
-            # Check for contents of par_name that include `element`
-            par_data = scenario.par(par_name, filters={dim: element})
+            # Check for contents of par_name that include any of `elements`
+            par_data = scenario.par(par_name, filters={dim: elements})
             N = len(par_data)
             total += N
 
@@ -902,13 +1064,37 @@ def strip_par_data(  # noqa: C901
         log.debug(f"No data removed from {len(no_data)} other parameters")
 
     if not dry_run:
-        log.info(f"Remove {element!r} from set {set_name!r}")
-        try:
-            scenario.remove_set(set_name, element)
-        except Exception as e:
-            if "does not have an element" in str(e):
-                log.info("  …not found")
-            else:  # pragma: no cover
-                raise
+        _remove_set_elements(scenario, set_name, elements)
 
     return total
+
+
+def _remove_set_elements(
+    scenario: "message_ix.Scenario", set_name: str, elements: list
+) -> None:
+    """Remove `elements` from `set_name`, skipping any that are not present."""
+    import pandas as pd
+
+    base = scenario.set(set_name) if len(elements) > 1 else None
+
+    if not isinstance(base, pd.Series):
+        # Single element, or an indexed set: remove elements one by one
+        for e in elements:
+            log.info(f"Remove {e!r} from set {set_name!r}")
+            try:
+                scenario.remove_set(set_name, e)
+            except Exception as exc:
+                if "does not have an element" in str(exc):
+                    log.info("  …not found")
+                else:  # pragma: no cover
+                    raise
+        return
+
+    # Remove all elements present in the set using a single call
+    existing = set(map(str, base.tolist()))
+    present = [str(e) for e in elements if str(e) in existing]
+    log.info(f"Remove {len(present)} element(s) from set {set_name!r}")
+    if len(present) < len(elements):
+        log.info(f"  …{len(elements) - len(present)} not found")
+    if present:
+        scenario.remove_set(set_name, present)
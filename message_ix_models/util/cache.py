@@ -8,18 +8,43 @@ included in the computed cache key:
   string representation / ID.
 - :class:`ixmp.Platform`, :class:`xarray.Dataset`: ignored, with a warning logged.
 - :class:`.ScenarioInfo`: only the :attr:`~ScenarioInfo.set` entries are hashed.
+- :class:`genno.Quantity`: hashed as a digest of its dimensions, coordinates, values,
+  and units.
+
+Tabular return values—:class:`pandas.DataFrame` and :class:`genno.Quantity`—are stored
+as uncompressed Arrow IPC files, which are memory-mapped when read; other values are
+pickled. Files written by earlier versions (Parquet or pickle) are still read.
+
+It also maintains a :class:`CacheIndex` of the files written by :func:`cached`, used to
+inspect and prune the cache via :program:`mix-models cache`.
 """
 
 import json
 import logging
-from collections.abc import Callable
+import pickle
+import re
+import sqlite3
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import closing, contextmanager
 from dataclasses import is_dataclass
+from datetime import timedelta
 from enum import Enum
-from types import FunctionType
-from typing import TYPE_CHECKING, Union
-
+from functools import partial, update_wrapper
+from hashlib import blake2b
+from operator import attrgetter, itemgetter, methodcaller
+from pathlib import Path
+from time import time
+from types import BuiltinFunctionType, FunctionType, MethodType
+from typing import Any, Optional, Union
+
+import click
 import genno.caching
 import ixmp
+import numpy as np
+import pandas as pd
+import pint
+import pyarrow as pa
+import pyarrow.parquet as pq
 import sdmx.model
 import xarray as xr
 
@@ -29,10 +54,6 @@ from ._dataclasses import asdict
 from .context import Context
 from .scenarioinfo import ScenarioInfo
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
-
 log = logging.getLogger(__name__)
 
 
@@ -41,14 +62,40 @@ log = logging.getLogger(__name__)
 SKIP_CACHE = False
 
 # Paths already logged, to decrease verbosity
-PATHS_SEEN: set["Path"] = set()
+PATHS_SEEN: set[Path] = set()
 
 
 # Show genno how to hash function arguments seen in message_ix_models
 
 
+def _array_bytes(values) -> bytes:
+    """Return bytes representing `values`, independent of the Python process."""
+    values = np.asarray(values)
+    if values.dtype.kind == "O":
+        # Strings or other Python objects; hash their string representations
+        return "\x1f".join(map(str, values)).encode()
+    return values.dtype.str.encode() + np.ascontiguousarray(values).tobytes()
+
+
 def _quantity(o: "AnyQuantity"):
-    return tuple(o.to_series().to_dict())
+    """Return a :func:`~hashlib.blake2b` digest of the contents of `o`.
+
+    The digest is computed over the dimension names, index levels and codes, values,
+    and units. This avoids creating a Python object for every element of `o`.
+    """
+    s = o if isinstance(o, pd.Series) else o.to_series()
+    index = s.index if isinstance(s.index, pd.MultiIndex) else None
+
+    h = blake2b(digest_size=20)
+    h.update(f"{list(s.index.names)} {o.units}".encode())
+    for level, codes in (
+        zip(index.levels, index.codes) if index is not None else [(s.index, None)]
+    ):
+        h.update(_array_bytes(level))
+        h.update(b"" if codes is None else _array_bytes(codes))
+    h.update(_array_bytes(s.to_numpy()))
+
+    return h.hexdigest()
 
 
 try:
@@ -105,6 +152,288 @@ def _si(o: ScenarioInfo):
 genno.caching.Encoder.ignore(xr.DataArray, xr.Dataset, ixmp.Platform)
 
 
+class CacheIndex:
+    """Index of the files written by :func:`cached` in the directory `path`.
+
+    The index is an SQLite database, :file:`index.sqlite`, in the same directory. For
+    each cache file, it records the name of the cached function, the cache key, the
+    file size, the time of creation, and the time and number of cache hits. It also
+    records the total number of cache hits and misses for each function.
+
+    Cache files that exist but are not in the index—for instance, those written by
+    earlier versions of :mod:`message_ix_models`—are added by :meth:`sync`.
+    """
+
+    #: Name of the database file.
+    name = "index.sqlite"
+
+    #: Expression matching names of cache files: function name, key, and suffix.
+    file_expr = re.compile(
+        r"(?P<func>.+)-(?P<key>[0-9a-f]{40})\.(arrow|parquet|pickle|pkl)"
+    )
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    @contextmanager
+    def _transact(self) -> Iterator[sqlite3.Connection]:
+        with closing(sqlite3.connect(self.path.joinpath(self.name), timeout=30)) as c:
+            with c:
+                c.execute(
+                    "CREATE TABLE IF NOT EXISTS entry (file TEXT PRIMARY KEY, func TEXT"
+                    ", key TEXT, size INTEGER, created REAL, last_hit REAL"
+                    ", hits INTEGER DEFAULT 0)"
+                )
+                c.execute(
+                    "CREATE TABLE IF NOT EXISTS counter (func TEXT PRIMARY KEY"
+                    ", hits INTEGER DEFAULT 0, misses INTEGER DEFAULT 0)"
+                )
+                yield c
+
+    def _count(self, c: sqlite3.Connection, func: str, column: str) -> None:
+        c.execute("INSERT OR IGNORE INTO counter (func) VALUES (?)", (func,))
+        c.execute(f"UPDATE counter SET {column} = {column} + 1 WHERE func = ?", (func,))
+
+    def _add(self, c: sqlite3.Connection, path: Path, created: float) -> None:
+        if match := self.file_expr.fullmatch(path.name):
+            c.execute(
+                "INSERT OR REPLACE INTO entry (file, func, key, size, created) VALUES "
+                "(?, ?, ?, ?, ?)",
+                (path.name, match["func"], match["key"], path.stat().st_size, created),
+            )
+
+    def record_hit(self, path: Path) -> None:
+        """Record a cache hit for the existing cache file `path`."""
+        with self._transact() as c:
+            cursor = c.execute(
+                "UPDATE entry SET last_hit = ?, hits = hits + 1 WHERE file = ?",
+                (time(), path.name),
+            )
+            if cursor.rowcount == 0:
+                # File not yet indexed
+                self._add(c, path, path.stat().st_mtime)
+                c.execute(
+                    "UPDATE entry SET last_hit = ?, hits = 1 WHERE file = ?",
+                    (time(), path.name),
+                )
+            self._count(c, path.name.rpartition("-")[0], "hits")
+
+    def record_miss(self, path: Path) -> None:
+        """Record a cache miss that resulted in writing the cache file `path`."""
+        with self._transact() as c:
+            self._add(c, path, time())
+            self._count(c, path.name.rpartition("-")[0], "misses")
+
+    def sync(self) -> None:
+        """Add unindexed cache files to the index; remove entries for missing files."""
+        existing = {
+            p.name: p for p in self.path.iterdir() if self.file_expr.fullmatch(p.name)
+        }
+        with self._transact() as c:
+            indexed = {row[0] for row in c.execute("SELECT file FROM entry")}
+            c.executemany(
+                "DELETE FROM entry WHERE file = ?",
+                [(f,) for f in indexed - set(existing)],
+            )
+            for name in sorted(set(existing) - indexed):
+                self._add(c, existing[name], existing[name].stat().st_mtime)
+
+    def entries(self) -> pd.DataFrame:
+        """Return all index entries, with times as :class:`pandas.Timestamp` in UTC.
+
+        The times are naïve, that is without a time zone.
+        """
+        self.sync()
+        with self._transact() as c:
+            result = pd.read_sql_query(
+                "SELECT * FROM entry ORDER BY coalesce(last_hit, created)", c
+            )
+        for column in "created", "last_hit":
+            result[column] = pd.to_datetime(result[column], unit="s")
+        return result
+
+    def stats(self) -> pd.DataFrame:
+        """Return a data frame of statistics for each cached function.
+
+        The columns are the number of cache files (‘entries’) and their total size in
+        bytes; and the total number of cache ‘hits’ and ‘misses’ recorded in the index.
+        """
+        self.sync()
+        with self._transact() as c:
+            return pd.read_sql_query(
+                "SELECT func, count(file) AS entries, coalesce(sum(size), 0) AS size"
+                ", coalesce(max(counter.hits), 0) AS hits"
+                ", coalesce(max(counter.misses), 0) AS misses "
+                "FROM (SELECT func FROM entry UNION SELECT func FROM counter) "
+                "LEFT JOIN entry USING (func) LEFT JOIN counter USING (func) "
+                "GROUP BY func ORDER BY func",
+                c,
+            ).set_index("func")
+
+    def prune(
+        self,
+        max_size: Optional[int] = None,
+        max_age: Optional[timedelta] = None,
+        func: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> list[Path]:
+        """Remove cache files, least recently used first.
+
+        Parameters
+        ----------
+        max_size :
+            Remove files until the total size of those remaining is at most this many
+            bytes.
+        max_age :
+            Remove files that were neither created nor hit more recently than this.
+        func :
+            Only remove files for the cached function with this name. If neither
+            `max_size` nor `max_age` are given, all of its files are removed.
+        dry_run :
+            Only return the files that would be removed.
+
+        Returns
+        -------
+        list of pathlib.Path
+            Files that were removed.
+        """
+        df = self.entries()
+        if func is not None:
+            df = df.query("func == @func")
+
+        # Time that each entry was last used
+        last_used = df["last_hit"].fillna(df["created"])
+
+        remove = pd.Series(max_size is None and max_age is None, index=df.index)
+        if max_age is not None:
+            # Current time as naïve UTC, like `last_used`
+            now = pd.Timestamp.now(tz="UTC").tz_localize(None)
+            remove |= last_used < now - max_age
+        if max_size is not None:
+            # Cumulative size of the most recently used entries; `df` is sorted
+            remove |= df["size"][::-1].cumsum()[::-1] > max_size
+
+        result = [self.path.joinpath(f) for f in df.loc[remove, "file"]]
+
+        if not dry_run:
+            for path in result:
+                path.unlink(missing_ok=True)
+            self.sync()
+            log.info(f"Removed {len(result)} cache file(s) from {self.path}")
+
+        return result
+
+
+#: Key for :mod:`message_ix_models` metadata in the schema of Arrow IPC cache files.
+_ARROW_META = b"message_ix_models"
+
+
+def _to_arrow(data: Any) -> Optional[pa.Table]:
+    """Convert `data` to a :class:`pyarrow.Table` for caching, if possible.
+
+    Return :obj:`None` if `data` is not tabular, or cannot be represented in Arrow and
+    read back unchanged: for instance, a 0-dimensional Quantity, a DataFrame with column
+    labels that are not all :class:`str`, or a column of mixed Python types.
+    """
+    if isinstance(data, genno.Quantity):
+        if not data.dims:
+            return None  # Scalar; no index to restore
+        dims = list(data.dims)
+        meta = dict(kind="quantity", dims=dims, name=data.name, units=str(data.units))
+        df: pd.DataFrame = data.to_series().rename("value").reset_index()
+        df.attrs.clear()  # Units are stored in `meta`
+        preserve_index: Optional[bool] = False
+    elif isinstance(data, pd.DataFrame):
+        if not all(isinstance(c, str) for c in data.columns):
+            return None  # Arrow would convert labels to str
+        meta, df, preserve_index = dict(kind="dataframe", attrs=data.attrs), data, None
+    else:
+        return None
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+        metadata = {**(table.schema.metadata or {}), _ARROW_META: json.dumps(meta)}
+    except (TypeError, ValueError, pa.ArrowException):
+        return None
+
+    return table.replace_schema_metadata(metadata)
+
+
+def _read_arrow(
+    path: Path, columns: Optional[list[str]] = None, filters=None
+) -> Union[pd.DataFrame, "AnyQuantity"]:
+    """Read a DataFrame or Quantity from an Arrow IPC cache file at `path`.
+
+    The file is memory-mapped, so only the parts of it needed for `columns` and
+    `filters` are loaded.
+
+    Parameters
+    ----------
+    columns :
+        Names of columns to read. Index columns of a DataFrame are always read. Not
+        supported for a Quantity.
+    filters :
+        Select rows, in the same form as for :func:`pandas.read_parquet`: a list of
+        tuples like :py:`("TIME", ">=", 1980)`, or a list of such lists.
+    """
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+
+    meta = json.loads(table.schema.metadata[_ARROW_META])
+
+    if filters:
+        table = table.filter(pq.filters_to_expression(filters))
+
+    if columns is not None:
+        if meta["kind"] == "quantity":
+            raise ValueError("Cannot select columns of a cached Quantity")
+        index_columns = [
+            c
+            for c in table.schema.pandas_metadata["index_columns"]
+            if isinstance(c, str)
+        ]
+        table = table.select(
+            index_columns + [c for c in columns if c not in index_columns]
+        )
+
+    if meta["kind"] == "quantity":
+        s = table.to_pandas().set_index(meta["dims"])["value"].rename(meta["name"])
+        return genno.Quantity(s, name=meta["name"], units=meta["units"])
+
+    result = table.to_pandas()
+    result.attrs.update(meta["attrs"])
+    return result
+
+
+def _write(path: Path, data: Any) -> Path:
+    """Write `data` to a cache file at `path`, plus a suffix; return the full path.
+
+    Tabular data are written as Arrow IPC (suffix ".arrow"), other data as a pickle.
+    """
+    if (table := _to_arrow(data)) is not None:
+        result = path.with_suffix(".arrow")
+        with pa.OSFile(str(result), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    else:
+        result = path.with_suffix(".pickle")
+        with open(result, "wb") as f:
+            pickle.dump(data, f)
+
+    return result
+
+
+def _read(path: Path, columns: Optional[list[str]] = None, filters=None) -> Any:
+    """Read data from a cache file at `path`.
+
+    `columns` and `filters` are passed to :func:`_read_arrow`, and ignored for other
+    files, including Parquet and pickle files written by :func:`genno.caching._write`.
+    """
+    if path.suffix == ".arrow":
+        return _read_arrow(path, columns, filters)
+    return genno.caching._read(path)
+
+
 def cached(func: Callable) -> Callable:
     """Decorator to cache the return value of a function `func`.
 
@@ -114,6 +443,22 @@ def cached(func: Callable) -> Callable:
 
     When :data:`.SKIP_CACHE` is true, `func` is always called.
 
+    DataFrame and Quantity return values are cached as Arrow IPC files. Use the
+    :py:`project()` attribute of the decorated function to read only some columns or
+    rows of these; for example:
+
+    .. code-block:: python
+
+        @cached
+        def func(path):
+            ...  # Return a large pandas.DataFrame with columns "n", "y", "value"
+
+        df = func.project(columns=["y", "value"], filters=[("n", "==", "AUT")])(path)
+
+    Each cache hit and miss is recorded in a :class:`CacheIndex`. If
+    :attr:`.Config.cache_max_size` is set, then after each cache miss the least-recently
+    used cache files are removed so that their total size does not exceed this limit.
+
     See also
     --------
     :doc:`genno:cache` in the :mod:`genno` documentation
@@ -127,10 +472,63 @@ def cached(func: Callable) -> Callable:
         PATHS_SEEN.add(cache_path)
         cache_path.mkdir(parents=True, exist_ok=True)
 
-    # Use the genno internals to wrap the function.
-    cached_load = genno.caching.decorate(
-        func, cache_path=cache_path, cache_skip=SKIP_CACHE
-    )
+    index = CacheIndex(cache_path)
+
+    # Hash of the compiled code of `func`; part of the cache key
+    code_hash = genno.caching.hash_code(func)
+
+    # Same file names as genno.caching.decorate(), plus use of `index` and projection
+    def _load(args, kwargs, columns=None, filters=None):
+        # Path to the cache file, without suffix
+        key = genno.caching.hash_args(*args, code_hash, **kwargs)
+        path = cache_path.joinpath(f"{func.__name__}-{key}")
+        # Shorter name for logging
+        short_name = f"{func.__name__}(<{key[:8]}…>)"
+        # Identify existing cache files
+        files = [] if SKIP_CACHE else list(cache_path.glob(f"{path.name}.*"))
+
+        if len(files) == 1:
+            log.info(f"Cache hit for {short_name}")
+            _update_index(index.record_hit, files[0])
+            return _read(files[0], columns, filters)
+
+        # Also occurs if len(files) >= 2
+        log.info(f"{'Skip cache' if SKIP_CACHE else 'Cache miss'} for {short_name}")
+
+        # Call the wrapped function and store the result
+        result = func(*args, **kwargs)
+        for p in cache_path.glob(f"{path.name}.*"):
+            p.unlink()  # Remove stale files, possibly in another format
+        written = _write(path, result)
+        _update_index(index.record_miss, written)
+
+        if max_size := Context.get_instance(-1).core.cache_max_size:
+            _update_index(index.prune, max_size=max_size)
+
+        if columns is None and not filters:
+            return result
+        # Read back only the requested part of the result
+        return _read(written, columns, filters)
+
+    def cached_load(*args, **kwargs):
+        return _load(args, kwargs)
+
+    def project(columns: Optional[list[str]] = None, filters=None) -> Callable:
+        """Return a version of the cached function that reads only part of its data.
+
+        The returned callable takes the same arguments and uses the same cache files
+        as the cached function. From tabular data, it returns only the given `columns`
+        and the rows matching `filters`; see :func:`_read_arrow`.
+        """
+
+        def projected_load(*args, **kwargs):
+            return _load(args, kwargs, columns, filters)
+
+        return update_wrapper(projected_load, func)
+
+    # Update the wrapped function with the docstring etc. of the original
+    update_wrapper(cached_load, func)
+    cached_load.project = project  # type: ignore [attr-defined]
 
     if cached_load.__doc__ is not None:
         # Determine the indent
@@ -144,3 +542,342 @@ def cached(func: Callable) -> Callable:
         )
 
     return cached_load
+
+
+_FUNCTION_TYPES = (BuiltinFunctionType, FunctionType, MethodType)
+
+
+def _hash_code(func: Callable) -> Optional[str]:
+    """Like :func:`genno.caching.hash_code`, but :obj:`None` for built-in `func`."""
+    code = getattr(func, "__code__", None)
+    return None if code is None else _PersistEncoder().default(code)
+
+
+#: Placeholder in the `memo` argument to :func:`_digest`.
+_PENDING = object()
+
+
+class _Uncacheable(Exception):
+    """A task input cannot be included in a persistent cache key."""
+
+
+class _PersistEncoder(genno.caching.Encoder):
+    """Encoder for :func:`persist`; stable across Python processes.
+
+    Unlike :class:`genno.caching.Encoder`, types that are ignored by that class are
+    not cacheable.
+    """
+
+    def default(self, o):  # noqa: C901
+        from message_ix_models.model.build import _file_digest
+
+        from .config import ConfigHelper
+
+        if isinstance(o, xr.DataArray):
+            return _quantity(genno.Quantity(o))
+        elif isinstance(o, tuple(genno.caching.IGNORE)):
+            raise _Uncacheable(type(o))
+        elif isinstance(o, ConfigHelper):
+            return o.hexdigest()
+        elif isinstance(o, Path) and o.is_file():
+            stat = o.stat()
+            return [str(o), _file_digest(o, stat.st_mtime_ns, stat.st_size)]
+        elif isinstance(o, _FUNCTION_TYPES):
+            return [f"{o.__module__}.{o.__qualname__}", _hash_code(o)]
+        elif isinstance(o, type):
+            return f"{o.__module__}.{o.__qualname__}"
+        elif isinstance(o, (set, frozenset)):
+            return sorted(json.dumps(v, cls=type(self), sort_keys=True) for v in o)
+        elif isinstance(o, pd.DataFrame):
+            h = blake2b(str(list(o.dtypes.items())).encode(), digest_size=20)
+            h.update(_array_bytes(pd.util.hash_pandas_object(o)))
+            return h.hexdigest()
+        elif isinstance(o, np.ndarray):
+            # NB repr() of a large array is abbreviated, so cannot be used
+            h = blake2b(f"{o.dtype.str} {o.shape}".encode(), digest_size=20)
+            h.update(_array_bytes(o))
+            return h.hexdigest()
+        elif isinstance(o, np.generic):
+            return [o.dtype.str, o.item()]
+        elif isinstance(o, pint.Quantity):
+            return str(o)
+
+        try:
+            return super().default(o)
+        except TypeError:
+            if hasattr(o, "__dict__"):
+                # Other objects: their class and attributes
+                return [self.default(type(o)), _str_keys(vars(o))]
+            elif isinstance(o, (attrgetter, itemgetter, methodcaller)):
+                return repr(o)  # Complete, for instance "operator.itemgetter(0)"
+            raise _Uncacheable(type(o))
+
+
+def _str_keys(obj: Any) -> Any:
+    """Replace non-:class:`str` keys in `obj` and nested dicts, for JSON encoding."""
+    if isinstance(obj, dict):
+        encode = partial(json.dumps, cls=_PersistEncoder)
+        return {
+            k if isinstance(k, str) else encode(k): _str_keys(v) for k, v in obj.items()
+        }
+    elif isinstance(obj, (list, tuple)):
+        return [_str_keys(v) for v in obj]
+    return obj
+
+
+def _token(obj: Any, dsk: Mapping, memo: dict) -> Any:
+    """Return a JSON-serializable token for `obj`, an element of a task in `dsk`."""
+    from dask.core import literal
+
+    try:
+        if obj in dsk:
+            # A key in an attribute of the object that computes it: only its name
+            return str(obj) if memo.get(obj) is _PENDING else _digest(obj, dsk, memo)
+    except TypeError:  # Unhashable `obj`
+        pass
+
+    if isinstance(obj, literal):
+        return _token(obj.data, dsk, memo)
+    elif isinstance(obj, (list, tuple)):
+        return [_token(o, dsk, memo) for o in obj]
+    elif isinstance(obj, dict):
+        return {str(k): _token(v, dsk, memo) for k, v in obj.items()}
+    elif isinstance(obj, partial):
+        return [_token(o, dsk, memo) for o in (obj.func, obj.args, obj.keywords)]
+    elif isinstance(obj, Context):
+        # Settings, except those like the cache path that do not affect results
+        values = obj._values.items()
+        return _token(
+            {k: v for k, v in values if k != "core" and v is not obj}, dsk, memo
+        )
+    elif hasattr(obj, "__wrapped__"):
+        # For instance a genno Operator or functools.lru_cache() wrapper
+        return _token(obj.__wrapped__, dsk, memo)
+    elif (
+        callable(obj)
+        and hasattr(obj, "__dict__")
+        and not isinstance(obj, (type,) + _FUNCTION_TYPES)
+    ):
+        # Callable instance, for instance an ExoDataSource: its class and state
+        cls = type(obj)
+        return [
+            f"{cls.__module__}.{cls.__qualname__}",
+            _hash_code(cls.__call__),
+            _token(vars(obj), dsk, memo),
+        ]
+
+    try:
+        return json.loads(json.dumps(obj, cls=_PersistEncoder, sort_keys=True))
+    except (TypeError, ValueError, RecursionError) as e:
+        raise _Uncacheable(type(obj)) from e
+
+
+def _digest(key, dsk: Mapping, memo: dict) -> str:
+    """Return a digest of the task for `key` in `dsk` and all of its inputs.
+
+    Raises :class:`_Uncacheable` if any input, direct or indirect, cannot be hashed.
+    """
+    if key not in memo:
+        memo[key] = _PENDING
+        try:
+            value = _token(dsk[key], dsk, memo)
+            memo[key] = blake2b(
+                json.dumps(value, sort_keys=True).encode(), digest_size=20
+            ).hexdigest()
+        except _Uncacheable as e:
+            memo[key] = e
+        except RecursionError:
+            memo[key] = _Uncacheable("deeply nested values")
+    if isinstance(memo[key], _Uncacheable):
+        raise memo[key]
+    return memo[key]
+
+
+def _persist_load(path: Path, index: CacheIndex) -> Any:
+    _update_index(index.record_hit, path)
+    return _read(path)
+
+
+def _persist_store(path: Path, index: CacheIndex, func: Callable, *args) -> Any:
+    result = func(*args)
+    for p in path.parent.glob(f"{path.name}.*"):
+        p.unlink()  # Remove stale files, possibly in another format
+    try:
+        _update_index(index.record_miss, _write(path, result))
+    except (AttributeError, TypeError, pickle.PicklingError) as e:
+        log.debug(f"Could not cache {path.name}: {e!r}")
+        path.with_suffix(".pickle").unlink(missing_ok=True)
+    return result
+
+
+def persist(
+    dsk: Mapping,
+    keys: Iterable,
+    cache_path: Optional[Path] = None,
+    substitute: Optional[Mapping] = None,
+) -> dict:
+    """Return a copy of the graph `dsk` in which `keys` are cached on disk.
+
+    This is the analogue of :func:`cached` for tasks in a :mod:`dask`/:mod:`genno`
+    graph. For each of `keys` that is computed by a task in `dsk`, a cache key is
+    computed from a digest of the task and, recursively, of all its inputs:
+
+    - Other keys in `dsk`: their own digests, as described here.
+    - Functions: their fully-qualified names and compiled code. For
+      :func:`functools.partial`, also the arguments. For other callable objects such as
+      :class:`.ExoDataSource`, their class, its :py:`__call__()` code, and their
+      attributes.
+    - :class:`.ConfigHelper` instances: :meth:`.ConfigHelper.hexdigest`.
+    - :class:`.Context`: all values except :attr:`.Context.core`.
+    - Paths to existing files: the path and a digest of the file contents.
+    - Other values: as handled by :class:`genno.caching.Encoder`.
+
+    The digest also includes the version of :mod:`message_ix_models`. Thus a change to
+    code, configuration, or input files invalidates the cached data for any key that
+    depends on them. If a cache file exists, the task is replaced by one that reads it,
+    and the inputs of the task are not computed. Otherwise, the task is replaced by one
+    that also writes its result to the cache.
+
+    Only the code of functions that appear in `dsk` is hashed, not that of other
+    functions that they call. If such a helper function is changed without a change to
+    the package version—for instance in an editable install—cached data computed with
+    the previous code may be used. Set :data:`.SKIP_CACHE` or clear the cache in this
+    case.
+
+    Keys that depend on values that cannot be hashed—for instance a
+    :class:`message_ix.Scenario`, :class:`ixmp.Platform`, or other objects not handled
+    by :class:`genno.caching.Encoder`—are not cached.
+
+    When :data:`.SKIP_CACHE` is true, cache files are not read, but are (re)written.
+
+    Parameters
+    ----------
+    keys :
+        Keys to be cached. Those not in `dsk`, or that are aliases of another key, are
+        ignored.
+    cache_path :
+        Directory for cache files. Default: :attr:`.Config.cache_path`. Each hit and
+        miss is recorded in a :class:`CacheIndex` in this directory.
+    substitute :
+        Mapping from keys in `dsk` to values used in place of their tasks when computing
+        digests. Use this to omit values that do not affect the result of any task, for
+        instance output paths.
+    """
+    from dask.core import istask
+
+    from message_ix_models import __version__
+
+    cache_path = cache_path or Context.get_instance(-1).core.cache_path
+    assert cache_path
+    cache_path.mkdir(parents=True, exist_ok=True)
+    index = CacheIndex(cache_path)
+
+    memo: dict = {}
+    for k, v in (substitute or {}).items():
+        if k in dsk:
+            try:
+                memo[k] = _digest(k, {k: v}, {})
+            except _Uncacheable as e:
+                memo[k] = e
+
+    result = dict(dsk)
+    for key in keys:
+        task: tuple = dsk.get(key, ())
+        if not istask(task):
+            continue
+
+        try:
+            digest = blake2b(
+                f"{__version__} {_digest(key, dsk, memo)}".encode(), digest_size=20
+            ).hexdigest()
+        except _Uncacheable as e:
+            log.debug(f"Not cacheable: {key!r} depends on {e.args[0]}")
+            continue
+
+        name = re.sub(r"[^\w+-]", "_", str(key))
+        path = cache_path.joinpath(f"{name}-{digest}")
+        files = [] if SKIP_CACHE else list(cache_path.glob(f"{path.name}.*"))
+        if len(files) == 1:
+            log.info(f"Cache hit for {key!r}")
+            result[key] = (partial(_persist_load, files[0], index),)
+        else:
+            func, *args = task
+            result[key] = (partial(_persist_store, path, index, func), *args)
+
+    return result
+
+
+def _update_index(method: Callable, *args, **kwargs) -> None:
+    """Call `method` of a :class:`CacheIndex`; log but otherwise ignore errors.
+
+    This ensures that, for instance, a locked or read-only index does not prevent
+    cached data from being used.
+    """
+    try:
+        method(*args, **kwargs)
+    except (OSError, sqlite3.Error) as e:  # pragma: no cover
+        log.debug(f"Could not update cache index: {e!r}")
+
+
+def _parse_size(ctx, param, value: Optional[str]) -> Optional[int]:
+    """Parse a size like "512", "100M" or "10G" to a number of bytes."""
+    if value is None:
+        return None
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([kKMGT]?)B?", value.strip())
+    if not match:
+        raise click.BadParameter(f"{value!r}; expected e.g. 500M or 10G")
+    return int(float(match[1]) * 1024 ** " KMGT".index(match[2].upper() or " "))
+
+
+@click.group("cache")
+@click.pass_obj
+def cli(context):
+    """Inspect and prune cached data.
+
+    These commands act on the files written by cached functions in the cache directory,
+    by default a directory named "message-ix-models" in the user's cache directory.
+    """
+
+
+@cli.command("ls")
+@click.option("--func", help="Only show files for the function with this name.")
+@click.pass_obj
+def ls_cmd(context, func):
+    """List cache files, least recently used first."""
+    df = CacheIndex(context.core.cache_path).entries()
+    if func:
+        df = df.query("func == @func")
+    print(df.drop(columns="key").to_string(index=False))
+
+
+@cli.command("prune")
+@click.option(
+    "--max-size", callback=_parse_size, help="Maximum total size, e.g. 500M or 10G."
+)
+@click.option("--max-age", type=int, help="Remove files not used in this many days.")
+@click.option("--func", help="Only remove files for the function with this name.")
+@click.option("--dry-run", is_flag=True, help="Only show what would be removed.")
+@click.pass_obj
+def prune_cmd(context, max_size, max_age, func, dry_run):
+    """Remove cache files, least recently used first."""
+    if max_size is None and max_age is None and func is None:
+        raise click.UsageError("Give at least one of --max-size, --max-age, --func")
+
+    result = CacheIndex(context.core.cache_path).prune(
+        max_size=max_size,
+        max_age=None if max_age is None else timedelta(days=max_age),
+        func=func,
+        dry_run=dry_run,
+    )
+    print("\n".join(map(str, result)) or "(none)")
+
+
+@cli.command("stats")
+@click.option("--output", type=Path, help="Also write statistics to this CSV file.")
+@click.pass_obj
+def stats_cmd(context, output):
+    """Show number, size, hits, and misses of cache files for each function."""
+    df = CacheIndex(context.core.cache_path).stats()
+    print(df.to_string())
+    if output:
+        df.to_csv(output)
@@ -3,11 +3,14 @@ import os
 import pickle
 from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass, field, fields, is_dataclass, replace
+from enum import Enum
 from hashlib import blake2s
+from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Hashable, Optional, Union
 
 import ixmp
+import sdmx.model
 
 from ._dataclasses import asdict
 from .scenarioinfo import ScenarioInfo
@@ -33,6 +36,17 @@ def _local_data_factory():
     )
 
 
+class _Pickler(pickle.Pickler):
+    """Pickler that reduces SDMX artefacts and enumeration members to strings."""
+
+    def reducer_override(self, obj):
+        if isinstance(obj, sdmx.model.IdentifiableArtefact):
+            return str, (str(obj),)
+        elif isinstance(obj, Enum):
+            return str, (repr(obj),)
+        return NotImplemented
+
+
 @dataclass
 class ConfigHelper:
     """Mix-in for :class:`dataclass`-based configuration classes.
@@ -154,9 +168,17 @@ class ConfigHelper:
         #   unsorted) dict.
         # - Pickle this collection.
         # - Hash.
-        h = blake2s(
-            pickle.dumps(asdict(self, dict_factory=lambda kv: tuple(sorted(kv))))
-        )
+        try:
+            data = pickle.dumps(asdict(self, dict_factory=lambda kv: tuple(sorted(kv))))
+        except RecursionError:
+            # Deeply nested values, for instance hierarchies of SDMX codes in a Spec:
+            # pickle the fields directly, with these codes reduced to their IDs
+            buffer = BytesIO()
+            _Pickler(buffer).dump(
+                tuple(sorted((f.name, getattr(self, f.name)) for f in fields(self)))
+            )
+            data = buffer.getvalue()
+        h = blake2s(data)
         # Return the whole digest or a part
         return h.hexdigest()[0 : length if length > 0 else h.digest_size]
 
@@ -165,11 +187,20 @@ class ConfigHelper:
 class Config:
     """Core/top-level settings for :mod:`message_ix_models` and :mod:`message_data`."""
 
+    #: Whether model builders reuse the results of previous builds with identical
+    #: inputs. See :class:`.model.build.BuildCache`.
+    build_cache: bool = False
+
     #: Base path for cached data, e.g. as given by the :program:`--cache-path` CLI
     #: option. Default: the directory :file:`message-ix-models` within the directory
     #: given by :func:`.platformdirs.user_cache_path`.
     cache_path: Optional[Path] = None
 
+    #: Maximum total size, in bytes, of files written by :func:`.cached` in
+    #: :attr:`cache_path`. If set, the least recently used of these files are removed
+    #: after each new one is written; see :meth:`.CacheIndex.prune`. Default: no limit.
+    cache_max_size: Optional[int] = None
+
     #: Paths of files containing debug outputs. See
     #: :meth:`.Context.write_debug_archive`.
     debug_paths: Sequence[Path] = field(default_factory=list)
@@ -452,3 +452,7 @@ class Context:
         Shorthand for :meth:`.Config.write_debug_archive`.
         """
         self.core.write_debug_archive()
+
+
+# Ensure at least one Context instance is created
+Context()
@@ -1,9 +1,12 @@
-"""Load model and project code from :mod:`message_data`."""
+"""Load model and project code from :mod:`message_data`; other import utilities."""
 
 import re
+import sys
+from collections.abc import Callable
 from importlib import util
 from importlib.abc import MetaPathFinder
 from importlib.machinery import ModuleSpec, SourceFileLoader
+from types import ModuleType
 
 
 class MessageDataFinder(MetaPathFinder):
@@ -41,3 +44,61 @@ class MessageDataFinder(MetaPathFinder):
         new_spec.submodule_search_locations = spec.submodule_search_locations
 
         return new_spec
+
+
+class PostImportFinder(MetaPathFinder):
+    """Call functions after certain modules are imported.
+
+    This allows configuration of a module that is otherwise slow to import, without
+    importing it until code elsewhere does so. Use :func:`on_import`.
+    """
+
+    def __init__(self) -> None:
+        #: Mapping from module names to functions.
+        self.hooks: dict[str, list[Callable[[ModuleType], None]]] = {}
+        # Names of modules for which find_spec() is currently running
+        self._active: set[str] = set()
+
+    def find_spec(self, name, path, target=None):
+        if name not in self.hooks or name in self._active:
+            return None
+
+        # Locate the module using the other finders on sys.meta_path
+        self._active.add(name)
+        try:
+            spec = util.find_spec(name)
+        finally:
+            self._active.discard(name)
+
+        if spec is None or spec.loader is None:  # pragma: no cover
+            return spec
+
+        # Wrap the exec_module() method of the (per-module) loader instance
+        exec_module = spec.loader.exec_module
+        hooks = self.hooks.pop(name)
+
+        def _exec_module(module: ModuleType) -> None:
+            exec_module(module)
+            for func in hooks:
+                func(module)
+
+        setattr(spec.loader, "exec_module", _exec_module)
+
+        return spec
+
+
+def on_import(name: str, func: Callable[[ModuleType], None]) -> None:
+    """Call `func` with the module `name` after it is imported.
+
+    If the module is already imported, `func` is called immediately.
+    """
+    if name in sys.modules:
+        func(sys.modules[name])
+        return
+
+    finder = next((f for f in sys.meta_path if isinstance(f, PostImportFinder)), None)
+    if finder is None:
+        finder = PostImportFinder()
+        sys.meta_path.insert(0, finder)
+
+    finder.hooks.setdefault(name, []).append(func)
@@ -1,17 +1,30 @@
 """Tools for modeling workflows."""
 
+import json
 import logging
+import logging.handlers
+import os
+import pickle
 import re
+from collections import defaultdict
 from collections.abc import Callable, Mapping
-from typing import TYPE_CHECKING, Literal, Optional, Union
+from datetime import datetime
+from functools import partial
+from hashlib import blake2b
+from pathlib import Path
+from time import time
+from types import BuiltinFunctionType, FunctionType, MethodType
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 from genno import Computer
+from genno.caching import Encoder
 from message_ix import Scenario
 
 from message_ix_models.util.context import Context
 from message_ix_models.util.ixmp import parse_url
 
 if TYPE_CHECKING:
+    import ixmp
     from click import Command
 
 log = logging.getLogger(__name__)
@@ -58,6 +71,10 @@ class WorkflowStep:
     #: Target model name, scenario name, and optional version.
     scenario_info: dict
 
+    #: Path of a manifest file and information to record in it after the step runs.
+    #: Set by :meth:`.Workflow.run`.
+    manifest: Optional[tuple[Path, dict]] = None
+
     def __init__(
         self, action: Optional[CallbackType], target=None, clone=False, **kwargs
     ):
@@ -100,6 +117,8 @@ class WorkflowStep:
             log.info(f"  with context.dest_scenario={context.dest_scenario}")
 
         if self.clone is not False:
+            from message_ix_models.model.build import clone_for_build
+
             # Clone to target model/scenario name
             log.info("Clone to {model}/{scenario}".format(**self.scenario_info))
             kw = self.scenario_info.copy()
@@ -110,11 +129,17 @@ class WorkflowStep:
                 if isinstance(self.clone, dict)
                 else dict(keep_solution=False)
             )
-            s = s.clone(**kw)
+            s = clone_for_build(s, **kw)
 
-        if not self.action:
-            return s
+        result = self._execute(context, s) if self.action else s
 
+        if self.manifest:
+            _write_manifest(*self.manifest, result)
+
+        return result
+
+    def _execute(self, context: Context, s: Scenario) -> Scenario:
+        """Execute :attr:`action` on `s`."""
         log.info(f"Execute {self.action!r}")
 
         # Modify context to identify the target scenario
@@ -122,6 +147,7 @@ class WorkflowStep:
 
         try:
             # Invoke the callback
+            assert self.action is not None
             result = self.action(context, s, **self.kwargs)
         except Exception:  # pragma: no cover
             s.platform.close_db()  # Avoid locking the scenario
@@ -150,9 +176,14 @@ class Workflow(Computer):
         Context object with settings common to the entire workflow.
     """
 
+    #: Directory for manifest files recorded by :meth:`run`. Default:
+    #: :file:`workflow/` in the :ref:`local data <local-data>` directory.
+    manifest_dir: Path
+
     def __init__(self, context: Context):
         super().__init__()
         self.add_single("context", context)
+        self.manifest_dir = context.get_local_path("workflow")
 
     def add_step(
         self,
@@ -199,15 +230,290 @@ class Workflow(Computer):
         # Add to the Computer; return the name of the added step
         return str(self.add_single(name, step, "context", base, strict=True))
 
-    def run(self, name_or_names: Union[str, list[str]]):
+    def run(
+        self,
+        name_or_names: Union[str, list[str]],
+        *,
+        jobs: Optional[int] = None,
+        manifest: bool = False,
+        resume: bool = False,
+    ):
         """Run all workflow steps necessary to produce `name_or_names`.
 
+        If `manifest` or `resume` is :obj:`True`, a manifest file is written to
+        :attr:`manifest_dir` after each step. This records the :meth:`fingerprint` of
+        the step and the platform, model name, scenario name, and version of the
+        resulting scenario.
+
         Parameters
         ----------
         name_or_names: str or list of str
             Identifier(s) of steps to run.
+        jobs : int, optional
+            If greater than 1, run independent branches of the workflow (see
+            :meth:`branches`) concurrently in up to `jobs` worker processes. Each worker
+            has its own :class:`.Context` and :class:`ixmp.Platform`; the Platform must
+            therefore support concurrent connections (a local HyperSQL database, for
+            instance, does not). The actions of all steps and all values stored on the
+            :class:`.Context` must be picklable; actions can be module-level functions,
+            for instance. The wall-clock time of each step and the branches
+            that ran concurrently are logged at the end.
+        manifest : bool, optional
+            If :obj:`True`, write manifest files.
+        resume : bool, optional
+            If :obj:`True`, do not run any step that has a manifest file with the same
+            fingerprint, if the scenario version recorded there still exists. Instead,
+            that scenario is loaded, as if the workflow was truncated (see
+            :meth:`truncate`) at that step. A step that modifies its base scenario
+            in-place, without cloning, will also be skipped if later steps modified
+            the same scenario. Implies `manifest`.
+        """
+        targets = [name_or_names] if isinstance(name_or_names, str) else name_or_names
+        steps = self._steps(targets)
+        fingerprint: dict[str, dict[str, Any]] = {}
+        if manifest or resume:
+            try:
+                fingerprint = self.fingerprints(steps)
+            except ValueError as e:
+                log.warning(f"{e}; run without manifest files or resume")
+                resume = False
+
+        # Tasks replaced for the duration of this method
+        original: dict[str, Any] = {}
+        try:
+            if resume:
+                original.update(self._resume(steps, fingerprint))
+
+            # Set the manifest file path and contents for steps that will run
+            for name in set(fingerprint) & set(steps) - set(original):
+                info = fingerprint[name]
+                path = self.manifest_dir.joinpath(f"{info['fingerprint']}.json")
+                self.graph[name][0].manifest = (path, dict(step=name, **info))
+
+            if jobs is None or jobs <= 1:
+                return self.get(name_or_names)
+
+            branches = self.branches(targets)
+            result = self._run_branches(branches, jobs)
+            log.info("\n".join(_summarize(branches, result)))
+
+            # Replace each step that was run with one that loads its target scenario,
+            # and compute the targets
+            for name, info in result.items():
+                original.setdefault(name, self.graph[name])
+                self.add_single(name, _load_step(info), "context", None)
+            return self.get(name_or_names)
+        finally:
+            self.graph.update(original)
+            for name in steps:
+                self.graph[name][0].manifest = None
+
+    def fingerprint(self, name: str) -> str:
+        """Return a fingerprint for the step `name`.
+
+        The fingerprint is a digest of:
+
+        - the name and code of the step's action,
+        - the step's keyword arguments, clone option, and target,
+        - for a step that loads the default version of a scenario, the number of that
+          version,
+        - the values of the workflow :class:`.Context`, except those in
+          :attr:`.Context.core` that identify platforms, scenarios, and paths (see
+          :func:`_context_digest`), and
+        - the fingerprint of the base step, if any.
+
+        Thus the fingerprint of a step changes if any of these change for the step or
+        any of its precursors.
+        """
+        return self.fingerprints({name: None})[name]["fingerprint"]
+
+    def fingerprints(self, steps: Mapping[str, Any]) -> dict[str, dict[str, Any]]:
+        """Return fingerprints and their components for `steps` and their bases."""
+        context = self.graph["context"]
+        context_digest = _context_digest(context)
+        platforms: dict[str, "ixmp.Platform"] = {}
+        result: dict[str, dict[str, Any]] = {}
+
+        def _visit(name: str) -> str:
+            if name not in result:
+                step, _, base = self.graph[name]
+                target = [step.platform_info, step.scenario_info]
+                if step.action is None and "version" not in step.scenario_info:
+                    # Load step for the default version: use the version number
+                    target.append(_default_version(context, step, platforms))
+                info = dict(
+                    action=_action_name(step.action),
+                    code=_action_code(step.action),
+                    kwargs=_digest(**step.kwargs),
+                    clone=step.clone,
+                    target=target,
+                    context=context_digest,
+                    base=_visit(base) if base else None,
+                )
+                info.update(fingerprint=_digest(**info))
+                result[name] = info
+            return result[name]["fingerprint"]
+
+        try:
+            for name in steps:
+                _visit(name)
+        finally:
+            # Close any platforms opened by _default_version()
+            for mp in platforms.values():
+                mp.close_db()
+
+        return result
+
+    def _resume(
+        self, steps: Mapping[str, Optional[str]], fingerprint: Mapping[str, dict]
+    ) -> dict[str, Any]:
+        """Replace steps with matching manifest files by steps that load the result.
+
+        Returns the replaced tasks.
         """
-        return self.get(name_or_names)
+        context = self.graph["context"]
+        platforms: dict[str, "ixmp.Platform"] = {}
+        result = {}
+        seen = set()
+        # Start from steps that are not the base of any other needed step
+        to_visit = sorted(set(steps) - set(steps.values()), reverse=True)
+        try:
+            while to_visit:
+                name = to_visit.pop()
+                if name in seen:
+                    continue
+                seen.add(name)
+
+                path = self.manifest_dir.joinpath(
+                    f"{fingerprint[name]['fingerprint']}.json"
+                )
+                info = json.loads(path.read_text()) if path.exists() else None
+                if info and _scenario_exists(context, info, platforms):
+                    log.info(f"Resume: skip step {name!r}; load {info['url']}")
+                    result[name] = self.graph[name]
+                    self.add_single(name, _load_step(info), "context", None)
+                elif base := steps[name]:
+                    to_visit.append(base)
+        finally:
+            # Close any platforms opened by _scenario_exists()
+            for mp in platforms.values():
+                mp.close_db()
+
+        return result
+
+    def _steps(self, targets: list[str]) -> dict[str, Optional[str]]:
+        """Return the steps needed to produce `targets`, and the base of each."""
+        from dask.core import get_dependencies
+
+        result: dict[str, Optional[str]] = {}
+        to_visit = list(targets)
+        while to_visit:
+            key = to_visit.pop()
+            if key in result or key not in self.graph:
+                continue
+            task = self.graph[key]
+            if isinstance(task, tuple) and isinstance(task[0], WorkflowStep):
+                result[key] = task[2]
+                to_visit.extend([task[2]] if task[2] else [])
+            else:
+                to_visit.extend(map(str, get_dependencies(self.graph, key)))
+
+        return result
+
+    def branches(self, targets: list[str]) -> list[tuple[Optional[int], list[str]]]:
+        """Partition the steps needed to produce `targets` into branches.
+
+        A branch is a chain of steps, each of which is the base of only the next. A
+        branch ends at a step that is the base of 2 or more needed steps; each of these
+        begins a new branch. Branches that do not depend on one another can be run
+        concurrently.
+
+        Returns
+        -------
+        list of tuple
+            Each element is (index of the parent branch or :obj:`None`, list of step
+            names). Parents always precede their children.
+        """
+        children = defaultdict(list)
+        for name, b in sorted(self._steps(targets).items()):
+            children[b].append(name)
+
+        result: list[tuple[Optional[int], list[str]]] = []
+        to_visit: list[tuple[Optional[int], str]] = [
+            (None, name) for name in reversed(children[None])
+        ]
+        while to_visit:
+            parent, name = to_visit.pop()
+            chain = [name]
+            while len(children[chain[-1]]) == 1:
+                chain.append(children[chain[-1]][0])
+            result.append((parent, chain))
+            to_visit.extend((len(result) - 1, c) for c in reversed(children[chain[-1]]))
+
+        return result
+
+    def _run_branches(
+        self, branches: list[tuple[Optional[int], list[str]]], jobs: int
+    ) -> dict[str, dict[str, Any]]:
+        """Run `branches` in a pool of up to `jobs` worker processes.
+
+        Each branch is submitted as soon as its parent branch has completed. Returns a
+        mapping from step name to information returned by :func:`_run_branch`.
+        """
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+        from multiprocessing import get_context
+
+        # Close any database connection held by this process, and prepare a copy of the
+        # context values with no Platform; workers open their own
+        context = self.graph["context"]
+        context.close_db()
+        state = context._values
+        for key, value in state.items():
+            try:
+                pickle.dumps(value)
+            except Exception as e:
+                raise ValueError(
+                    f"Context.{key} cannot be sent to worker processes: {e!r}"
+                ) from None
+
+        mp_context = get_context("spawn")
+        queue = mp_context.Queue()
+        listener = logging.handlers.QueueListener(queue, _Relay())
+        listener.start()
+
+        result: dict[str, dict[str, Any]] = {}
+        pool = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(queue, logging.getLogger().getEffectiveLevel()),
+        )
+        futures = {}
+
+        def submit(i: int) -> None:
+            parent, chain = branches[i]
+            base = None if parent is None else result[branches[parent][1][-1]]
+            steps = [(name, self.graph[name][0]) for name in chain]
+            futures[pool.submit(_run_branch, state, steps, base)] = i
+            log.info(f"Submit branch {i}: {' → '.join(chain)}")
+
+        try:
+            for i, (parent, _) in enumerate(branches):
+                if parent is None:
+                    submit(i)
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for f in done:
+                    i = futures.pop(f)
+                    result.update((r["step"], r) for r in f.result())
+                    for j, (parent, _) in enumerate(branches):
+                        if parent == i:
+                            submit(j)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            listener.stop()
+
+        return result
 
     def truncate(self, name: str):
         """Truncate the workflow at the step `name`.
@@ -261,6 +567,260 @@ class Workflow(Computer):
         return (i.copy(), step_name) if len(i) else self.guess_target(task[2], kind)
 
 
+def _action_code(action: Optional[CallbackType]) -> Optional[str]:
+    """Return a digest of the code of `action`, if any."""
+    from genno.caching import hash_code
+
+    if action is None:
+        return None
+    elif isinstance(action, partial):
+        return _digest(_action_code(action.func), *action.args, **action.keywords)
+    try:
+        return hash_code(action)
+    except StopIteration:  # A callable without __code__
+        return None
+
+
+def _action_name(action: Optional[CallbackType]) -> str:
+    """Return the fully-qualified name of `action`, or "load"."""
+    if action is None:
+        return "load"
+    elif isinstance(action, partial):
+        return f"partial({_action_name(action.func)})"
+    return f"{action.__module__}.{getattr(action, '__qualname__', repr(action))}"
+
+
+def _context_digest(context: Context) -> str:
+    """Return a digest of the values of `context` that may affect workflow steps.
+
+    Values that are :class:`.ConfigHelper` instances are represented by their
+    :meth:`~.ConfigHelper.hexdigest`.
+
+    Raises
+    ------
+    ValueError
+        if any other value cannot be encoded.
+    """
+    from message_ix_models.util.config import ConfigHelper
+
+    values: dict[str, Any] = dict(core=_digest(dry_run=context.core.dry_run))
+    for key, value in context._values.items():
+        if key == "core":
+            continue
+        try:
+            values[key] = (
+                value.hexdigest() if isinstance(value, ConfigHelper) else _digest(value)
+            )
+        except (TypeError, ValueError, RecursionError) as e:
+            raise ValueError(f"Cannot fingerprint Context.{key}: {e!r}") from e
+    return _digest(**values)
+
+
+def _default_version(
+    context: Context, step: WorkflowStep, platforms: dict[str, "ixmp.Platform"]
+) -> Optional[int]:
+    """Return the current default version of the scenario loaded by `step`.
+
+    Returns :obj:`None` if the platform or scenario does not exist.
+    """
+    try:
+        mp = _get_platform(context, step.platform_info.get("name"), platforms)
+    except ValueError:  # Unknown platform name
+        return None
+
+    info = dict(context.scenario_info, **step.scenario_info)
+    versions = mp.scenario_list(
+        default=True, model=info.get("model"), scen=info.get("scenario")
+    )["version"]
+    return int(versions.iloc[0]) if len(versions) else None
+
+
+def _digest(*args, **kwargs) -> str:
+    """Like :func:`genno.caching.hash_args`, but stable across Python processes.
+
+    Functions are encoded by their fully-qualified names, instead of :func:`repr`,
+    which contains their memory address.
+    """
+    import message_ix_models.util.cache  # noqa: F401  Register Encoder functions
+
+    return blake2b(
+        json.dumps((args, kwargs), cls=_Encoder, sort_keys=True).encode(),
+        digest_size=20,
+    ).hexdigest()
+
+
+def _get_platform(
+    context: Context, name: Optional[str], platforms: dict[str, "ixmp.Platform"]
+) -> "ixmp.Platform":
+    """Return the platform `name`.
+
+    The platform of `context` is used if it has the same name, or if `name` is
+    :obj:`None`. Otherwise, a new platform is opened and stored in `platforms`.
+    """
+    import ixmp
+
+    if name is None or (context.core._mp and context.platform_info.get("name") == name):
+        return context.get_platform()
+    elif name not in platforms:
+        platforms[name] = ixmp.Platform(name=name)
+    return platforms[name]
+
+
+def _load_step(info: Mapping[str, Any]) -> WorkflowStep:
+    """Return a step that loads the scenario identified by `info`.
+
+    `info` contains the platform name, model and scenario name, and version, as
+    returned by :func:`_run_branch` or stored in a manifest file.
+    """
+    step = WorkflowStep(None)
+    step.platform_info.update(name=info["platform"])
+    step.scenario_info.update(
+        model=info["model"], scenario=info["scenario"], version=info["version"]
+    )
+    return step
+
+
+def _scenario_exists(
+    context: Context, info: Mapping[str, Any], platforms: dict[str, "ixmp.Platform"]
+) -> bool:
+    """Return :obj:`True` if the scenario version identified by `info` exists.
+
+    The platform is retrieved using :func:`_get_platform`.
+    """
+    mp = _get_platform(context, info["platform"], platforms)
+    versions = mp.scenario_list(
+        default=False, model=info["model"], scen=info["scenario"]
+    )["version"]
+    return info["version"] in set(versions)
+
+
+def _write_manifest(path: Path, info: dict, scenario: Scenario) -> None:
+    """Write `info` and the identity of `scenario` to a manifest file at `path`."""
+    assert scenario.version is not None, "Scenario has no version"
+    data = dict(
+        info,
+        url=f"ixmp://{scenario.platform.name}/{scenario.url}",
+        platform=scenario.platform.name,
+        model=scenario.model,
+        scenario=scenario.scenario,
+        version=int(scenario.version),
+        time=datetime.now().isoformat(timespec="seconds"),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    tmp.replace(path)
+
+
+class _Encoder(Encoder):
+    """Encoder for :func:`_digest`."""
+
+    def default(self, o):
+        if isinstance(o, (BuiltinFunctionType, FunctionType, MethodType)):
+            return f"{o.__module__}.{o.__qualname__}"
+        elif isinstance(o, (set, frozenset)):
+            return sorted(json.dumps(v, cls=type(self), sort_keys=True) for v in o)
+        return super().default(o)
+
+
+class _Relay(logging.Handler):
+    """Pass log records received from worker processes to loggers in this process."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_worker(queue, level: int) -> None:
+    """Initialize a worker process for :meth:`Workflow.run` with `jobs` > 1.
+
+    Log records are sent through `queue` to the parent process.
+    """
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(queue))
+    root.setLevel(level)
+
+
+def _run_branch(
+    state: dict,
+    steps: list[tuple[str, WorkflowStep]],
+    base: Optional[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Run a chain of workflow `steps` in a worker process.
+
+    Parameters
+    ----------
+    state :
+        Values for a new :class:`.Context`.
+    steps :
+        Sequence of (name, step).
+    base :
+        Information about the scenario produced by the step preceding `steps`, as
+        returned by a previous call; or :obj:`None` if the first of `steps` is a load
+        step.
+
+    Returns
+    -------
+    list of dict
+        For each step: its name, the start and end time, the process ID, and the
+        platform name, model name, scenario name and version of the resulting scenario.
+    """
+    context = Context()
+    context._values.update(state)
+
+    scenario = _load_step(base)(context) if base else None
+
+    result = []
+    try:
+        for name, step in steps:
+            start = time()
+            scenario = step(context, scenario)
+            assert scenario is not None and scenario.version is not None
+            result.append(
+                dict(
+                    step=name,
+                    start=start,
+                    end=time(),
+                    pid=os.getpid(),
+                    platform=scenario.platform.name,
+                    model=scenario.model,
+                    scenario=scenario.scenario,
+                    version=int(scenario.version),
+                )
+            )
+    finally:
+        if scenario is not None:
+            scenario.platform.close_db()
+        context.close_db()
+
+    return result
+
+
+def _summarize(
+    branches: list[tuple[Optional[int], list[str]]], info: Mapping[str, Mapping]
+) -> list[str]:
+    """Describe the timing of steps in `branches` and which branches overlapped."""
+    t0 = min((i["start"] for i in info.values()), default=0.0)
+    span = {}
+    lines = ["Workflow step timing:"]
+    for b, (_, chain) in enumerate(branches):
+        span[b] = (info[chain[0]]["start"], info[chain[-1]]["end"])
+        lines.append(f"Branch {b}, process {info[chain[0]]['pid']}:")
+        lines.extend(
+            f"  {name}: {info[name]['start'] - t0:.1f}–{info[name]['end'] - t0:.1f} s"
+            f" ({info[name]['end'] - info[name]['start']:.1f} s)"
+            for name in chain
+        )
+
+    lines.append("Concurrent branches:")
+    for b, (start, end) in span.items():
+        other = [o for o, (s, e) in span.items() if o != b and s < end and start < e]
+        lines.append(f"  {b}: {', '.join(map(str, other)) or 'none'}")
+
+    return lines
+
+
 def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Command":
     """Generate a click CLI command to run a :class:`.Workflow`.
 
@@ -276,6 +836,11 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
         displayed.
       - :program:`--from`: Truncate the workflow at any step(s) whose names are a full
         match for this regular expression.
+      - :program:`--jobs`: Run independent branches of the workflow in this many
+        processes. See :meth:`.Workflow.run`.
+      - :program:`--resume`: Record the result of each step. Skip steps whose results
+        were recorded by a previous run with :program:`--resume` and the same
+        fingerprint. See :meth:`.Workflow.run`.
 
     - uses the :attr:`~.Computer.default_key` (if any) of the :class:`.Workflow`
       returned by `wf_callback`, if the user does not provide :program:`TARGET` on the
@@ -308,9 +873,17 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
     @click.option(
         "--from", "truncate_step", help="Truncate workflow at matching step(s)."
     )
+    @click.option(
+        "--jobs", type=int, default=1, help="Run independent branches in N processes."
+    )
+    @click.option(
+        "--resume",
+        is_flag=True,
+        help="Record steps; skip those completed by a previous run with --resume.",
+    )
     @click.argument("target_step", metavar="TARGET", required=False)
     @click.pass_obj
-    def _func(context, go, truncate_step, target_step, **kwargs):
+    def _func(context, go, truncate_step, jobs, resume, target_step, **kwargs):
         from importlib import import_module
 
         from message_ix_models.util import show_versions
@@ -369,7 +942,7 @@ def make_click_command(wf_callback: str, name: str, slug: str, **kwargs) -> "Com
             log.info(f"Workflow diagram written to {path}")
             return
 
-        wf.run(target_step)
+        wf.run(target_step, jobs=jobs, resume=resume)
 
     return _func
 